@@ -1,13 +1,40 @@
 import os
+import copy
 import json
+import argparse
+import calendar
 import base64
 import re
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, date
 import logging
 import shutil
 from collections import defaultdict
 import fnmatch
+import functools
+import struct
+import time
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from report_assets import AssetBuilder
+from report_images import ChartImageStore, SharedImages, PanelChecker
+from report_stream import image_marker, base64_length, write_report_html
+from report_catalog import ReportCatalog
+from report_compress import CompressionPool, COMPRESS_SUFFIXES, create_archive
+from report_watch import FolderWatcher, is_relative_to
+from report_stats import load_server_stats, merge_server_details
+from report_history import MetricsHistory, TREND_METRICS, month_key, shift_month
+from report_metrics import RunMetrics
+from enhanced_config_validator import load_validated_config, check_images_tree
+
+# 01_download_images.ps1의 패널 렌더링 크기 (width=1200, height=800)
+DEFAULT_CHART_SIZE = (1200, 800)
+# report_series.py가 저장하는 패널 시계열 파일 (데이터 기반 차트 모드)
+SERIES_SUFFIX = ".series.json"
+# 빈 패널 판정 결과 표시 이름
+BLANK_PANEL_LABELS = {'blank': '빈 이미지', 'no_data': 'No data'}
 
 def setup_logging():
     """로깅 설정"""
@@ -35,9 +62,11 @@ def load_unified_config():
         return None
 
 # 기존 개별 로드 함수들을 통합 설정 기반으로 변경
-def load_config():
+# (unified: 이미 로드/검증된 통합 설정 객체, 없으면 파일에서 읽음)
+def load_config(unified=None):
     """리포트 기본 설정 로드"""
-    unified = load_unified_config()
+    if unified is None:
+        unified = load_unified_config()
     if not unified:
         return None
     
@@ -50,9 +79,10 @@ def load_config():
         'last_download': unified.get('last_download', {})
     }
 
-def load_dashboard_config():
+def load_dashboard_config(unified=None):
     """대시보드 설정 로드"""
-    unified = load_unified_config()
+    if unified is None:
+        unified = load_unified_config()
     if not unified:
         return None
     
@@ -62,22 +92,53 @@ def load_dashboard_config():
         'chart_descriptions': unified.get('chart_descriptions', {})
     }
 
-def load_server_info():
+def load_server_info(unified=None):
     """서버 정보 설정 로드"""
-    unified = load_unified_config()
+    if unified is None:
+        unified = load_unified_config()
     if not unified:
         return None
     
     return {'servers': unified.get('servers', {})}
 
-def load_system_groups():
+def load_system_groups(unified=None):
     """시스템 그룹 설정 로드"""
-    unified = load_unified_config()
+    if unified is None:
+        unified = load_unified_config()
     if not unified:
         return None
     
     return {'groups': unified.get('groups', {})}
 
+def load_output_settings(unified=None):
+    """출력 옵션 설정 로드 (선택 섹션, 없으면 기본값)"""
+    if unified is None:
+        unified = load_unified_config()
+    settings = {
+        'minify_assets': True,
+        'css_mode': 'inline',
+        'image_mode': 'inline',
+        'thumbnail_width': 480,
+        'thumbnail_quality': 60,
+        'layout': 'single',
+        'servers_per_page': 1,
+        'page_workers': 4,
+        'compress': [],
+        'compress_workers': 2,
+        'archive': '',
+        'chart_mode': 'image',
+        'svg_width': 800,
+        'svg_height': 400,
+        'history_months': 6,
+        'blank_panels': 'keep',
+        'retention_versions': 0,
+        'retention_max_mb': 0,
+        'metrics_dir': 'metrics'
+    }
+    if unified:
+        settings.update(unified.get('output_settings', {}))
+    return settings
+
 def find_latest_images_folder():
     """최신 이미지 폴더 찾기"""
     images_dir = Path("images")
@@ -85,7 +146,7 @@ def find_latest_images_folder():
         logging.error("images 폴더를 찾을 수 없습니다. runall.bat을 먼저 실행하세요.")
         return None
     
-    timestamp_folders = [d for d in images_dir.iterdir() if d.is_dir()]
+    timestamp_folders = [d for d in images_dir.iterdir() if d.is_dir() and not d.name.startswith('.')]
     if not timestamp_folders:
         logging.error("이미지 폴더에서 다운로드된 데이터를 찾을 수 없습니다.")
         logging.error("runall.bat을 실행하여 그라파나에서 이미지를 먼저 다운로드하세요.")
@@ -102,6 +163,42 @@ def find_latest_images_folder():
     logging.info(f"실제 그라파나 이미지 폴더 사용: {latest_folder}")
     return latest_folder
 
+def month_report_settings(month, today=None):
+    """'2025-05' → 해당 월의 report_settings 값 (update_month.ps1과 같은 규칙, 이번 달이면 오늘까지)"""
+    year, number = map(int, month.split('-'))
+    today = today or date.today()
+    start = date(year, number, 1)
+    if (today.year, today.month) == (year, number):
+        end = today
+    else:
+        end = date(year, number, calendar.monthrange(year, number)[1])
+    return {
+        'report_month': f"{year}. {number:02d}",
+        'period': f"{start:%Y-%m-%d} ~ {end:%Y-%m-%d}",
+        'grafana_time_from': f"{start:%Y-%m-%d}",
+        'grafana_time_to': f"{end:%Y-%m-%d}",
+        'default_year': year,
+        'default_month': number
+    }
+
+def month_config(unified_config, month):
+    """통합 설정 사본의 report_settings를 지정한 월로 바꾼 설정 (원본은 그대로)"""
+    config = copy.deepcopy(unified_config)
+    config.setdefault('report_settings', {}).update(month_report_settings(month))
+    return config
+
+def find_month_images_folder(month):
+    """월에 해당하는 이미지 폴더 찾기 - 폴더 이름(다운로드 시각 YYYYMMDD_HHMMSS)이 그 달이나
+    다음 달(월말 이후 다운로드)인 폴더 중 최신 폴더"""
+    images_dir = Path("images")
+    if not images_dir.is_dir():
+        return None
+    months = {month.replace('-', ''), shift_month(month, 1).replace('-', '')}
+    candidates = [d for d in images_dir.iterdir()
+                  if d.is_dir() and not d.name.startswith('.') and re.match(r'\d{8}_\d{6}$', d.name)
+                  and d.name[:6] in months]
+    return max(candidates, key=lambda d: d.name) if candidates else None
+
 # 나머지 함수들은 기존과 동일...
 def clean_chart_name(filename):
     """차트 이름에서 숫자 ID 제거 및 정리"""
@@ -148,8 +245,45 @@ def get_chart_description(filename, dashboard_config):
     
     return "시스템 성능 모니터링 지표"
 
-def collect_dashboard_data(images_folder, dashboard_config):
-    """대시보드별 데이터 수집"""
+def build_generation_plan(system_groups, dashboard_config, groups=None, servers=None, dashboards=None):
+    """생성할 그룹과 그룹별 서버 목록 결정 → {그룹명: 그룹 정보}
+    
+    groups/servers/dashboards: 이름 또는 와일드카드 패턴 목록 (없으면 전체)
+    servers/dashboards가 주어지면 각 그룹 리포트에 해당 서버 섹션만 포함
+    """
+    def matches(name, patterns):
+        return any(fnmatch.fnmatchcase(name, pattern) for pattern in patterns)
+    
+    mapped_servers = (dashboard_config or {}).get('dashboards', {})
+    plan = {}
+    for group_name, group_info in system_groups.get('groups', {}).items():
+        if groups and not matches(group_name, groups):
+            continue
+        if not group_info.get('active', True):
+            logging.info(f"그룹 '{group_name}'은 비활성화되어 건너뜁니다.")
+            continue
+        
+        if servers or dashboards:
+            selected = [
+                name for name in group_info.get('servers', [])
+                if (not dashboards or matches(name, dashboards))
+                and (not servers or matches(name, servers)
+                     or any(matches(member, servers) for member in mapped_servers.get(name, {}).get('servers', [])))
+            ]
+            if not selected:
+                continue
+            group_info = dict(group_info, servers=selected)
+        
+        plan[group_name] = group_info
+    
+    return plan
+
+def collect_dashboard_data(images_folder, dashboard_config, dashboard_names=None, panel_checker=None):
+    """대시보드별 데이터 수집
+    
+    dashboard_names: 주어지면 해당 대시보드 폴더만 처리
+    panel_checker: 주어지면 빈 패널/No data 패널을 판정하여 chart_info['blank']에 기록
+    """
     dashboards_data = {}
     
     production_folder = images_folder / "Production-Server"
@@ -157,7 +291,12 @@ def collect_dashboard_data(images_folder, dashboard_config):
         logging.error("Production-Server 폴더를 찾을 수 없습니다.")
         return dashboards_data
     
-    for dashboard_folder in production_folder.iterdir():
+    if dashboard_names is None:
+        dashboard_folders = production_folder.iterdir()
+    else:
+        dashboard_folders = [production_folder / name for name in sorted(dashboard_names)]
+    
+    for dashboard_folder in dashboard_folders:
         if not dashboard_folder.is_dir():
             continue
         
@@ -168,21 +307,27 @@ def collect_dashboard_data(images_folder, dashboard_config):
         if dashboard_config and dashboard_name in dashboard_config.get('dashboards', {}):
             dashboard_info = dashboard_config['dashboards'][dashboard_name]
         
-        chart_files = list(dashboard_folder.glob("*.png"))
+        # 같은 패널의 PNG와 시계열 파일(.series.json)은 하나의 차트로 묶음
+        chart_files = {chart_file.stem: chart_file for chart_file in dashboard_folder.glob("*.png")}
+        series_files = {chart_file.name[:-len(SERIES_SUFFIX)]: chart_file
+                        for chart_file in dashboard_folder.glob(f"*{SERIES_SUFFIX}")}
+        chart_stems = sorted(set(chart_files) | set(series_files))
         categorized_charts = defaultdict(list)
         
-        for chart_file in chart_files:
-            category, chart_name = categorize_chart(chart_file.name, dashboard_config)
+        for stem in chart_stems:
+            filename = f"{stem}.png"
+            category, chart_name = categorize_chart(filename, dashboard_config)
             
             if category is None:
                 continue
             
-            chart_description = get_chart_description(chart_file.name, dashboard_config)
+            chart_description = get_chart_description(filename, dashboard_config)
             
             chart_info = {
-                'file_path': chart_file,
+                'file_path': chart_files.get(stem),
+                'series_path': series_files.get(stem),
                 'name': chart_name,
-                'filename': chart_file.name,
+                'filename': filename,
                 'description': chart_description
             }
             
@@ -191,10 +336,19 @@ def collect_dashboard_data(images_folder, dashboard_config):
         for category in categorized_charts:
             categorized_charts[category].sort(key=lambda x: x['name'])
         
+        if panel_checker:
+            charts = [chart for charts in categorized_charts.values() for chart in charts if chart['file_path']]
+            verdicts = panel_checker.classify_many(chart['file_path'] for chart in charts)
+            for chart in charts:
+                chart['blank'] = verdicts[chart['file_path']]
+            blank_count = sum(1 for chart in charts if chart['blank'])
+            if blank_count:
+                logging.info(f"  빈 패널 {blank_count}개: {dashboard_name}")
+        
         dashboards_data[dashboard_name] = {
             'info': dashboard_info,
             'charts': dict(categorized_charts),
-            'total_charts': len([f for f in chart_files if not any(x in f.name.lower() for x in ['total', 'system'])]),
+            'total_charts': len([stem for stem in chart_stems if not any(x in stem.lower() for x in ['total', 'system'])]),
             'folder_path': dashboard_folder
         }
     
@@ -203,9 +357,10 @@ def collect_dashboard_data(images_folder, dashboard_config):
 class TemplateEngine:
     """HTML 템플릿 엔진"""
     
-    def __init__(self, templates_dir="templates"):
+    def __init__(self, templates_dir="templates", minify=True):
         self.templates_dir = Path(templates_dir)
         self.templates = {}
+        self.asset_builder = AssetBuilder(self.templates_dir, minify=minify)
         self.load_templates()
     
     def load_templates(self):
@@ -214,7 +369,14 @@ class TemplateEngine:
             'base.html',
             'server_section.html', 
             'chart_category.html',
-            'chart_card.html'
+            'chart_card.html',
+            'chart_card_thumb.html',
+            'chart_card_svg.html',
+            'chart_card_shared.html',
+            'blank_panels.html',
+            'server_trend.html',
+            'report_index.html',
+            'index_row.html'
         ]
         
         for template_file in template_files:
@@ -222,7 +384,7 @@ class TemplateEngine:
             if template_path.exists():
                 with open(template_path, 'r', encoding='utf-8') as f:
                     template_name = template_file.replace('.html', '')
-                    self.templates[template_name] = f.read()
+                    self.templates[template_name] = self.asset_builder.compile_template(template_name, f.read())
                     logging.info(f"템플릿 로드: {template_file}")
             else:
                 logging.warning(f"템플릿 파일 없음: {template_file}")
@@ -232,12 +394,8 @@ class TemplateEngine:
         return self.templates.get(template_name, "")
     
     def load_css(self):
-        """CSS 파일 로드"""
-        css_path = self.templates_dir / "assets" / "style.css"
-        if css_path.exists():
-            with open(css_path, 'r', encoding='utf-8') as f:
-                return f.read()
-        return ""
+        """CSS 로드 (빌드 단계에서 압축/캐시된 결과)"""
+        return self.asset_builder.build_css()
     
     def render(self, template_name, data):
         """템플릿 렌더링"""
@@ -256,12 +414,24 @@ class TemplateEngine:
 class ReportBuilder:
     """리포트 빌더 클래스"""
     
-    def __init__(self):
-        self.template_engine = TemplateEngine()
-        self.config = load_config()
-        self.server_info = load_server_info()
-        self.dashboard_config = load_dashboard_config()
-        self.system_groups = load_system_groups()
+    def __init__(self, unified_config=None):
+        self.reload_config(unified_config)
+        self.template_engine = TemplateEngine(minify=self.output_settings.get('minify_assets', True))
+        
+        # 공유 스타일 모드에서 리포트가 참조할 CSS 경로 (output 폴더 기준)
+        self.stylesheet_href = None
+        self.output_dir = None
+        # 리포트가 참조하는 output 폴더 내 파일 (아카이브 대상)
+        self.asset_files = set()
+        self.image_store = ChartImageStore(
+            thumbnail_width=self.output_settings.get('thumbnail_width', 480),
+            thumbnail_quality=self.output_settings.get('thumbnail_quality', 60)
+        )
+        self.panel_checker = PanelChecker(image_hash=self.image_store.image_hash)
+        # 문서 안 중복 이미지 제거 결과 (분할 리포트는 페이지를 병렬 생성하므로 잠금)
+        self.dedup_lock = threading.Lock()
+        self.dedup_images = 0
+        self.dedup_saved_bytes = 0
         
         # 카테고리 설명 매핑
         self.category_descriptions = {
@@ -273,33 +443,227 @@ class ReportBuilder:
             '기타': '기타 모니터링 지표'
         }
     
-    def image_to_base64(self, image_path):
-        """이미지를 base64로 변환"""
+    def reload_config(self, unified_config=None):
+        """통합 설정 (다시) 로드 - 검증된 설정 객체가 주어지면 파일을 다시 읽지 않음"""
+        if unified_config is None:
+            unified_config = load_unified_config()
+        self.output_settings = load_output_settings(unified_config)
+        self.config = load_config(unified_config)
+        self.server_info = load_server_info(unified_config)
+        self.dashboard_config = load_dashboard_config(unified_config)
+        self.system_groups = load_system_groups(unified_config)
+        # grafana_report.py stats로 계산한 이번 달 서버 통계 (설정 값이 우선)
+        report_month = self.config['report_month'] if self.config else ''
+        self.server_stats = load_server_stats(report_month)
+        # 월별 추이 표용 지표 이력 (최근 history_months개월, 조회 한 번)
+        history_months = self.output_settings.get('history_months', 6)
+        self.server_history = MetricsHistory().load(report_month, history_months) if report_month else {}
+    
+    def reload_templates(self):
+        """템플릿/CSS 다시 로드 (watch 모드에서 템플릿 변경 시)"""
+        self.template_engine = TemplateEngine(minify=self.output_settings.get('minify_assets', True))
+        self.stylesheet_href = None
+        if self.output_dir:
+            self.prepare_shared_stylesheet(self.output_dir)
+    
+    def group_fingerprint(self, group_name, group_info):
+        """그룹 리포트 결과에 영향을 주는 설정 값의 지문 (변경 감지용)"""
+        dashboards = (self.dashboard_config or {}).get('dashboards', {})
+        dependencies = {
+            'group': group_info,
+            'servers': {
+                server_name: [self.get_server_details(server_name), dashboards.get(server_name)]
+                for server_name in group_info.get('servers', [])
+            },
+            'report': [self.config.get('report_month'), self.config.get('period')] if self.config else None,
+            'charts': [(self.dashboard_config or {}).get('chart_categories'),
+                       (self.dashboard_config or {}).get('chart_descriptions')],
+            'output': self.output_settings
+        }
+        return json.dumps(dependencies, sort_keys=True, ensure_ascii=False, default=str)
+    
+    def prepare_output(self, output_dir):
+        """리포트 출력 폴더 지정 (공유 스타일/원본 이미지 side file 기준 경로)"""
+        self.output_dir = Path(output_dir)
+        return self.prepare_shared_stylesheet(self.output_dir)
+    
+    def prepare_shared_stylesheet(self, output_dir):
+        """공유 스타일 모드이면 스타일 파일을 한 번만 생성"""
+        if self.output_settings.get('css_mode') != 'shared':
+            return None
+        
+        css_path = self.template_engine.asset_builder.write_shared_css(output_dir)
+        self.stylesheet_href = css_path.relative_to(output_dir).as_posix()
+        self.asset_files.add(css_path)
+        return css_path
+    
+    def build_stylesheet(self):
+        """base 템플릿에 삽입할 스타일 태그 생성"""
+        if self.stylesheet_href:
+            return f'<link rel="stylesheet" href="{self.stylesheet_href}">'
+        return f'<style>{self.template_engine.load_css()}</style>'
+    
+    def read_image_size(self, image_path):
+        """PNG 헤더(IHDR)에서 이미지 크기 읽기 (실패 시 다운로드 기본 크기)"""
         try:
             with open(image_path, "rb") as img_file:
-                return base64.b64encode(img_file.read()).decode()
+                header = img_file.read(24)
+            if header[:8] == b'\x89PNG\r\n\x1a\n' and header[12:16] == b'IHDR':
+                return struct.unpack('>II', header[16:24])
         except Exception as e:
-            logging.warning(f"이미지 변환 실패 {image_path}: {e}")
-            return ""
+            logging.warning(f"이미지 크기 확인 실패 {image_path}: {e}")
+        return DEFAULT_CHART_SIZE
+    
+    def build_thumbnail_chart_card(self, chart_info):
+        """썸네일 차트 카드 HTML 생성 (원본은 클릭 시 side file에서 로드)"""
+        if not self.output_dir:
+            return None
+        
+        try:
+            thumbnail = self.image_store.make_thumbnail(chart_info['file_path'])
+            if not thumbnail:
+                return None
+            thumb_bytes, (width, height) = thumbnail
+            full_url = self.image_store.publish_full_image(chart_info['file_path'], self.output_dir)
+            self.asset_files.add(self.output_dir / full_url)
+        except Exception as e:
+            logging.warning(f"썸네일 생성 실패, 원본 이미지 사용 {chart_info['file_path']}: {e}")
+            return None
+        
+        return self.template_engine.render('chart_card_thumb', {
+            'CHART_TITLE': chart_info['name'],
+            'CHART_DESC': chart_info['description'],
+            'CHART_IMAGE': base64.b64encode(thumb_bytes).decode(),
+            'CHART_WIDTH': width,
+            'CHART_HEIGHT': height,
+            'CHART_FULL_URL': full_url
+        })
+    
+    def build_svg_chart_card(self, chart_info):
+        """시계열 파일로 인라인 SVG 차트 카드 생성 (실패 시 None)"""
+        try:
+            from report_series import load_chart_series, render_svg
+            chart = load_chart_series(chart_info['series_path'])
+            svg = render_svg(chart,
+                             width=self.output_settings.get('svg_width', 800),
+                             height=self.output_settings.get('svg_height', 400))
+        except ImportError:
+            logging.warning("NumPy가 설치되지 않아 SVG 차트를 만들 수 없습니다 (pip install -r requirements.txt)")
+            return None
+        except Exception as e:
+            logging.warning(f"SVG 차트 생성 실패 {chart_info['series_path']}: {e}")
+            return None
+        
+        return self.template_engine.render('chart_card_svg', {
+            'CHART_TITLE': chart_info['name'],
+            'CHART_DESC': chart_info['description'],
+            'CHART_SVG': svg
+        })
+    
+    def blank_panel_checker(self):
+        """blank_panels가 keep이 아니면 수집 단계에서 사용할 빈 패널 판정기 (아니면 None)"""
+        if self.output_settings.get('blank_panels', 'keep') == 'keep':
+            return None
+        try:
+            import numpy  # noqa: F401
+            import PIL  # noqa: F401
+        except ImportError:
+            logging.warning("Pillow/NumPy가 설치되지 않아 빈 패널을 판정할 수 없습니다 (pip install -r requirements.txt)")
+            return None
+        return self.panel_checker
+    
+    def split_blank_charts(self, charts):
+        """차트 목록 → (표시할 차트, 빈 패널 차트) (blank_panels가 keep이면 모두 표시)"""
+        if self.output_settings.get('blank_panels', 'keep') == 'keep':
+            return charts, []
+        return ([chart for chart in charts if not chart.get('blank')],
+                [chart for chart in charts if chart.get('blank')])
     
-    def build_chart_card(self, chart_info):
-        """차트 카드 HTML 생성"""
-        img_base64 = self.image_to_base64(chart_info['file_path'])
+    def inline_image_path(self, chart_info):
+        """원본 PNG를 base64로 포함할 차트이면 이미지 경로 (SVG/썸네일 차트는 None)"""
+        if chart_info.get('series_path') and (
+                self.output_settings.get('chart_mode') == 'svg' or not chart_info.get('file_path')):
+            return None
+        if self.output_settings.get('image_mode') == 'thumbnail':
+            return None
+        return chart_info.get('file_path')
+    
+    def collect_shared_images(self, server_names, dashboards_data):
+        """문서에 포함될 원본 PNG의 내용 해시를 모아 중복 이미지 목록 생성"""
+        hashes = []
+        for server_name in server_names:
+            for charts in dashboards_data[server_name]['charts'].values():
+                for chart_info in self.split_blank_charts(charts)[0]:
+                    image_path = self.inline_image_path(chart_info)
+                    if not image_path:
+                        continue
+                    try:
+                        chart_info['image_hash'] = self.image_store.image_hash(image_path)
+                        hashes.append(chart_info['image_hash'])
+                    except OSError as e:
+                        logging.warning(f"이미지 해시 계산 실패 {image_path}: {e}")
+        return SharedImages(hashes)
+    
+    def prepare_server_images(self, dashboard_data):
+        """서버 차트 이미지의 해시/썸네일을 미리 계산 (파이프라인 모드에서 다운로드와 겹쳐 실행하며,
+        그룹 리포트를 만들 때는 계산된 캐시를 사용)"""
+        for charts in dashboard_data['charts'].values():
+            for chart_info in self.split_blank_charts(charts)[0]:
+                try:
+                    if self.inline_image_path(chart_info):
+                        chart_info['image_hash'] = self.image_store.image_hash(chart_info['file_path'])
+                    elif (chart_info.get('file_path') and not chart_info.get('series_path')
+                          and self.output_settings.get('image_mode') == 'thumbnail'):
+                        self.image_store.make_thumbnail(chart_info['file_path'])
+                except Exception as e:
+                    logging.warning(f"이미지 사전 처리 실패 {chart_info.get('file_path')}: {e}")
+    
+    def build_chart_card(self, chart_info, shared_images=None):
+        """차트 카드 HTML 생성 (shared_images: 문서 안 중복 이미지는 CSS 클래스로 참조)"""
+        # 데이터 기반 차트 모드 (PNG가 없는 패널은 모드와 관계없이 시계열 사용)
+        if chart_info.get('series_path') and (
+                self.output_settings.get('chart_mode') == 'svg' or not chart_info.get('file_path')):
+            card_html = self.build_svg_chart_card(chart_info)
+            if card_html or not chart_info.get('file_path'):
+                return card_html or ""
+        
+        if self.output_settings.get('image_mode') == 'thumbnail':
+            card_html = self.build_thumbnail_chart_card(chart_info)
+            if card_html:
+                return card_html
+        
+        width, height = self.read_image_size(chart_info['file_path'])
+        
+        # 이미지 데이터는 리포트 저장 시 파일에서 바로 base64로 스트리밍 (report_stream.py)
+        if shared_images and chart_info.get('image_hash'):
+            image_class = shared_images.use(chart_info['image_hash'],
+                                            image_marker(chart_info['file_path']),
+                                            base64_length(os.path.getsize(chart_info['file_path'])))
+            if image_class:
+                return self.template_engine.render('chart_card_shared', {
+                    'CHART_TITLE': chart_info['name'],
+                    'CHART_DESC': chart_info['description'],
+                    'CHART_IMAGE_CLASS': image_class,
+                    'CHART_WIDTH': width,
+                    'CHART_HEIGHT': height
+                })
         
         return self.template_engine.render('chart_card', {
             'CHART_TITLE': chart_info['name'],
             'CHART_DESC': chart_info['description'],
-            'CHART_IMAGE': img_base64
+            'CHART_IMAGE': image_marker(chart_info['file_path']),
+            'CHART_WIDTH': width,
+            'CHART_HEIGHT': height
         })
     
-    def build_chart_category(self, category_name, charts):
+    def build_chart_category(self, category_name, charts, shared_images=None):
         """차트 카테고리 섹션 생성"""
         if not charts:
             return ""
         
         chart_cards_html = ""
         for chart in charts:
-            chart_cards_html += self.build_chart_card(chart)
+            chart_cards_html += self.build_chart_card(chart, shared_images)
         
         category_desc = self.category_descriptions.get(category_name, f'{category_name} 관련 모니터링 지표')
         
@@ -310,22 +674,25 @@ class ReportBuilder:
             'CHART_CARDS': chart_cards_html
         })
     
-    def build_server_section(self, server_name, dashboard_data):
-        """서버 섹션 HTML 생성"""
-        server_details = {}
-        if self.server_info:
-            servers = self.server_info.get('servers', {})
-            
-            if self.dashboard_config and server_name in self.dashboard_config.get('dashboards', {}):
-                mapped_servers = self.dashboard_config['dashboards'][server_name].get('servers', [])
-                for mapped_server in mapped_servers:
-                    if mapped_server in servers:
-                        server_details = servers[mapped_server]
-                        logging.info(f"서버 정보 매핑: {server_name} -> {mapped_server}")
-                        break
-            
-            if not server_details and server_name in servers:
-                server_details = servers[server_name]
+    def get_server_key(self, server_name):
+        """대시보드 이름 → servers 섹션의 서버 이름 (대시보드 매핑 우선)"""
+        servers = (self.server_info or {}).get('servers', {})
+        if self.dashboard_config and server_name in self.dashboard_config.get('dashboards', {}):
+            for mapped_server in self.dashboard_config['dashboards'][server_name].get('servers', []):
+                if mapped_server in servers:
+                    return mapped_server
+        return server_name
+    
+    def get_server_details(self, server_name):
+        """서버 상세 정보 조회 (대시보드 매핑 우선, 없으면 기본값)"""
+        server_key = self.get_server_key(server_name)
+        server_details = (self.server_info or {}).get('servers', {}).get(server_key, {})
+        if server_details and server_key != server_name:
+            logging.info(f"서버 정보 매핑: {server_name} -> {server_key}")
+        
+        computed = self.server_stats.get(server_key)
+        if server_details and computed:
+            return merge_server_details(server_details, computed)
         
         if not server_details:
             logging.warning(f"서버 정보를 찾을 수 없어 기본값 사용: {server_name}")
@@ -343,16 +710,64 @@ class ReportBuilder:
                     'top5_note': '정보 없음'
                 }
             }
+            if computed:
+                # 계산된 통계가 있으면 가용률/요약은 기본값 대신 계산 값 사용
+                server_details = merge_server_details(
+                    {key: value for key, value in server_details.items() if key not in ('availability', 'summary')},
+                    computed
+                )
+        
+        return server_details
+    
+    def build_server_trend(self, server_name):
+        """지표 이력이 있으면 최근 월별 추이 표 생성 (이력이 한 달뿐이면 생략)"""
+        history = self.server_history.get(self.get_server_key(server_name), {})
+        if len(history) < 2:
+            return ""
+        
+        months = self.output_settings.get('history_months', 6)
+        last = month_key(self.config['report_month'])
+        month_list = [shift_month(last, offset) for offset in range(-(months - 1), 1)]
+        month_list = [month for month in month_list if month >= min(history)]
+        
+        rows = ""
+        for metric, label, fmt in TREND_METRICS:
+            cells = "".join(
+                f'<td class="index-count">{fmt.format(history[month][metric]) if history.get(month, {}).get(metric) is not None else "-"}</td>'
+                for month in month_list
+            )
+            rows += f'<tr><th>{label}</th>{cells}</tr>'
         
+        return self.template_engine.render('server_trend', {
+            'MONTH_COUNT': len(month_list),
+            'MONTH_HEADERS': "".join(f'<th class="index-count">{month.replace("-", ". ")}</th>' for month in month_list),
+            'TREND_ROWS': rows
+        })
+    
+    def build_server_section(self, server_name, dashboard_data, shared_images=None):
+        """서버 섹션 HTML 생성"""
+        server_details = self.get_server_details(server_name)
         summary = server_details.get('summary', {})
         
         categories_html = ""
         category_order = ['시스템 리소스', '스토리지', '네트워크', '모니터링', '애플리케이션', '기타']
+        blank_charts = []
         
         for category in category_order:
             if category in dashboard_data['charts'] and dashboard_data['charts'][category]:
-                charts = dashboard_data['charts'][category]
-                categories_html += self.build_chart_category(category, charts)
+                charts, blank = self.split_blank_charts(dashboard_data['charts'][category])
+                blank_charts.extend(blank)
+                categories_html += self.build_chart_category(category, charts, shared_images)
+        
+        # 빈 패널은 차트 카드 대신 서버별 목록 한 줄로 (exclude: 목록도 생략)
+        if blank_charts and self.output_settings.get('blank_panels') == 'list':
+            categories_html += self.template_engine.render('blank_panels', {
+                'BLANK_COUNT': len(blank_charts),
+                'BLANK_LIST': ", ".join(
+                    f"{chart['name']} ({BLANK_PANEL_LABELS.get(chart['blank'], chart['blank'])})"
+                    for chart in blank_charts
+                )
+            })
         
         server_data = {
             'SERVER_NAME': server_details.get('display_name', server_name),
@@ -367,173 +782,786 @@ class ReportBuilder:
             'CRITICAL_ALERTS': summary.get('critical_alerts', {}).get('value', 0),
             'WARNING_ALERTS': summary.get('warning_alerts', {}).get('value', 0),
             'TOP5_NOTE': summary.get('top5_note', '정보 없음'),
+            'SERVER_TREND': self.build_server_trend(server_name),
             'CATEGORIES': categories_html
         }
         
         return self.template_engine.render('server_section', server_data)
     
-    def build_report(self, group_name, group_info, dashboards_data):
-        """전체 리포트 HTML 생성"""
-        logging.info(f"리포트 생성 중: {group_name}")
-        
-        if not self.config:
-            logging.error("기본 설정이 없습니다.")
-            return ""
-        
-        content = ""
-        servers_in_group = group_info.get('servers', [])
-        
+    def get_valid_servers(self, group_name, group_info, dashboards_data):
+        """그룹 서버 중 수집된 대시보드 데이터가 있는 서버 목록"""
         valid_servers = []
-        for i, server_name in enumerate(servers_in_group):
+        for server_name in group_info.get('servers', []):
             if server_name in dashboards_data:
-                if i > 0:
-                    content += '<div class="server-separator"></div>'
-                
-                server_html = self.build_server_section(server_name, dashboards_data[server_name])
-                content += server_html
                 valid_servers.append(server_name)
-                logging.info(f"  서버 섹션 추가: {server_name}")
             else:
                 logging.warning(f"  서버 데이터를 찾을 수 없습니다: {server_name}")
         
         if not valid_servers:
             logging.warning(f"그룹 '{group_name}'에서 처리할 유효한 서버가 없습니다.")
-            return ""
+        return valid_servers
+    
+    def build_servers_content(self, server_names, dashboards_data):
+        """서버 섹션들을 구분선과 함께 연결 (같은 내용의 이미지는 문서에 한 번만 포함)"""
+        shared_images = self.collect_shared_images(server_names, dashboards_data)
+        content = ""
+        for i, server_name in enumerate(server_names):
+            if i > 0:
+                content += '<div class="server-separator"></div>'
+            
+            content += self.build_server_section(server_name, dashboards_data[server_name], shared_images)
+            logging.info(f"  서버 섹션 추가: {server_name}")
         
-        css_content = self.template_engine.load_css()
+        if shared_images.duplicates:
+            logging.info(f"  중복 이미지 {shared_images.duplicates}개를 공유 이미지 {len(shared_images.payloads)}개로 대체 "
+                         f"({shared_images.saved_bytes / 1024:.0f} KB 절약)")
+            with self.dedup_lock:
+                self.dedup_images += shared_images.duplicates
+                self.dedup_saved_bytes += shared_images.saved_bytes
+        return shared_images.build_style() + content
+    
+    def build_page(self, group_info, content, subtitle=None):
+        """base 템플릿으로 HTML 문서 생성"""
+        title = f"{group_info['display_name']} - {self.config['report_month']}"
+        if subtitle:
+            title = f"{title} ({subtitle})"
         
         base_data = {
-            'TITLE': f"{group_info['display_name']} - {self.config['report_month']}",
+            'TITLE': title,
             'GROUP_NAME': group_info['display_name'],
-            'GROUP_DESC': group_info['description'],
+            'GROUP_DESC': subtitle or group_info['description'],
             'PERIOD': self.config['period'],
-            'CSS': css_content,
+            'STYLESHEET': self.build_stylesheet(),
             'CONTENT': content
         }
         
-        final_html = self.template_engine.render('base', base_data)
+        return self.template_engine.render('base', base_data)
+    
+    def build_report(self, group_name, group_info, dashboards_data):
+        """전체 리포트 HTML 생성"""
+        logging.info(f"리포트 생성 중: {group_name}")
+        
+        if not self.config:
+            logging.error("기본 설정이 없습니다.")
+            return ""
+        
+        valid_servers = self.get_valid_servers(group_name, group_info, dashboards_data)
+        if not valid_servers:
+            return ""
+        
+        content = self.build_servers_content(valid_servers, dashboards_data)
+        final_html = self.build_page(group_info, content)
         
         logging.info(f"리포트 생성 완료: {group_name}")
         logging.info(f"  헤더: {group_info['display_name']}")
         logging.info(f"  포함 서버: {', '.join(valid_servers)}")
         
         return final_html
+    
+    def build_page_nav(self, index_filename, page_filenames, current):
+        """페이지 간 이동 링크 생성 (current: 현재 페이지 번호, 1부터)"""
+        links = [f'<a class="page-link" href="{index_filename}">목차</a>']
+        if current > 1:
+            links.append(f'<a class="page-link" href="{page_filenames[current - 2]}">이전</a>')
+        for number, filename in enumerate(page_filenames, 1):
+            css_class = "page-link current" if number == current else "page-link"
+            links.append(f'<a class="{css_class}" href="{filename}">{number}</a>')
+        if current < len(page_filenames):
+            links.append(f'<a class="page-link" href="{page_filenames[current]}">다음</a>')
+        return f'<nav class="page-nav">{"".join(links)}</nav>'
+    
+    def build_index_row(self, server_name, dashboard_data, page_filename):
+        """목차 페이지의 서버 요약 행 생성"""
+        server_details = self.get_server_details(server_name)
+        summary = server_details.get('summary', {})
+        
+        return self.template_engine.render('index_row', {
+            'PAGE_URL': page_filename,
+            'SERVER_NAME': server_details.get('display_name', server_name),
+            'SERVER_HOSTNAME': server_details.get('hostname', 'unknown'),
+            'SERVER_AVAILABILITY': server_details.get('availability', 'unknown'),
+            'TOTAL_ALERTS': summary.get('total_alerts', {}).get('value', 0),
+            'CRITICAL_ALERTS': summary.get('critical_alerts', {}).get('value', 0),
+            'WARNING_ALERTS': summary.get('warning_alerts', {}).get('value', 0),
+            'CHART_COUNT': dashboard_data['total_charts']
+        })
+    
+    def build_paged_report(self, group_name, group_info, dashboards_data, index_filename):
+        """목차 페이지 + 서버 N개 단위 페이지로 분할된 리포트 생성
+        
+        반환값: [(파일명, HTML), ...] - 첫 항목이 목차 페이지
+        """
+        logging.info(f"분할 리포트 생성 중: {group_name}")
+        
+        if not self.config:
+            logging.error("기본 설정이 없습니다.")
+            return []
+        
+        valid_servers = self.get_valid_servers(group_name, group_info, dashboards_data)
+        if not valid_servers:
+            return []
+        
+        per_page = max(1, int(self.output_settings.get('servers_per_page', 1)))
+        chunks = [valid_servers[i:i + per_page] for i in range(0, len(valid_servers), per_page)]
+        
+        index_stem = Path(index_filename).stem
+        page_filenames = [f"{index_stem}_p{number:03d}.html" for number in range(1, len(chunks) + 1)]
+        
+        def build_one(number):
+            chunk = chunks[number - 1]
+            nav = self.build_page_nav(index_filename, page_filenames, number)
+            content = nav + self.build_servers_content(chunk, dashboards_data) + nav
+            subtitle = f"{number}/{len(chunks)} 페이지 - {', '.join(chunk)}"
+            return self.build_page(group_info, content, subtitle)
+        
+        workers = max(1, int(self.output_settings.get('page_workers', 4)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pages_html = list(executor.map(build_one, range(1, len(chunks) + 1)))
+        
+        index_rows = ""
+        for number, chunk in enumerate(chunks, 1):
+            for server_name in chunk:
+                index_rows += self.build_index_row(server_name, dashboards_data[server_name], page_filenames[number - 1])
+        
+        index_content = self.template_engine.render('report_index', {
+            'SERVER_COUNT': len(valid_servers),
+            'PAGE_COUNT': len(chunks),
+            'INDEX_ROWS': index_rows
+        })
+        index_html = self.build_page(group_info, index_content)
+        
+        logging.info(f"분할 리포트 생성 완료: {group_name} (목차 + {len(chunks)}개 페이지)")
+        logging.info(f"  포함 서버: {', '.join(valid_servers)}")
+        
+        return [(index_filename, index_html)] + list(zip(page_filenames, pages_html))
+
+def prune_outputs(builder, output_dir):
+    """output_settings의 보관 정책으로 오래된 리포트 정리 (카탈로그에 기록된 리포트만)"""
+    keep_versions = builder.output_settings.get('retention_versions', 0)
+    max_total_mb = builder.output_settings.get('retention_max_mb', 0)
+    if not keep_versions and not max_total_mb:
+        return
+    
+    try:
+        removed, freed = ReportCatalog(output_dir).prune(keep_versions, max_total_mb)
+    except Exception as e:
+        logging.error(f"❌ 보관 정책 적용 실패: {e}")
+        return
+    if removed:
+        logging.info(f"   🧹 보관 정책으로 오래된 리포트 {len(removed)}개 삭제 ({freed / (1024 * 1024):.1f} MB 확보)")
 
-def get_next_version_filename(output_dir, base_filename):
-    """중복되지 않는 버전 파일명 생성"""
-    base_path = output_dir / base_filename
+def write_group_report(builder, group_name, group_info, dashboards_data, output_dir, timestamp, compression_pool=None):
+    """그룹 리포트 생성 및 저장 → (파일명, 저장된 경로 목록), 실패 시 None"""
+    logging.info(f"\n=== 그룹 처리 시작: {group_name} ===")
     
-    if not base_path.exists():
-        return base_filename
+    safe_group_name = group_name.replace(' ', '-').replace('/', '-')
+    month_str = builder.config['report_month'].replace('. ', '_')
+    base_filename = f"{safe_group_name}_{month_str}_{timestamp}.html"
     
-    name_part = base_path.stem
-    ext_part = base_path.suffix
+    # 카탈로그의 다음 버전 번호로 파일명 선점 (동시 실행 시에도 이름이 겹치지 않음)
+    catalog = ReportCatalog(output_dir)
+    final_filename, version = catalog.allocate(base_filename)
     
-    version = 1
-    while True:
-        versioned_filename = f"{name_part}_v{version:03d}{ext_part}"
-        versioned_path = output_dir / versioned_filename
+    if builder.output_settings.get('layout') == 'paged':
+        report_files = builder.build_paged_report(group_name, group_info, dashboards_data, final_filename)
+    else:
+        html_content = builder.build_report(group_name, group_info, dashboards_data)
+        report_files = [(final_filename, html_content)] if html_content else []
+    
+    if not report_files:
+        logging.warning(f"그룹 '{group_name}'의 HTML을 생성할 수 없습니다.")
+        catalog.release(final_filename)
+        return None
+    
+    try:
+        total_size = 0
+        written_paths = []
+        for filename, html_content in report_files:
+            output_path = output_dir / filename
+            write_report_html(output_path, html_content)
+            total_size += output_path.stat().st_size
+            written_paths.append(output_path)
+            # 다음 그룹을 렌더링하는 동안 백그라운드에서 압축
+            if compression_pool:
+                compression_pool.submit(output_path)
+        
+        try:
+            catalog.record(final_filename, base_filename, group_name, builder.config['report_month'],
+                           version, written_paths)
+        except Exception as e:
+            logging.warning(f"리포트 카탈로그 기록 실패 {final_filename}: {e}")
+        file_size = total_size / (1024 * 1024)
         
-        if not versioned_path.exists():
-            return versioned_filename
+        page_note = f", {len(report_files) - 1}개 페이지" if len(report_files) > 1 else ""
+        if final_filename != base_filename:
+            logging.info(f"✅ 리포트 생성 완료 (버전 생성): {final_filename} ({file_size:.1f} MB{page_note})")
+        else:
+            logging.info(f"✅ 리포트 생성 완료: {final_filename} ({file_size:.1f} MB{page_note})")
         
-        version += 1
+        return final_filename, written_paths
         
-        if version > 999:
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            return f"{name_part}_{timestamp}{ext_part}"
+    except Exception as e:
+        logging.error(f"❌ 리포트 생성 실패 ({group_name}): {e}")
+        catalog.release(final_filename)
+        return None
 
-def create_unified_report():
-    """메인 리포트 생성 함수"""
-    setup_logging()
-    logging.info("=== 통합 설정 기반 리포트 생성 시작 ===")
+def generate_month_reports(builder, unified_config, plan, needed_dashboards, images_folder,
+                           output_dir, timestamp, compression_pool, metrics=None):
+    """한 달 리포트 생성 (builder는 이미 그 달 설정을 로드한 상태) → {파일명: 저장된 경로 목록}
+    
+    images_folder: 사용할 이미지 폴더 (None이면 최신 폴더)
+    metrics: 주어지면 단계별 소요 시간과 리포트 크기를 기록 (RunMetrics, 일괄 생성 시 월별 시간은 합산)
+    """
+    if metrics is None:
+        metrics = RunMetrics('generate')
+    
+    # 이미지 폴더 사전 점검 (선택된 서버만)
+    with metrics.phase('check_images'):
+        images_ok, missing_servers = check_images_tree(unified_config, needed_dashboards, images_folder)
+    if not images_ok:
+        logging.error("이미지 폴더 사전 점검에 실패했습니다.")
+        return {}
+    if missing_servers:
+        # 이미지 폴더가 없거나 빈 서버가 포함된 그룹만 건너뛰고 나머지 그룹은 생성
+        skipped = {group_name: sorted(missing_servers & set(group_info.get('servers', [])))
+                   for group_name, group_info in plan.items()}
+        for group_name, servers in skipped.items():
+            if servers:
+                logging.warning(f"⚠️ 그룹 '{group_name}' 건너뜀: 이미지 폴더가 없거나 비어 있는 서버 {', '.join(servers)}")
+        plan = {group_name: group_info for group_name, group_info in plan.items() if not skipped[group_name]}
+    
+    if images_folder is None:
+        images_folder = find_latest_images_folder()
+        if not images_folder:
+            logging.error("실제 그라파나 이미지 데이터가 필요합니다.")
+            logging.error("다음 명령어를 먼저 실행하세요: runall.bat")
+            return {}
+    else:
+        logging.info(f"이미지 폴더 사용: {images_folder}")
+    
+    with metrics.phase('collect'):
+        dashboards_data = collect_dashboard_data(images_folder, builder.dashboard_config, needed_dashboards,
+                                                 builder.blank_panel_checker())
+    if not dashboards_data:
+        logging.error("대시보드 데이터를 수집할 수 없습니다.")
+        return {}
     
-    # 통합 설정 확인
-    unified_config = load_unified_config()
+    logging.info(f"수집된 대시보드: {list(dashboards_data.keys())}")
+    
+    report_paths = {}
+    for group_name, group_info in plan.items():
+        with metrics.phase('render'):
+            result = write_group_report(builder, group_name, group_info, dashboards_data,
+                                        output_dir, timestamp, compression_pool)
+        if result:
+            final_filename, written_paths = result
+            report_paths[final_filename] = written_paths
+            metrics.add_report(group_name, builder.config['report_month'], written_paths)
+    return report_paths
+
+def prepare_generation(unified_config=None, groups=None, servers=None, dashboards=None):
+    """설정 검증 및 생성 계획 → (검증된 설정, 계획, 필요한 대시보드 집합), 실패 시 None"""
+    # 통합 설정 확인 (같은 프로세스에서 검증 후 그 결과 객체를 그대로 사용)
+    if unified_config is None:
+        unified_config = load_validated_config()
     if not unified_config:
-        logging.error("통합 설정을 로드할 수 없습니다.")
-        return False
+        logging.error("통합 설정 검증에 실패했습니다.")
+        return None
     
-    config = load_config()
-    system_groups = load_system_groups()
+    config = load_config(unified_config)
+    system_groups = load_system_groups(unified_config)
     
     if not config or not system_groups:
-        return False
+        return None
     
-    images_folder = find_latest_images_folder()
-    if not images_folder:
-        logging.error("실제 그라파나 이미지 데이터가 필요합니다.")
-        logging.error("다음 명령어를 먼저 실행하세요: runall.bat")
+    dashboard_config = load_dashboard_config(unified_config)
+    plan = build_generation_plan(system_groups, dashboard_config, groups, servers, dashboards)
+    if not plan:
+        logging.error("선택 조건에 맞는 활성 그룹이 없습니다.")
+        return None
+    needed_dashboards = {name for group_info in plan.values() for name in group_info.get('servers', [])}
+    if groups or servers or dashboards:
+        logging.info(f"선택 생성: 그룹 {list(plan)}, 대시보드 {sorted(needed_dashboards)}")
+    return unified_config, plan, needed_dashboards
+
+def finish_reports(builder, output_dir, timestamp, report_paths, report_months, compression_pool):
+    """압축 완료 대기 후 생성 결과 요약, 아카이브, 보관 정책 적용 → 생성된 리포트가 있으면 True"""
+    compressed_sizes = compression_pool.results()
+    
+    if not report_paths:
+        logging.error("생성된 리포트가 없습니다.")
         return False
     
-    dashboard_config = load_dashboard_config()
-    dashboards_data = collect_dashboard_data(images_folder, dashboard_config)
+    logging.info(f"\n=== 총 {len(report_paths)}개 리포트 생성 완료 ===")
+    for report, paths in report_paths.items():
+        size_text = f"{sum(p.stat().st_size for p in paths) / (1024 * 1024):.1f} MB"
+        for fmt in compression_pool.formats:
+            compressed = sum(compressed_sizes.get(p, {}).get(fmt, 0) for p in paths)
+            size_text += f", {COMPRESS_SUFFIXES[fmt]} {compressed / (1024 * 1024):.1f} MB"
+        logging.info(f"   📄 {report} ({size_text})")
+    if builder.dedup_images:
+        logging.info(f"   🖼️ 중복 이미지 {builder.dedup_images}개 공유: "
+                     f"{builder.dedup_saved_bytes / 1024:,.0f} KB 절약")
     
-    if not dashboards_data:
-        logging.error("대시보드 데이터를 수집할 수 없습니다.")
+    archive_format = builder.output_settings.get('archive')
+    if archive_format:
+        archive_files = [p for paths in report_paths.values() for p in paths]
+        archive_files += sorted(builder.asset_files)
+        month_range = report_months[0].replace('. ', '_')
+        if len(report_months) > 1:
+            month_range += f"-{report_months[-1].replace('. ', '_')}"
+        archive_name = f"reports_{month_range}_{timestamp}.{archive_format}"
+        try:
+            archive_path = create_archive(archive_files, output_dir / archive_name, output_dir, archive_format)
+            archive_size = archive_path.stat().st_size / (1024 * 1024)
+            logging.info(f"   📦 {archive_path.name} ({archive_size:.1f} MB, {len(archive_files)}개 파일)")
+        except Exception as e:
+            logging.error(f"❌ 아카이브 생성 실패: {e}")
+    
+    prune_outputs(builder, output_dir)
+    return True
+
+def records_run_metrics(mode):
+    """실행 지표 데코레이터 - 감싼 함수에 metrics(RunMetrics)를 넘기고 끝나면 실패/예외와 관계없이 저장
+    
+    감싼 함수는 설정을 확정하면 metrics.config, 리포트 빌더를 만들면 metrics.builder를 채움
+    반환값이 (성공 여부, ...) 튜플이면 첫 값을 성공 여부로 사용
+    """
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            metrics = RunMetrics(mode)
+            result = False
+            try:
+                result = func(*args, metrics=metrics, **kwargs)
+                return result
+            finally:
+                write_run_metrics(metrics, bool(result[0] if isinstance(result, tuple) else result))
+        return wrapper
+    return decorate
+
+def write_run_metrics(metrics, success):
+    """실행 지표 저장 (output_settings.metrics_dir, 빈 문자열이면 저장하지 않음)"""
+    builder = metrics.builder
+    try:
+        if builder:
+            metrics.set_cache('image_hash', builder.image_store.cache_stats['hash_hits'],
+                              builder.image_store.cache_stats['hash_misses'])
+            metrics.set_cache('thumbnail', builder.image_store.cache_stats['thumbnail_hits'],
+                              builder.image_store.cache_stats['thumbnail_misses'])
+            metrics.set_cache('panel_check', builder.panel_checker.hits, builder.panel_checker.misses)
+            output_settings = builder.output_settings
+        else:
+            output_settings = load_output_settings(metrics.config)
+        path = metrics.write(output_settings.get('metrics_dir'), success)
+    except Exception as e:
+        logging.warning(f"실행 지표 저장 실패: {e}")
+        return
+    if path:
+        logging.info(f"실행 지표: {path}")
+
+@records_run_metrics('generate')
+def create_unified_report(unified_config=None, groups=None, servers=None, dashboards=None, months=None,
+                          metrics=None):
+    """메인 리포트 생성 함수
+    
+    unified_config: 검증된 통합 설정 객체
+    groups/servers/dashboards: 선택 생성 필터 (선택된 그룹/서버의 이미지만 점검, 수집, 렌더링)
+    months: 일괄 생성할 [(월 'YYYY-MM', 이미지 폴더 또는 None)] 목록
+            (템플릿/설정/이미지 캐시/압축 작업자를 모든 월이 공유, 없으면 설정의 report_month 한 달)
+    metrics: 실행 지표 (records_run_metrics가 전달)
+    """
+    setup_logging()
+    logging.info("=== 통합 설정 기반 리포트 생성 시작 ===")
+    
+    with metrics.phase('prepare'):
+        prepared = prepare_generation(unified_config, groups, servers, dashboards)
+    if not prepared:
         return False
+    unified_config, plan, needed_dashboards = prepared
+    metrics.config = unified_config
     
-    logging.info(f"수집된 대시보드: {list(dashboards_data.keys())}")
+    # 월별 (설정, 이미지 폴더) 목록 - 일괄 생성 시 폴더를 지정하지 않은 월은 폴더 이름으로 찾음
+    if months:
+        runs = []
+        for month, folder in months:
+            folder = Path(folder) if folder else find_month_images_folder(month)
+            if folder is None:
+                logging.error(f"{month} 이미지 폴더를 찾을 수 없습니다. --month {month}=<폴더>로 지정하세요.")
+                return False
+            runs.append((month, month_config(unified_config, month), folder))
+        logging.info(f"일괄 생성: {', '.join(month for month, _, _ in runs)} ({len(runs)}개월)")
+    else:
+        runs = [(None, unified_config, None)]
     
-    builder = ReportBuilder()
+    builder = ReportBuilder(runs[0][1])
+    metrics.builder = builder
     
     output_dir = Path("output")
     output_dir.mkdir(exist_ok=True)
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     
-    generated_reports = []
+    shared_css = builder.prepare_output(output_dir)
+    if shared_css:
+        logging.info(f"공유 스타일 모드: 모든 리포트가 {shared_css.name}을 참조합니다.")
     
-    for group_name, group_info in system_groups.get('groups', {}).items():
-        if not group_info.get('active', True):
-            logging.info(f"그룹 '{group_name}'은 비활성화되어 건너뜁니다.")
-            continue
-        
-        logging.info(f"\n=== 그룹 처리 시작: {group_name} ===")
-        
-        html_content = builder.build_report(group_name, group_info, dashboards_data)
-        
-        if not html_content:
-            logging.warning(f"그룹 '{group_name}'의 HTML을 생성할 수 없습니다.")
-            continue
-        
-        safe_group_name = group_name.replace(' ', '-').replace('/', '-')
-        month_str = config['report_month'].replace('. ', '_')
-        base_filename = f"{safe_group_name}_{month_str}_{timestamp}.html"
+    report_paths = {}
+    report_months = []
+    failed_months = []
+    compression_pool = CompressionPool(
+        builder.output_settings.get('compress', []),
+        max_workers=builder.output_settings.get('compress_workers', 2)
+    )
+    
+    for month, month_unified, images_folder in runs:
+        if month:
+            logging.info(f"\n##### {month} 리포트 생성 #####")
+            builder.reload_config(month_unified)
+        month_paths = generate_month_reports(builder, month_unified, plan, needed_dashboards, images_folder,
+                                             output_dir, timestamp, compression_pool, metrics)
+        if month_paths:
+            report_paths.update(month_paths)
+            report_months.append(builder.config['report_month'])
+        elif month:
+            logging.error(f"❌ {month} 리포트를 생성하지 못했습니다.")
+            failed_months.append(month)
+    
+    with metrics.phase('finish'):
+        finished = finish_reports(builder, output_dir, timestamp, report_paths, report_months, compression_pool)
+    if not finished:
+        return False
+    if failed_months:
+        logging.error(f"❌ 생성하지 못한 월: {', '.join(failed_months)}")
+    logging.info(f"\n결과 확인: output 폴더를 확인하세요.")
+    return not failed_months
+
+@records_run_metrics('run')
+def run_pipeline_mode(token, unified_config=None, url=None, download_workers=4, queue_size=64,
+                      render_strategy='panel', resume_folder=None, metrics=None):
+    """다운로드와 리포트 생성을 겹쳐 실행하는 파이프라인 모드 → (성공 여부, 이미지 폴더)
+    
+    다운로드 스레드가 완료된 패널을 크기 제한 큐에 넣으면, 대시보드(서버 섹션)의 패널이 모두 도착하는 즉시
+    수집/빈 패널 판정/이미지 해시 계산을 하고, 그룹의 서버가 모두 준비되면 그룹 리포트를 백그라운드에서 저장
+    token: 그라파나 API 토큰, url: 그라파나 주소 (기본: grafana_servers의 url)
+    render_strategy: 'panel'(패널별 /render/d-solo) 또는 'dashboard'(대시보드 한 번 렌더링 후 패널별로 자름)
+    resume_folder: 주어지면 중단된 다운로드 폴더에서 이어받기 (기록상 완료된 패널은 다시 받지 않음)
+    metrics: 실행 지표 (records_run_metrics가 전달)
+    """
+    from report_series import GrafanaClient
+    from report_download import (PanelDownloader, RenderTimes, DownloadJournal, discover_panel_jobs,
+                                 panel_render_params, dashboard_page_layout, remove_partial_files)
+    
+    setup_logging()
+    logging.info("=== 파이프라인 모드 시작 (다운로드 + 리포트 생성) ===")
+    started = time.perf_counter()
+    
+    with metrics.phase('prepare'):
+        prepared = prepare_generation(unified_config)
+    if not prepared:
+        return False, None
+    unified_config, plan, needed_dashboards = prepared
+    metrics.config = unified_config
+    
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    if resume_folder:
+        images_folder = Path(resume_folder)
+        removed = remove_partial_files(images_folder)
+        logging.info(f"다운로드 이어받기: {images_folder}" + (f" (임시 파일 {removed}개 삭제)" if removed else ""))
+    else:
+        images_folder = Path("images") / timestamp
+        logging.info(f"다운로드 폴더: {images_folder}")
+    
+    # 패널 목록을 먼저 조회하여 대시보드별 패널 수를 확정
+    clients = {}
+    jobs = []
+    with metrics.phase('discover'):
+        for server in unified_config.get('grafana_servers', []):
+            client = GrafanaClient(url or server['url'], token)
+            logging.info(f"=== 그라파나 서버: {server['name']} ({client.base_url}) ===")
+            if not client.test_connection():
+                continue
+            try:
+                server_jobs = discover_panel_jobs(client, server['name'], images_folder)
+            except (OSError, ValueError, KeyError) as e:
+                logging.warning(f"  대시보드 목록 조회 실패 ({server['name']}): {e}")
+                continue
+            clients[server['name']] = client
+            jobs.extend(server_jobs)
+    if not jobs:
+        logging.error("다운로드할 패널이 없습니다.")
+        return False, None
+    
+    # 리포트 생성기는 Production-Server 폴더의 대시보드를 서버 섹션으로 사용
+    remaining = defaultdict(int)
+    for job in jobs:
+        if job['server'] == "Production-Server":
+            remaining[job['dashboard']] += 1
+    missing = sorted(needed_dashboards - set(remaining))
+    if missing:
+        logging.warning(f"그라파나에 없는 대시보드 (리포트에서 제외): {', '.join(missing)}")
+    waiting = {group_name: set(group_info.get('servers', [])) & set(remaining)
+               for group_name, group_info in plan.items()}
+    logging.info(f"패널 {len(jobs)}개 다운로드 시작 (렌더링 방식 {render_strategy}, 동시 {download_workers}개, 큐 {queue_size}개)")
+    
+    builder = ReportBuilder(unified_config)
+    metrics.builder = builder
+    output_dir = Path("output")
+    output_dir.mkdir(exist_ok=True)
+    builder.prepare_output(output_dir)
+    compression_pool = CompressionPool(
+        builder.output_settings.get('compress', []),
+        max_workers=builder.output_settings.get('compress_workers', 2)
+    )
+    panel_checker = builder.blank_panel_checker()
+    dashboards_data = {}
+    group_futures = {}
+    
+    # 그룹 리포트 저장(이미지 base64 스트리밍)은 다운로드를 받는 동안 별도 스레드에서
+    with ThreadPoolExecutor(max_workers=1) as report_executor:
+        def finalize_ready_groups():
+            for group_name, servers in waiting.items():
+                if not servers and group_name not in group_futures:
+                    group_futures[group_name] = report_executor.submit(
+                        write_group_report, builder, group_name, plan[group_name], dict(dashboards_data),
+                        output_dir, timestamp, compression_pool)
         
-        final_filename = get_next_version_filename(output_dir, base_filename)
-        output_path = output_dir / final_filename
+        finalize_ready_groups()
+        results = queue.Queue(maxsize=max(1, queue_size))
+        report_settings = unified_config.get('report_settings', {})
+        journal = DownloadJournal(images_folder)
+        PanelDownloader(clients, journal.pin_time_range(panel_render_params(report_settings)),
+                        workers=download_workers, strategy=render_strategy,
+                        page_layout=dashboard_page_layout(report_settings),
+                        render_times=RenderTimes(),
+                        journal=journal).start(jobs, results)
+        succeeded = failed = resumed = 0
+        download_started = time.perf_counter()
+        while True:
+            result = results.get()
+            if result is None:
+                break
+            job = result['job']
+            metrics.add_panel_result(result)
+            if result.get('resumed'):
+                resumed += 1
+            elif result['ok']:
+                succeeded += 1
+            else:
+                failed += 1
+                logging.warning(f"    패널 {job['panel_id']} 실패 ({job['server']}/{job['dashboard']}/{job['title']}): "
+                                f"{result['error']}")
+            if job['server'] != "Production-Server":
+                continue
+            remaining[job['dashboard']] -= 1
+            if remaining[job['dashboard']] or job['dashboard'] not in needed_dashboards:
+                continue
+            
+            # 서버 섹션의 패널이 모두 도착: 바로 수집하고 이미지 처리
+            data = collect_dashboard_data(images_folder, builder.dashboard_config, {job['dashboard']}, panel_checker)
+            for dashboard_name, dashboard_data in data.items():
+                builder.prepare_server_images(dashboard_data)
+                dashboards_data[dashboard_name] = dashboard_data
+            logging.info(f"  ✔ 서버 준비 완료: {job['dashboard']} ({time.perf_counter() - started:.1f}초)")
+            for servers in waiting.values():
+                servers.discard(job['dashboard'])
+            finalize_ready_groups()
         
-        try:
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(html_content)
+        metrics.phases['download'] = time.perf_counter() - download_started
+        resumed_note = f", 이전 실행에서 완료 {resumed}개" if resumed else ""
+        logging.info(f"다운로드 완료: 패널 {len(jobs)}개 중 성공 {succeeded}개, 실패 {failed}개{resumed_note} "
+                     f"({time.perf_counter() - started:.1f}초)")
+        if failed:
+            logging.warning(f"실패한 패널은 다음 명령으로 다시 받을 수 있습니다: python grafana_report.py run --resume")
+        report_paths = {}
+        failed_groups = []
+        with metrics.phase('reports'):
+            for group_name in plan:
+                if group_name not in group_futures:
+                    # 패널 결과가 모두 도착하지 않아 리포트를 시작하지 못한 그룹
+                    logging.error(f"❌ 리포트 생성 실패 ({group_name}): 패널 결과를 받지 못한 서버 "
+                                  f"{', '.join(sorted(waiting[group_name]))}")
+                    failed_groups.append(group_name)
+                    continue
+                try:
+                    result = group_futures[group_name].result()
+                except Exception as e:
+                    logging.error(f"❌ 리포트 생성 실패 ({group_name}): {e}")
+                    failed_groups.append(group_name)
+                    continue
+                if not result:
+                    failed_groups.append(group_name)
+                    continue
+                final_filename, written_paths = result
+                report_paths[final_filename] = written_paths
+                metrics.add_report(group_name, builder.config['report_month'], written_paths)
+    
+    with metrics.phase('finish'):
+        finished = finish_reports(builder, output_dir, timestamp, report_paths, [builder.config['report_month']],
+                                  compression_pool)
+    logging.info(f"\n파이프라인 완료: {time.perf_counter() - started:.1f}초")
+    if failed_groups:
+        logging.error(f"❌ 생성하지 못한 그룹: {', '.join(failed_groups)}")
+    return finished and not failed and not failed_groups, images_folder
+
+def run_watch_mode(interval=1.0, debounce=2.0):
+    """설정/템플릿/이미지 변경을 감시하여 영향받는 그룹만 다시 생성"""
+    setup_logging()
+    logging.info("=== watch 모드 시작 (Ctrl+C로 종료) ===")
+    
+    unified_config = load_validated_config()
+    if not unified_config:
+        return False
+    builder = ReportBuilder(unified_config)
+    if not builder.config or not builder.system_groups:
+        return False
+    
+    images_folder = find_latest_images_folder()
+    if not images_folder:
+        return False
+    dashboards_data = collect_dashboard_data(images_folder, builder.dashboard_config,
+                                             panel_checker=builder.blank_panel_checker())
+    
+    output_dir = Path("output")
+    output_dir.mkdir(exist_ok=True)
+    builder.prepare_output(output_dir)
+    
+    def active_groups():
+        return {name: info for name, info in builder.system_groups.get('groups', {}).items()
+                if info.get('active', True)}
+    
+    def regenerate(group_names):
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        groups = active_groups()
+        compression_pool = CompressionPool(
+            builder.output_settings.get('compress', []),
+            max_workers=builder.output_settings.get('compress_workers', 2)
+        )
+        for group_name in group_names:
+            if group_name in groups:
+                write_group_report(builder, group_name, groups[group_name], dashboards_data,
+                                   output_dir, timestamp, compression_pool)
+        compression_pool.results()
+        prune_outputs(builder, output_dir)
+    
+    regenerate(list(active_groups()))
+    fingerprints = {name: builder.group_fingerprint(name, info) for name, info in active_groups().items()}
+    
+    config_dir, templates_dir, images_dir = Path("config"), Path("templates"), Path("images")
+    watcher = FolderWatcher(
+        lambda: [(config_dir, True), (templates_dir, True), (images_dir, False), (images_folder, True)],
+        interval=interval,
+        debounce=debounce
+    )
+    logging.info(f"변경 감시 중: {config_dir}, {templates_dir}, {images_folder}")
+    
+    try:
+        while True:
+            changed = watcher.wait_for_changes()
+            affected = set()
+            
+            if any(is_relative_to(path, templates_dir) for path in changed):
+                logging.info("템플릿 변경 감지 → 전체 그룹 재생성")
+                builder.reload_templates()
+                affected.update(active_groups())
             
-            file_size = output_path.stat().st_size / (1024 * 1024)
-            generated_reports.append(final_filename)
+            if any(is_relative_to(path, config_dir) for path in changed):
+                unified_config = load_validated_config()
+                if not unified_config:
+                    logging.error("설정 파일 검증에 실패하여 이번 변경은 건너뜁니다.")
+                    continue
+                builder.reload_config(unified_config)
+                new_fingerprints = {name: builder.group_fingerprint(name, info)
+                                    for name, info in active_groups().items()}
+                config_groups = {name for name, fp in new_fingerprints.items() if fingerprints.get(name) != fp}
+                logging.info(f"설정 변경 감지 → 영향받는 그룹: {sorted(config_groups) or '없음'}")
+                affected.update(config_groups)
+                fingerprints = new_fingerprints
             
-            if final_filename != base_filename:
-                logging.info(f"✅ 리포트 생성 완료 (버전 생성): {final_filename} ({file_size:.1f} MB)")
+            latest = find_latest_images_folder()
+            if latest and latest != images_folder:
+                logging.info(f"새 이미지 폴더 감지 → 전체 그룹 재생성: {latest}")
+                images_folder = latest
+                affected.update(active_groups())
             else:
-                logging.info(f"✅ 리포트 생성 완료: {final_filename} ({file_size:.1f} MB)")
+                changed_dashboards = {
+                    path.relative_to(images_folder).parts[1]
+                    for path in changed
+                    if is_relative_to(path, images_folder) and len(path.relative_to(images_folder).parts) > 2
+                }
+                if changed_dashboards:
+                    image_groups = {name for name, info in active_groups().items()
+                                    if changed_dashboards & set(info.get('servers', []))}
+                    logging.info(f"이미지 변경 감지 ({', '.join(sorted(changed_dashboards))}) → 영향받는 그룹: {sorted(image_groups) or '없음'}")
+                    affected.update(image_groups)
             
-        except Exception as e:
-            logging.error(f"❌ 리포트 생성 실패 ({group_name}): {e}")
+            if affected:
+                dashboards_data = collect_dashboard_data(images_folder, builder.dashboard_config,
+                                                         panel_checker=builder.blank_panel_checker())
+                regenerate([name for name in active_groups() if name in affected])
+    except KeyboardInterrupt:
+        logging.info("watch 모드 종료")
     
-    if generated_reports:
-        logging.info(f"\n=== 총 {len(generated_reports)}개 리포트 생성 완료 ===")
-        for report in generated_reports:
-            logging.info(f"   📄 {report}")
-        
-        logging.info(f"\n결과 확인: output 폴더를 확인하세요.")
-        return True
-    else:
-        logging.error("생성된 리포트가 없습니다.")
-        return False
+    return True
+
+def parse_month_arg(value):
+    """--month 값 'YYYY-MM' 또는 'YYYY-MM=이미지폴더' → (월, 폴더 또는 None)"""
+    month, _, folder = value.partition('=')
+    if not re.fullmatch(r'\d{4}-(0[1-9]|1[0-2])', month):
+        raise argparse.ArgumentTypeError(f"월 형식은 YYYY-MM입니다: {value}")
+    return month, folder or None
+
+def parse_months_arg(value):
+    """--months 값 'YYYY-MM..YYYY-MM' → [(월, None), ...] (양 끝 포함)"""
+    first, sep, last = value.partition('..')
+    if not sep:
+        raise argparse.ArgumentTypeError(f"범위 형식은 YYYY-MM..YYYY-MM입니다: {value}")
+    first, last = parse_month_arg(first)[0], parse_month_arg(last)[0]
+    if first > last:
+        raise argparse.ArgumentTypeError(f"시작 월이 끝 월보다 늦습니다: {value}")
+    months = [first]
+    while months[-1] < last:
+        months.append(shift_month(months[-1], 1))
+    return [(month, None) for month in months]
+
+def parse_args(argv=None):
+    """명령행 인자 해석"""
+    parser = argparse.ArgumentParser(description="통합 설정 기반 그라파나 월간 리포트 생성")
+    parser.add_argument("--watch", action="store_true",
+                        help="설정/템플릿/이미지 변경 시 영향받는 그룹만 자동 재생성")
+    parser.add_argument("--interval", type=float, default=1.0, help="watch 모드 변경 확인 주기(초)")
+    parser.add_argument("--debounce", type=float, default=2.0,
+                        help="watch 모드에서 마지막 변경 후 재생성까지 대기 시간(초)")
+    parser.add_argument("--group", action="append", metavar="NAME",
+                        help="지정한 그룹만 생성 (여러 번 지정 가능, 와일드카드 * ? 사용 가능)")
+    parser.add_argument("--server", action="append", metavar="NAME",
+                        help="지정한 서버가 속한 그룹만, 해당 서버 섹션만 포함하여 생성")
+    parser.add_argument("--dashboard", action="append", metavar="NAME",
+                        help="지정한 대시보드가 속한 그룹만, 해당 대시보드 섹션만 포함하여 생성")
+    parser.add_argument("--month", action="append", type=parse_month_arg, metavar="YYYY-MM[=FOLDER]",
+                        help="지정한 월 리포트 생성 (여러 번 지정 시 한 프로세스에서 일괄 생성, "
+                             "폴더 생략 시 폴더 이름이 그 달/다음 달인 최신 이미지 폴더)")
+    parser.add_argument("--months", type=parse_months_arg, metavar="YYYY-MM..YYYY-MM",
+                        help="월 범위 일괄 생성 (예: 2025-04..2025-06)")
+    args = parser.parse_args(argv)
+    if args.watch and (args.group or args.server or args.dashboard):
+        parser.error("--group/--server/--dashboard는 watch 모드와 함께 사용할 수 없습니다")
+    if args.watch and (args.month or args.months):
+        parser.error("--month/--months는 watch 모드와 함께 사용할 수 없습니다")
+    # --months 범위에 --month로 폴더를 지정한 월은 그 폴더 사용
+    folders = dict(args.month or [])
+    months = [month for month, _ in (args.months or [])] + [month for month, _ in (args.month or [])]
+    args.months = [(month, folders.get(month)) for month in dict.fromkeys(months)]
+    return args
 
-def main():
+def main(argv=None):
     """메인 실행 함수"""
-    return create_unified_report()
+    args = parse_args(argv)
+    if args.watch:
+        return run_watch_mode(args.interval, args.debounce)
+    return create_unified_report(groups=args.group, servers=args.server, dashboards=args.dashboard,
+                                 months=args.months)
 
 if __name__ == "__main__":
     import sys
     success = main()
-    sys.exit(0 if success else 1)
\ No newline at end of file
+    sys.exit(0 if success else 1)
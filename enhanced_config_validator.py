@@ -1,8 +1,11 @@
 # enhanced_config_validator.py - 통합 설정 기반 버전
 import json
+import os
 import re
+import time
+import hashlib
 from pathlib import Path
-from typing import Dict, List, Tuple, Any
+from typing import Dict, List, Set, Tuple, Any
 import logging
 from datetime import datetime
 
@@ -17,42 +20,126 @@ class ConfigError:
         self.example = example
         self.timestamp = datetime.now()
 
+CONFIG_PATH = Path("config/unified_config.json")
+VALIDATION_CACHE_PATH = Path("cache/validation.json")
+
+# 다운로드/월 변경 스크립트가 자동으로 갱신하는 키 (검증 결과에 영향 없음)
+VOLATILE_KEYS = ['last_download']
+VOLATILE_METADATA_KEYS = ['last_updated']
+
+# 이미지 폴더 구조: images/<timestamp>/Production-Server/<대시보드>/<패널>.png
+IMAGES_DIR = Path("images")
+IMAGES_SERVER_FOLDER = "Production-Server"
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+# 데이터 기반 차트 모드의 패널 시계열 파일 (report_series.py)
+SERIES_SUFFIX = ".series.json"
+
 class UnifiedConfigValidator:
-    def __init__(self):
+    def __init__(self, config_path: Path = CONFIG_PATH, cache_path: Path = VALIDATION_CACHE_PATH):
         self.errors: List[ConfigError] = []
         self.warnings: List[ConfigError] = []
+        # 이미지 폴더 사전 점검에서 폴더가 없거나 비어 있는 서버 (해당 그룹만 건너뜀)
+        self.missing_image_servers: Set[str] = set()
         self.config = None
+        self.config_path = Path(config_path)
+        self.cache_path = Path(cache_path)
         
-    def validate_all(self) -> bool:
-        """전체 검증 실행"""
-        print("🔍 === 통합 설정 파일 검증 시작 ===")
-        print(f"검증 시작 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print()
-        
-        # 1단계: 통합 설정 파일 존재 및 문법 검증
-        if not self._load_unified_config():
-            self._print_detailed_report()
-            return False
-        
-        # 2단계: 스키마 검증  
-        self._validate_schema()
+    def validate_all(self, use_cache: bool = False, check_images: bool = False) -> bool:
+        """전체 검증 실행
         
-        # 3단계: 데이터 일관성 검증
-        self._validate_consistency()
+        use_cache: 설정이 바뀌지 않았으면 이전 검증 결과 재사용 (당시 경고는 다시 출력)
+        check_images: 최신 이미지 폴더가 활성 그룹 구성과 맞는지 사전 점검 (캐시하지 않음)
+        """
+        cached = use_cache and self._load_cached_result()
+        if cached:
+            print("✅ 통합 설정 파일 변경 없음 - 이전 검증 결과를 사용합니다")
+        else:
+            print("🔍 === 통합 설정 파일 검증 시작 ===")
+            print(f"검증 시작 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+            print()
+            
+            # 1단계: 통합 설정 파일 존재 및 문법 검증
+            if not self._load_unified_config():
+                self._print_detailed_report()
+                return False
+            
+            # 2단계: 스키마 검증  
+            self._validate_schema()
+            
+            # 3단계: 데이터 일관성 검증
+            self._validate_consistency()
+            
+            # 4단계: 비즈니스 로직 검증
+            self._validate_business_logic()
+            
+            if use_cache and not self.errors:
+                self._save_cached_result()
         
-        # 4단계: 비즈니스 로직 검증
-        self._validate_business_logic()
+        # 5단계 (선택): 이미지 폴더 사전 점검
+        if check_images and not self.errors:
+            self._validate_images_tree()
         
         # 결과 리포트 출력
-        self._print_detailed_report()
+        if not cached or self.errors or self.warnings:
+            self._print_detailed_report()
         
         return len(self.errors) == 0
     
+    def _cache_key(self) -> str:
+        """설정 내용 + 검증기 버전 해시 (자동 갱신 키 제외)"""
+        stable = {k: v for k, v in self.config.items() if k not in VOLATILE_KEYS}
+        if isinstance(stable.get('_metadata'), dict):
+            stable['_metadata'] = {k: v for k, v in stable['_metadata'].items()
+                                   if k not in VOLATILE_METADATA_KEYS}
+        digest = hashlib.sha256(json.dumps(stable, sort_keys=True, ensure_ascii=False).encode('utf-8'))
+        digest.update(Path(__file__).read_bytes())
+        return digest.hexdigest()
+    
+    def _load_cached_result(self) -> bool:
+        """캐시된 검증 결과가 현재 설정과 일치하면 설정과 당시 경고 목록을 로드하고 True"""
+        if not self.cache_path.exists() or not self.config_path.exists():
+            return False
+        try:
+            with open(self.config_path, 'r', encoding='utf-8-sig') as f:
+                self.config = json.load(f)
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+        except Exception:
+            self.config = None
+            return False
+        
+        # 경고 개수만 저장하던 이전 형식의 캐시는 경고를 다시 보여줄 수 없으므로 새로 검증
+        if isinstance(self.config, dict) and cached.get('key') == self._cache_key() \
+                and isinstance(cached.get('warnings'), list):
+            try:
+                self.warnings = [ConfigError(**warning) for warning in cached['warnings']]
+            except TypeError:
+                self.warnings = []
+            else:
+                return True
+        self.config = None
+        return False
+    
+    def _save_cached_result(self):
+        """검증 통과 결과 저장"""
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.cache_path, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'key': self._cache_key(),
+                    'warnings': [{'file_path': w.file_path, 'error_type': w.error_type, 'message': w.message,
+                                  'line_number': w.line_number, 'solution': w.solution, 'example': w.example}
+                                 for w in self.warnings],
+                    'validated_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                }, f, ensure_ascii=False, indent=2)
+        except Exception as e:
+            print(f"  ⚠️  검증 결과 캐시 저장 실패: {e}")
+    
     def _load_unified_config(self) -> bool:
         """통합 설정 파일 로드 및 기본 검증"""
         print("📋 1단계: 통합 설정 파일 검증")
         
-        config_path = Path("config/unified_config.json")
+        config_path = self.config_path
         
         if not config_path.exists():
             self._add_error(ConfigError(
@@ -82,6 +169,15 @@ class UnifiedConfigValidator:
             # JSON 파싱 시도
             try:
                 self.config = json.loads(content)
+                if not isinstance(self.config, dict):
+                    self._add_error(ConfigError(
+                        file_path="config/unified_config.json",
+                        error_type="INVALID_ROOT_TYPE",
+                        message="설정 파일 최상위는 객체({ })여야 합니다",
+                        solution="unified_config_example.json을 참고하여 설정을 작성하세요"
+                    ))
+                    self.config = None
+                    return False
                 print(f"  ✅ unified_config.json - 문법 정상")
                 return True
                 
@@ -198,6 +294,10 @@ class UnifiedConfigValidator:
             self._validate_dashboards_section()
         if 'chart_categories' in self.config:
             self._validate_chart_categories_section()
+        if 'output_settings' in self.config:
+            self._validate_output_settings_section()
+        if 'stats_settings' in self.config:
+            self._validate_stats_settings_section()
     
     def _validate_metadata_section(self):
         """메타데이터 섹션 검증"""
@@ -251,6 +351,18 @@ class UnifiedConfigValidator:
                     solution=f"'{key}' 키를 추가하세요",
                     example=self._get_report_setting_example(key)
                 ))
+        
+        # 선택 키: run --render dashboard의 대시보드 페이지 여백 (px)
+        for key in ('dashboard_page_padding', 'dashboard_page_top'):
+            value = settings.get(key, 0)
+            if not isinstance(value, int) or isinstance(value, bool) or value < 0:
+                self._add_error(ConfigError(
+                    file_path="config/unified_config.json",
+                    error_type="INVALID_REPORT_SETTING",
+                    message=f"'{key}' 값은 0 이상의 정수(px)여야 합니다: {value}",
+                    solution=f"'{key}'에 대시보드 페이지 여백을 픽셀 단위로 입력하세요",
+                    example=f'"{key}": 16'
+                ))
     
     def _validate_grafana_servers_section(self):
         """그라파나 서버 섹션 검증"""
@@ -451,6 +563,198 @@ class UnifiedConfigValidator:
                 solution="차트 카테고리를 객체 형태로 정의하세요"
             ))
     
+    def _validate_output_settings_section(self):
+        """출력 옵션 섹션 검증 (선택적)"""
+        settings = self.config.get('output_settings', {})
+        if not isinstance(settings, dict):
+            self._add_error(ConfigError(
+                file_path="config/unified_config.json",
+                error_type="INVALID_SECTION_TYPE",
+                message="'output_settings' 섹션은 객체여야 합니다",
+                solution="출력 옵션을 객체 형태로 정의하세요"
+            ))
+            return
+        
+        css_mode = settings.get('css_mode', 'inline')
+        if css_mode not in ('inline', 'shared'):
+            self._add_error(ConfigError(
+                file_path="config/unified_config.json",
+                error_type="INVALID_OUTPUT_SETTING",
+                message=f"잘못된 css_mode 값: {css_mode}",
+                solution="'inline' 또는 'shared' 중 하나를 사용하세요",
+                example='"css_mode": "inline"'
+            ))
+        
+        image_mode = settings.get('image_mode', 'inline')
+        if image_mode not in ('inline', 'thumbnail'):
+            self._add_error(ConfigError(
+                file_path="config/unified_config.json",
+                error_type="INVALID_OUTPUT_SETTING",
+                message=f"잘못된 image_mode 값: {image_mode}",
+                solution="'inline' 또는 'thumbnail' 중 하나를 사용하세요",
+                example='"image_mode": "thumbnail"'
+            ))
+        
+        layout = settings.get('layout', 'single')
+        if layout not in ('single', 'paged'):
+            self._add_error(ConfigError(
+                file_path="config/unified_config.json",
+                error_type="INVALID_OUTPUT_SETTING",
+                message=f"잘못된 layout 값: {layout}",
+                solution="'single' 또는 'paged' 중 하나를 사용하세요",
+                example='"layout": "paged"'
+            ))
+        
+        compress = settings.get('compress', [])
+        if not isinstance(compress, list) or any(fmt not in ('gzip', 'br') for fmt in compress):
+            self._add_error(ConfigError(
+                file_path="config/unified_config.json",
+                error_type="INVALID_OUTPUT_SETTING",
+                message=f"잘못된 compress 값: {compress}",
+                solution="'gzip', 'br' 중에서 배열로 지정하세요",
+                example='"compress": ["gzip", "br"]'
+            ))
+        
+        archive = settings.get('archive', '')
+        if archive not in ('', 'zip', 'tar.zst'):
+            self._add_error(ConfigError(
+                file_path="config/unified_config.json",
+                error_type="INVALID_OUTPUT_SETTING",
+                message=f"잘못된 archive 값: {archive}",
+                solution="'zip', 'tar.zst' 또는 빈 문자열을 사용하세요",
+                example='"archive": "zip"'
+            ))
+        
+        chart_mode = settings.get('chart_mode', 'image')
+        if chart_mode not in ('image', 'svg'):
+            self._add_error(ConfigError(
+                file_path="config/unified_config.json",
+                error_type="INVALID_OUTPUT_SETTING",
+                message=f"잘못된 chart_mode 값: {chart_mode}",
+                solution="'image' 또는 'svg' 중 하나를 사용하세요",
+                example='"chart_mode": "svg"'
+            ))
+        
+        for key in ('svg_width', 'svg_height'):
+            value = settings.get(key, 400)
+            if not isinstance(value, int) or value < 200:
+                self._add_error(ConfigError(
+                    file_path="config/unified_config.json",
+                    error_type="INVALID_OUTPUT_SETTING",
+                    message=f"'{key}' 값은 200 이상의 정수여야 합니다: {value}",
+                    solution=f"'{key}'에 200 이상의 정수를 입력하세요",
+                    example=f'"{key}": 400'
+                ))
+        
+        blank_panels = settings.get('blank_panels', 'keep')
+        if blank_panels not in ('keep', 'list', 'exclude'):
+            self._add_error(ConfigError(
+                file_path="config/unified_config.json",
+                error_type="INVALID_OUTPUT_SETTING",
+                message=f"잘못된 blank_panels 값: {blank_panels}",
+                solution="'keep', 'list', 'exclude' 중 하나를 사용하세요",
+                example='"blank_panels": "list"'
+            ))
+        
+        for key in ('retention_versions', 'retention_max_mb'):
+            value = settings.get(key, 0)
+            if not isinstance(value, int) or value < 0:
+                self._add_error(ConfigError(
+                    file_path="config/unified_config.json",
+                    error_type="INVALID_OUTPUT_SETTING",
+                    message=f"'{key}' 값은 0 이상의 정수여야 합니다: {value}",
+                    solution=f"'{key}'에 0(제한 없음) 이상의 정수를 입력하세요",
+                    example=f'"{key}": 5'
+                ))
+        
+        strict_images_check = settings.get('strict_images_check', False)
+        if not isinstance(strict_images_check, bool):
+            self._add_error(ConfigError(
+                file_path="config/unified_config.json",
+                error_type="INVALID_OUTPUT_SETTING",
+                message=f"'strict_images_check' 값은 true/false여야 합니다: {strict_images_check}",
+                solution="이미지 폴더가 없는 서버가 있을 때 그 달 생성을 중단하려면 true, 해당 그룹만 건너뛰려면 false",
+                example='"strict_images_check": false'
+            ))
+        
+        metrics_dir = settings.get('metrics_dir', 'metrics')
+        if not isinstance(metrics_dir, str):
+            self._add_error(ConfigError(
+                file_path="config/unified_config.json",
+                error_type="INVALID_OUTPUT_SETTING",
+                message=f"'metrics_dir' 값은 문자열이어야 합니다: {metrics_dir}",
+                solution="실행 지표(.prom)를 저장할 폴더 경로를 입력하세요 (빈 문자열이면 저장하지 않음)",
+                example='"metrics_dir": "/var/lib/node_exporter/textfile_collector"'
+            ))
+        
+        history_months = settings.get('history_months', 6)
+        if not isinstance(history_months, int) or history_months < 0:
+            self._add_error(ConfigError(
+                file_path="config/unified_config.json",
+                error_type="INVALID_OUTPUT_SETTING",
+                message=f"'history_months' 값은 0 이상의 정수여야 합니다: {history_months}",
+                solution="표시할 개월 수를 입력하세요 (0이면 월별 추이 표 생략)",
+                example='"history_months": 6'
+            ))
+        
+        for key in ('servers_per_page', 'page_workers', 'compress_workers'):
+            value = settings.get(key, 1)
+            if not isinstance(value, int) or value < 1:
+                self._add_error(ConfigError(
+                    file_path="config/unified_config.json",
+                    error_type="INVALID_OUTPUT_SETTING",
+                    message=f"'{key}' 값은 1 이상의 정수여야 합니다: {value}",
+                    solution=f"'{key}'에 1 이상의 정수를 입력하세요",
+                    example=f'"{key}": 1'
+                ))
+    
+    def _validate_stats_settings_section(self):
+        """서버 통계 설정 섹션 검증 (선택적)"""
+        settings = self.config.get('stats_settings', {})
+        if not isinstance(settings, dict):
+            self._add_error(ConfigError(
+                file_path="config/unified_config.json",
+                error_type="INVALID_SECTION_TYPE",
+                message="'stats_settings' 섹션은 객체여야 합니다",
+                solution="서버 통계 설정을 객체 형태로 정의하세요"
+            ))
+            return
+        
+        step = settings.get('step', 300)
+        if not isinstance(step, int) or step < 10:
+            self._add_error(ConfigError(
+                file_path="config/unified_config.json",
+                error_type="INVALID_STATS_SETTING",
+                message=f"'step' 값은 10 이상의 정수(초)여야 합니다: {step}",
+                solution="지표 수집 간격 이상의 값을 초 단위로 입력하세요",
+                example='"step": 300'
+            ))
+        
+        queries = settings.get('queries', {})
+        if not isinstance(queries, dict) or any(not isinstance(q, str) or not q.strip() for q in queries.values()):
+            self._add_error(ConfigError(
+                file_path="config/unified_config.json",
+                error_type="INVALID_STATS_SETTING",
+                message="'queries'는 지표 이름(up/cpu/memory)과 쿼리 문자열의 객체여야 합니다",
+                solution="$instance 자리에 서버 instance/hostname이 들어갑니다",
+                example='"queries": {"up": "max(up{instance=~\"$instance(:[0-9]+)?\"})"}'
+            ))
+        
+        thresholds = settings.get('thresholds', {})
+        for metric, limits in (thresholds.items() if isinstance(thresholds, dict) else [('thresholds', None)]):
+            valid = (isinstance(limits, dict)
+                     and all(isinstance(limits.get(key, 0), (int, float)) for key in ('warning', 'critical')))
+            if valid and 'warning' in limits and 'critical' in limits and limits['warning'] > limits['critical']:
+                valid = False
+            if not valid:
+                self._add_error(ConfigError(
+                    file_path="config/unified_config.json",
+                    error_type="INVALID_STATS_SETTING",
+                    message=f"잘못된 임계치 설정: {metric} = {limits}",
+                    solution="warning/critical 숫자를 지정하고 warning은 critical 이하로 설정하세요",
+                    example='"cpu": {"warning": 80, "critical": 90}'
+                ))
+    
     def _validate_consistency(self):
         """데이터 일관성 검증"""
         print("\n🔗 3단계: 데이터 일관성 검증")
@@ -559,6 +863,160 @@ class UnifiedConfigValidator:
                     solution="1-12 사이의 월을 입력하세요"
                 ))
     
+    def _index_images_tree(self, images_dir: Path, dashboard_names=None, images_folder=None) -> Tuple[Any, Dict[str, Dict[str, list]]]:
+        """최신 이미지 폴더를 scandir 한 번으로 색인 → (최신 폴더, {대시보드: {png, empty, invalid}})
+        
+        dashboard_names: 주어지면 해당 대시보드 폴더만 색인 (선택 생성)
+        images_folder: 주어지면 최신 폴더 대신 이 폴더를 색인 (여러 달 일괄 생성)
+        """
+        if images_folder is not None:
+            latest = Path(images_folder)
+            if not latest.is_dir():
+                return None, {}
+        else:
+            with os.scandir(images_dir) as it:
+                folders = [entry for entry in it if entry.is_dir() and not entry.name.startswith('.')]
+            if not folders:
+                return None, {}
+            latest = Path(max(folders, key=lambda entry: entry.stat().st_mtime).path)
+        
+        server_folder = latest / IMAGES_SERVER_FOLDER
+        index = {}
+        if not server_folder.is_dir():
+            return latest, index
+        
+        with os.scandir(server_folder) as dashboards:
+            for dashboard in dashboards:
+                if not dashboard.is_dir():
+                    continue
+                if dashboard_names is not None and dashboard.name not in dashboard_names:
+                    continue
+                files = {'png': [], 'series': [], 'empty': [], 'invalid': []}
+                with os.scandir(dashboard.path) as panels:
+                    for panel in panels:
+                        if not panel.is_file():
+                            continue
+                        if panel.stat().st_size == 0:
+                            files['empty'].append(panel.name)
+                            continue
+                        if panel.name.endswith(SERIES_SUFFIX):
+                            files['series'].append(panel.name)
+                            continue
+                        with open(panel.path, 'rb') as f:
+                            is_png = f.read(len(PNG_SIGNATURE)) == PNG_SIGNATURE
+                        if not is_png or not panel.name.lower().endswith('.png'):
+                            files['invalid'].append(panel.name)
+                        else:
+                            files['png'].append(panel.name)
+                index[dashboard.name] = files
+        return latest, index
+    
+    def _validate_images_tree(self, images_dir: Path = IMAGES_DIR, server_names=None, images_folder=None):
+        """활성 그룹의 서버/대시보드 매핑을 최신 이미지 폴더와 대조
+        
+        server_names: 주어지면 해당 서버만 점검 (--group/--server 선택 생성)
+        images_folder: 주어지면 최신 폴더 대신 이 폴더를 점검 (여러 달 일괄 생성)
+        
+        서버 폴더가 없거나 비어 있으면 경고로 남기고 missing_image_servers에 추가
+        (output_settings.strict_images_check가 true이면 오류)
+        """
+        print("\n📂 5단계: 이미지 폴더 사전 점검")
+        started = time.perf_counter()
+        
+        if not images_dir.is_dir():
+            self._add_error(ConfigError(
+                file_path=str(images_dir),
+                error_type="IMAGES_DIR_MISSING",
+                message="images 폴더가 없습니다",
+                solution="runall.bat을 실행하여 그라파나 이미지를 먼저 다운로드하세요"
+            ))
+            return
+        
+        if server_names is not None:
+            server_names = set(server_names)
+        latest, index = self._index_images_tree(images_dir, server_names, images_folder)
+        if latest is None:
+            self._add_error(ConfigError(
+                file_path=str(images_folder or images_dir),
+                error_type="NO_IMAGE_DOWNLOADS",
+                message="다운로드된 이미지 폴더가 없습니다",
+                solution="runall.bat을 실행하여 그라파나 이미지를 먼저 다운로드하세요"
+            ))
+            return
+        
+        server_folder = latest / IMAGES_SERVER_FOLDER
+        if not index:
+            self._add_error(ConfigError(
+                file_path=str(server_folder),
+                error_type="IMAGES_SERVER_FOLDER_MISSING",
+                message=f"{IMAGES_SERVER_FOLDER} 폴더가 없거나 비어 있습니다",
+                solution="다운로드 로그에서 그라파나 연결 오류를 확인하세요"
+            ))
+            return
+        
+        dashboards = self.config.get('dashboards', {})
+        output_settings = self.config.get('output_settings', {})
+        report_server_issue = self._add_error if output_settings.get('strict_images_check') else self._add_warning
+        checked = set()
+        for group_name, group_info in self.config.get('groups', {}).items():
+            if not group_info.get('active', True):
+                continue
+            for server_name in group_info.get('servers', []):
+                if server_name in checked or (server_names is not None and server_name not in server_names):
+                    continue
+                checked.add(server_name)
+                
+                if server_name not in index:
+                    self.missing_image_servers.add(server_name)
+                    report_server_issue(ConfigError(
+                        file_path=str(server_folder),
+                        error_type="DASHBOARD_IMAGES_MISSING",
+                        message=f"그룹 '{group_name}'의 서버 '{server_name}' 이미지 폴더가 없습니다",
+                        solution="그라파나 대시보드 이름과 그룹의 서버 이름이 정확히 일치하는지 확인하세요",
+                        example=f"존재하는 대시보드 폴더: {', '.join(sorted(index)[:10])}"
+                    ))
+                elif not index[server_name]['png'] and not index[server_name]['series']:
+                    self.missing_image_servers.add(server_name)
+                    report_server_issue(ConfigError(
+                        file_path=str(server_folder / server_name),
+                        error_type="EMPTY_DASHBOARD_FOLDER",
+                        message=f"서버 '{server_name}' 대시보드 폴더에 PNG 이미지나 시계열 파일이 없습니다",
+                        solution="그라파나에서 해당 대시보드 패널이 정상 렌더링되는지 확인 후 다시 다운로드하세요"
+                    ))
+        
+        for dashboard_name in dashboards:
+            if server_names is not None and dashboard_name not in server_names:
+                continue
+            if dashboard_name not in index and dashboard_name not in checked:
+                self._add_warning(ConfigError(
+                    file_path=str(server_folder),
+                    error_type="MAPPED_DASHBOARD_IMAGES_MISSING",
+                    message=f"dashboards에 정의된 '{dashboard_name}' 이미지 폴더가 없습니다",
+                    solution="대시보드 이름을 확인하거나 사용하지 않는 매핑은 제거하세요"
+                ))
+        
+        for dashboard_name, files in sorted(index.items()):
+            for filename in files['empty']:
+                self._add_warning(ConfigError(
+                    file_path=str(server_folder / dashboard_name / filename),
+                    error_type="EMPTY_IMAGE_FILE",
+                    message=f"크기가 0인 이미지 파일: {dashboard_name}/{filename}",
+                    solution="해당 패널을 다시 다운로드하세요"
+                ))
+            for filename in files['invalid']:
+                self._add_warning(ConfigError(
+                    file_path=str(server_folder / dashboard_name / filename),
+                    error_type="INVALID_IMAGE_FILE",
+                    message=f"PNG가 아닌 파일: {dashboard_name}/{filename}",
+                    solution="렌더러 오류 응답이 저장되었을 수 있습니다. 그라파나 이미지 렌더러 상태를 확인하세요"
+                ))
+        
+        elapsed = (time.perf_counter() - started) * 1000
+        total_files = sum(len(files['png']) for files in index.values())
+        total_series = sum(len(files['series']) for files in index.values())
+        series_note = f", 시계열 {total_series}개" if total_series else ""
+        print(f"  📁 {latest.name}: 대시보드 {len(index)}개, 이미지 {total_files}개{series_note} 점검 ({elapsed:.0f} ms)")
+    
     def _is_valid_url_format(self, url: str) -> bool:
         """URL 형식 검증"""
         # 기본적인 IP:PORT 또는 domain:PORT 형식 확인
@@ -658,11 +1116,33 @@ class UnifiedConfigValidator:
     }}
 }}'''
 
+def load_validated_config(use_cache: bool = True, check_images: bool = False):
+    """검증을 통과한 통합 설정 객체 반환 (오류가 있으면 None)
+    
+    리포트 생성기 등에서 같은 프로세스 안에서 검증과 로드를 한 번에 처리할 때 사용합니다.
+    """
+    validator = UnifiedConfigValidator()
+    if not validator.validate_all(use_cache=use_cache, check_images=check_images):
+        return None
+    return validator.config
+
+def check_images_tree(config, server_names=None, images_folder=None) -> Tuple[bool, Set[str]]:
+    """검증된 설정 객체 기준 이미지 폴더 사전 점검만 실행 → (통과 여부, 이미지 폴더가 없거나 빈 서버)
+    
+    server_names: 점검할 서버 목록, images_folder: 점검할 이미지 폴더 (기본: 최신 폴더)
+    """
+    validator = UnifiedConfigValidator()
+    validator.config = config
+    validator._validate_images_tree(server_names=server_names, images_folder=images_folder)
+    if validator.errors or validator.warnings:
+        validator._print_detailed_report()
+    return len(validator.errors) == 0, validator.missing_image_servers
+
 # 메인 실행 함수
-def main():
+def main(use_cache: bool = True, check_images: bool = False):
     """메인 검증 실행"""
     validator = UnifiedConfigValidator()
-    success = validator.validate_all()
+    success = validator.validate_all(use_cache=use_cache, check_images=check_images)
     
     if not success:
         print(f"\n 통합 설정 파일에 오류가 발견되었습니다!")
@@ -692,6 +1172,7 @@ if __name__ == "__main__":
     # 예시 파일 확인
     check_example_file()
     
-    # 검증 실행
-    success = main()
+    # 검증 실행 (--no-cache: 이전 검증 결과를 무시하고 전체 검증, --check-images: 이미지 폴더 사전 점검)
+    success = main(use_cache="--no-cache" not in sys.argv[1:],
+                   check_images="--check-images" in sys.argv[1:])
     sys.exit(0 if success else 1)
\ No newline at end of file
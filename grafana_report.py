@@ -0,0 +1,387 @@
+# grafana_report.py - 그라파나 리포트 통합 명령행 도구
+"""검증/다운로드/생성/PDF 변환을 하나의 명령으로 실행합니다.
+
+사용법:
+    python grafana_report.py validate [--no-cache] [--check-images]
+    python grafana_report.py download [--no-cas]
+    python grafana_report.py cas [폴더 ...] [--gc]
+    python grafana_report.py fetch-series [--url HOST:PORT] [--into 폴더]
+    python grafana_report.py stats [--url HOST:PORT] [--rebuild-history]
+    python grafana_report.py generate [--watch]
+    python grafana_report.py run [--url HOST:PORT] [--render panel|dashboard] [--workers 4] [--resume [폴더]] [--no-cas]
+    python grafana_report.py pdf [리포트.html ...]
+    python grafana_report.py check-startup [--budget-ms 100] [--wall-budget-ms 150]
+
+각 하위 명령은 필요한 모듈만 실행 시점에 import 합니다.
+(Pillow, WeasyPrint, ReportLab 같은 무거운 패키지는 해당 명령에서만 로드)
+"""
+import argparse
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent
+ENV_FILE = PROJECT_ROOT / ".env"
+GENERATOR_SCRIPT = PROJECT_ROOT / "02_generate_report_unified.py"
+DOWNLOAD_SCRIPT = PROJECT_ROOT / "01_download_images.ps1"
+
+# validate 같은 빠른 명령의 시작 시간 예산 (ms) - import 시간, 빈 인터프리터 대비 실제 실행 시간
+STARTUP_BUDGET_MS = 100
+STARTUP_WALL_BUDGET_MS = 150
+# 빠른 명령 경로에서 import 되면 안 되는 무거운 패키지
+HEAVY_MODULES = ('PIL', 'numpy', 'weasyprint', 'reportlab')
+
+
+def load_generator():
+    """02_generate_report_unified.py 모듈 로드 (파일명이 숫자로 시작하여 일반 import 불가)"""
+    import importlib.util
+    spec = importlib.util.spec_from_file_location("generate_report_unified", GENERATOR_SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def cmd_validate(args):
+    """설정 파일 검증"""
+    import enhanced_config_validator as validator
+    validator.check_example_file()
+    return validator.main(use_cache=not args.no_cache, check_images=args.check_images)
+
+
+def cmd_download(args):
+    """그라파나 이미지 다운로드 (01_download_images.ps1 실행 후 새 폴더를 이미지 저장소에 추가)"""
+    import subprocess
+    cmd = ["powershell", "-ExecutionPolicy", "RemoteSigned", "-File", str(DOWNLOAD_SCRIPT)]
+    try:
+        success = subprocess.run(cmd, cwd=PROJECT_ROOT).returncode == 0
+    except FileNotFoundError:
+        print("❌ PowerShell을 찾을 수 없습니다. Windows 환경에서 실행하세요.")
+        return False
+    if success and not args.no_cas:
+        from report_cas import image_trees
+        trees = image_trees(PROJECT_ROOT / "images")
+        if trees:
+            add_to_image_store(PROJECT_ROOT / "images", [max(trees, key=lambda tree: tree.stat().st_mtime)])
+    return success
+
+
+def add_to_image_store(images_dir, trees, workers=8):
+    """시각 폴더의 PNG를 images/.cas 저장소 하드링크로 교체하고 결과 출력"""
+    from report_cas import ImageStore
+    store = ImageStore(images_dir, workers=workers)
+    for tree in trees:
+        linked, duplicates, saved, failed = store.add_tree(tree)
+        print(f"  📦 {tree.name}: PNG {linked}개, 저장소에 이미 있는 이미지 {duplicates}개 "
+              f"({saved / (1024 * 1024):.1f} MB 절약)" + (f", 링크 실패 {failed}개" if failed else ""))
+    blobs, size = store.usage()
+    print(f"✅ 이미지 저장소: {blobs}개 파일, {size / (1024 * 1024):.1f} MB")
+    return store
+
+
+def cmd_cas(args):
+    """다운로드 이미지 중복 제거 (images/.cas 하드링크 저장소) / 참조 없는 파일 정리"""
+    from report_cas import IMAGES_DIR, ImageStore, image_trees
+    if args.gc:
+        removed, freed = ImageStore(IMAGES_DIR).gc()
+        print(f"✅ 이미지 저장소 정리: {removed}개 파일 삭제 ({freed / (1024 * 1024):.1f} MB 확보)")
+        return True
+
+    trees = [Path(folder) for folder in args.folders] or image_trees(IMAGES_DIR)
+    missing = [str(tree) for tree in trees if not tree.is_dir()]
+    if missing:
+        print(f"❌ 폴더를 찾을 수 없습니다: {', '.join(missing)}")
+        return False
+    if not trees:
+        print("❌ images 폴더에 다운로드된 이미지가 없습니다.")
+        return False
+    add_to_image_store(IMAGES_DIR, trees, workers=args.workers)
+    return True
+
+
+def load_env_file(path=ENV_FILE):
+    """.env 파일의 KEY=VALUE 항목 읽기 (01_download_images.ps1과 같은 규칙)"""
+    values = {}
+    if path.exists():
+        for line in path.read_text(encoding='utf-8').splitlines():
+            if line.strip() and not line.lstrip().startswith('#') and '=' in line:
+                name, value = line.split('=', 1)
+                values[name.strip()] = value.strip().strip('"').strip("'")
+    return values
+
+
+def prepare_grafana_command():
+    """그라파나 API 명령 공통 준비 → (검증된 설정, 토큰), 실패 시 None"""
+    import os
+    import logging
+    from enhanced_config_validator import load_validated_config
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        print("❌ NumPy가 설치되지 않았습니다: pip install -r requirements.txt")
+        return None
+
+    unified_config = load_validated_config()
+    if not unified_config:
+        return None
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    token = os.environ.get("GRAFANA_PRODUCTION_TOKEN") or load_env_file().get("GRAFANA_PRODUCTION_TOKEN")
+    if not token:
+        print("❌ GRAFANA_PRODUCTION_TOKEN이 설정되지 않았습니다 (.env 파일 확인)")
+        return None
+    return unified_config, token
+
+
+def cmd_fetch_series(args):
+    """패널 원시 시계열 조회 (데이터 기반 SVG 차트 모드)"""
+    prepared = prepare_grafana_command()
+    if not prepared:
+        return False
+    unified_config, token = prepared
+    from report_series import download_series
+
+    settings = unified_config.get('output_settings', {})
+    total, succeeded = download_series(
+        unified_config, token,
+        url=args.url,
+        target_folder=Path(args.into) if args.into else None,
+        max_data_points=args.max_data_points,
+        buckets=settings.get('svg_width', 800)
+    )
+    return total > 0 and succeeded == total
+
+
+def cmd_stats(args):
+    """이번 달 서버 요약 통계 계산 (가용률/CPU/메모리/임계치 초과)"""
+    if args.rebuild_history:
+        from report_stats import STATS_DIR
+        from report_history import rebuild_history
+        months = rebuild_history(STATS_DIR)
+        print(f"✅ 지표 이력 재구성: {', '.join(months) or '통계 파일 없음'}")
+        return True
+
+    prepared = prepare_grafana_command()
+    if not prepared:
+        return False
+    unified_config, token = prepared
+    from report_series import GrafanaClient
+    from report_stats import compute_server_stats
+
+    grafana_servers = unified_config.get('grafana_servers', [])
+    url = args.url or (grafana_servers[0]['url'] if grafana_servers else None)
+    if not url:
+        print("❌ grafana_servers에 그라파나 주소가 없습니다")
+        return False
+
+    client = GrafanaClient(url, token)
+    if not client.test_connection():
+        return False
+    try:
+        path = compute_server_stats(unified_config, client)
+    except Exception as e:
+        print(f"❌ 서버 통계 계산 실패: {e}")
+        return False
+    print(f"✅ 서버 통계 저장: {path}")
+    return True
+
+
+def cmd_generate(args):
+    """HTML 리포트 생성"""
+    return load_generator().main(args.generator_args)
+
+
+def cmd_run(args):
+    """다운로드와 리포트 생성을 겹쳐 실행 (파이프라인 모드, 다운로드는 파이썬 구현 사용)"""
+    prepared = prepare_grafana_command()
+    if not prepared:
+        return False
+    unified_config, token = prepared
+    resume_folder = None
+    if args.resume is not None:
+        from report_download import find_resume_folder
+        resume_folder = Path(args.resume) if args.resume else find_resume_folder()
+        if resume_folder is None or not resume_folder.is_dir():
+            print("❌ 이어받을 다운로드 폴더가 없습니다 (download_journal.jsonl이 있고 끝나지 않은 images 폴더)")
+            return False
+    success, images_folder = load_generator().run_pipeline_mode(
+        token, unified_config,
+        url=args.url,
+        download_workers=args.workers,
+        queue_size=args.queue_size,
+        render_strategy=args.render,
+        resume_folder=resume_folder
+    )
+    if images_folder and images_folder.is_dir() and not args.no_cas:
+        add_to_image_store(images_folder.parent, [images_folder])
+    return success
+
+
+def cmd_pdf(args):
+    """HTML 리포트를 PDF로 변환 (WeasyPrint)"""
+    try:
+        from weasyprint import HTML
+    except ImportError:
+        print("❌ WeasyPrint가 설치되지 않았습니다: pip install -r requirements.txt")
+        return False
+
+    if args.reports:
+        reports = [Path(report) for report in args.reports]
+    else:
+        from preview_server import build_report_index
+        output_dir = Path("output")
+        reports = [output_dir / entry['file'] for entry in build_report_index(output_dir)] if output_dir.is_dir() else []
+
+    if not reports:
+        print("❌ 변환할 리포트가 없습니다. 먼저 generate를 실행하세요.")
+        return False
+
+    success = True
+    for report in reports:
+        pdf_path = report.with_suffix('.pdf')
+        try:
+            HTML(filename=str(report)).write_pdf(str(pdf_path))
+            print(f"✅ PDF 생성: {pdf_path} ({pdf_path.stat().st_size / (1024 * 1024):.1f} MB)")
+        except Exception as e:
+            print(f"❌ PDF 변환 실패 ({report.name}): {e}")
+            success = False
+    return success
+
+
+def parse_importtime(stderr):
+    """-X importtime 출력 → (최상위 import 누적 ms, 무거운 모듈 목록)"""
+    total_us = 0
+    heavy = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        try:
+            _, cumulative, name = line.split("|", 2)
+            cumulative_us = int(cumulative.strip())
+        except ValueError:
+            continue  # 헤더 행
+        module = name.rstrip()
+        if not module.startswith("  "):
+            total_us += cumulative_us  # 최상위 import만 합산 (하위는 누적값에 포함)
+        if module.strip().split(".")[0] in HEAVY_MODULES:
+            heavy.append(module.strip())
+    return total_us / 1000, heavy
+
+
+def measure_startup(cwd=None, runs=3):
+    """실제 'validate --no-cache' 실행의 시작 비용 측정 → (import ms, 실행 ms, 무거운 모듈 목록, 종료 코드)
+
+    import 시간은 python -X importtime 출력으로 (명령 안에서 늦게 import 하는 모듈 포함),
+    실행 시간은 같은 명령과 빈 인터프리터(python -c pass)의 실행 시간 차이 (각각 runs회 중 최솟값)
+    cwd: 실행할 폴더 (config/unified_config.json 기준, 기본값 현재 폴더)
+    """
+    import subprocess
+    import time
+    command = [sys.executable, str(PROJECT_ROOT / "grafana_report.py"), "validate", "--no-cache"]
+    completed = subprocess.run([sys.executable, "-X", "importtime"] + command[1:], cwd=cwd,
+                               capture_output=True, text=True)
+    import_ms, heavy = parse_importtime(completed.stderr)
+
+    def best_of(cmd):
+        timings = []
+        for _ in range(runs):
+            started = time.perf_counter()
+            subprocess.run(cmd, cwd=cwd, capture_output=True)
+            timings.append(time.perf_counter() - started)
+        return min(timings) * 1000
+
+    wall_ms = best_of(command) - best_of([sys.executable, "-c", "pass"])
+    return import_ms, wall_ms, heavy, completed.returncode
+
+
+def cmd_check_startup(args):
+    """빠른 명령의 시작 시간 예산 확인"""
+    import_ms, wall_ms, heavy, _ = measure_startup()
+    print(f"validate import 시간: {import_ms:.1f} ms (예산 {args.budget_ms} ms)")
+    print(f"validate 실행 시간 (빈 인터프리터 제외): {wall_ms:.1f} ms (예산 {args.wall_budget_ms} ms)")
+    if heavy:
+        print(f"❌ 무거운 모듈이 import 되었습니다: {', '.join(sorted(set(heavy)))}")
+        return False
+    if import_ms > args.budget_ms or wall_ms > args.wall_budget_ms:
+        print("❌ 시작 시간 예산을 초과했습니다.")
+        return False
+    print("✅ 시작 시간 예산 이내")
+    return True
+
+
+def build_parser():
+    """명령행 인자 정의"""
+    parser = argparse.ArgumentParser(prog="grafana_report", description="그라파나 월간 리포트 도구")
+    subparsers = parser.add_subparsers(dest="command", metavar="<command>")
+    subparsers.required = True
+
+    validate = subparsers.add_parser("validate", help="설정 파일 검증")
+    validate.add_argument("--no-cache", action="store_true", help="이전 검증 결과를 무시하고 전체 검증")
+    validate.add_argument("--check-images", action="store_true", help="최신 이미지 폴더 사전 점검 포함")
+    validate.set_defaults(handler=cmd_validate)
+
+    download = subparsers.add_parser("download", help="그라파나 이미지 다운로드")
+    download.add_argument("--no-cas", action="store_true", help="다운로드한 이미지를 images/.cas 저장소에 추가하지 않음")
+    download.set_defaults(handler=cmd_download)
+    
+    cas = subparsers.add_parser("cas", help="이미지 폴더 중복 제거 (images/.cas 하드링크 저장소)")
+    cas.add_argument("folders", nargs="*", help="추가할 시각 폴더 (기본: images 아래 모든 폴더)")
+    cas.add_argument("--gc", action="store_true", help="어느 폴더에서도 쓰지 않는 저장소 파일 삭제")
+    cas.add_argument("--workers", type=int, default=8, help="해시 계산 스레드 수 (기본 8)")
+    cas.set_defaults(handler=cmd_cas)
+
+    fetch = subparsers.add_parser("fetch-series", help="패널 원시 시계열 조회 (chart_mode: svg)")
+    fetch.add_argument("--url", help="그라파나 주소 (기본: grafana_servers의 url)")
+    fetch.add_argument("--into", metavar="FOLDER",
+                       help="저장할 이미지 폴더 (예: images/20250601_000000, 기본: 새 타임스탬프 폴더)")
+    fetch.add_argument("--max-data-points", type=int, default=2400,
+                       help="패널별 그라파나 조회 최대 점 수 (기본 2400)")
+    fetch.set_defaults(handler=cmd_fetch_series)
+
+    stats = subparsers.add_parser("stats", help="서버 요약 통계 계산 (summary/availability 자동 채움)")
+    stats.add_argument("--url", help="그라파나 주소 (기본: grafana_servers 첫 번째 url)")
+    stats.add_argument("--rebuild-history", action="store_true",
+                       help="조회 없이 stats/*.json으로 월별 지표 이력(stats/history.sqlite3) 재구성")
+    stats.set_defaults(handler=cmd_stats)
+
+    generate = subparsers.add_parser("generate", help="HTML 리포트 생성 (나머지 인자는 생성기에 그대로 전달)")
+    generate.add_argument("generator_args", nargs="*", help="예: --watch, --group 메일시스템")
+    generate.set_defaults(handler=cmd_generate)
+
+    run = subparsers.add_parser("run", help="다운로드와 리포트 생성을 겹쳐 실행 (파이프라인 모드)")
+    run.add_argument("--url", help="그라파나 주소 (기본: grafana_servers의 url)")
+    run.add_argument("--render", choices=("panel", "dashboard"), default="panel",
+                     help="panel: 패널마다 렌더링 (기본), dashboard: 대시보드 한 번 렌더링 후 패널별로 자름")
+    run.add_argument("--workers", type=int, default=4, help="동시 렌더링 요청 수 (기본 4)")
+    run.add_argument("--queue-size", type=int, default=64,
+                     help="생성기로 넘기기 전 대기할 수 있는 완료 패널 수 (기본 64)")
+    run.add_argument("--resume", nargs="?", const="", metavar="FOLDER",
+                     help="중단된 다운로드 이어받기 - 없거나 실패한 패널만 다시 받음 (기본: 가장 최근 다운로드 폴더)")
+    run.add_argument("--no-cas", action="store_true", help="다운로드한 이미지를 images/.cas 저장소에 추가하지 않음")
+    run.set_defaults(handler=cmd_run)
+
+    pdf = subparsers.add_parser("pdf", help="HTML 리포트를 PDF로 변환 (기본: 그룹별 최신 리포트)")
+    pdf.add_argument("reports", nargs="*", help="변환할 HTML 파일")
+    pdf.set_defaults(handler=cmd_pdf)
+
+    check = subparsers.add_parser("check-startup", help="빠른 명령의 시작 시간 예산 확인 (-X importtime)")
+    check.add_argument("--budget-ms", type=float, default=STARTUP_BUDGET_MS, help="허용 import 시간(ms)")
+    check.add_argument("--wall-budget-ms", type=float, default=STARTUP_WALL_BUDGET_MS,
+                       help="허용 실행 시간(ms, 빈 인터프리터 시작 시간 제외)")
+    check.set_defaults(handler=cmd_check_startup)
+
+    return parser
+
+
+def main(argv=None):
+    """메인 실행 함수"""
+    parser = build_parser()
+    # generate의 --옵션은 생성기(02_generate_report_unified.py)에서 해석
+    args, extra = parser.parse_known_args(argv)
+    if extra and args.command != "generate":
+        parser.error(f"알 수 없는 인자: {' '.join(extra)}")
+    if args.command == "generate":
+        args.generator_args = (argv if argv is not None else sys.argv[1:])[1:]
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
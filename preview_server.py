@@ -0,0 +1,347 @@
+# preview_server.py - output 폴더 리포트 미리보기 서버
+"""생성된 리포트를 내부망에서 검토하기 위한 미리보기 서버
+
+사용법:
+    python preview_server.py                  # http://127.0.0.1:8000/
+    python preview_server.py --bind 0.0.0.0 --port 8080
+
+- 내용 해시 기반 강한 ETag: 바뀌지 않은 리포트는 304 응답 하나로 끝납니다
+- .html.gz / .html.br 사전 압축본이 있으면 Accept-Encoding에 맞춰 그대로 전송
+- Range 요청 지원 (대용량 리포트 이어받기)
+- / 에서 그룹별 최신 버전 리포트 목록 제공 (/index.json 은 JSON 형식, output/catalog.sqlite3 기준)
+- 리포트/에셋 확장자만 제공 (카탈로그, 다운로드 저널 등 내부 파일은 404)
+"""
+import argparse
+import hashlib
+import html
+import json
+import logging
+import mimetypes
+import re
+import threading
+from datetime import datetime
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import unquote, urlsplit, quote
+
+from report_catalog import ReportCatalog
+
+# 그룹명_YYYY_MM_YYYYmmdd_HHMMSS[_v001].html (분할 리포트 페이지 _p001 제외)
+REPORT_NAME_PATTERN = re.compile(
+    r'^(?P<group>.+)_(?P<year>\d{4})_(?P<month>\d{2})_(?P<timestamp>\d{8}_\d{6})(?:_v(?P<version>\d{3}))?\.html$'
+)
+
+# Accept-Encoding 우선순위 (앞쪽이 우선)
+ENCODINGS = [('br', '.br'), ('gzip', '.gz')]
+
+# 제공하는 파일 확장자 (리포트, 에셋, PDF, 아카이브 - 사전 압축본은 원본 확장자로 판단)
+SERVED_SUFFIXES = {'.html', '.css', '.js', '.png', '.jpg', '.jpeg', '.webp', '.gif', '.svg', '.ico',
+                   '.pdf', '.zip', '.zst'}
+
+
+def setup_logging():
+    """로깅 설정"""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[logging.StreamHandler()]
+    )
+
+
+class ETagCache:
+    """파일 내용 해시 캐시 (크기/수정시각이 바뀐 경우에만 다시 계산)"""
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, path):
+        stat = path.stat()
+        key = (stat.st_size, stat.st_mtime_ns)
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry and entry[0] == key:
+                return entry[1]
+
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(chunk)
+        etag = f'"{digest.hexdigest()[:32]}"'
+
+        with self._lock:
+            self._entries[path] = (key, etag)
+        return etag
+
+
+def parse_accept_encoding(header):
+    """Accept-Encoding 헤더 → {코딩: q값} ('gzip;q=0', 'gzip; q=0.0' 처럼 q가 0이면 거부, 형식 오류 q는 0)"""
+    weights = {}
+    for token in (header or '').split(','):
+        coding, *params = [part.strip() for part in token.split(';')]
+        if not coding:
+            continue
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    q = float(value.strip())
+                except ValueError:
+                    q = 0.0
+        weights[coding.lower()] = q
+    return weights
+
+
+def encoding_accepted(weights, encoding):
+    """명시된 코딩이 없으면 '*'의 q값을 따름"""
+    return weights.get(encoding, weights.get('*', 0.0)) > 0
+
+
+def build_report_index(root):
+    """그룹별 최신 버전 리포트 목록 [{group, month, file, size, modified}, ...]
+
+    output/catalog.sqlite3 가 있으면 카탈로그에서 읽고, 카탈로그 이전에 만든 폴더만 파일명을 훑어 찾음
+    """
+    catalog = ReportCatalog(root)
+    if catalog.path.is_file():
+        return [
+            {'group': group, 'month': month, 'file': filename, 'size': size, 'modified': created[:19]}
+            for filename, group, month, created, size in catalog.latest()
+        ]
+
+    latest = {}
+    for entry in root.iterdir():
+        match = REPORT_NAME_PATTERN.match(entry.name)
+        if not match or not entry.is_file():
+            continue
+        rank = (match['year'], match['month'], match['timestamp'], int(match['version'] or 0))
+        group = match['group']
+        if group not in latest or rank > latest[group][0]:
+            latest[group] = (rank, entry, match)
+
+    reports = []
+    for group in sorted(latest):
+        _, entry, match = latest[group]
+        stat = entry.stat()
+        reports.append({
+            'group': group,
+            'month': f"{match['year']}. {match['month']}",
+            'file': entry.name,
+            'size': stat.st_size,
+            'modified': datetime.fromtimestamp(stat.st_mtime).strftime('%Y-%m-%d %H:%M:%S')
+        })
+    return reports
+
+
+def render_index_page(reports):
+    """최신 리포트 목록 HTML"""
+    rows = "".join(
+        f'<tr><td>{html.escape(r["group"])}</td><td>{r["month"]}</td>'
+        f'<td><a href="/{quote(r["file"])}">{html.escape(r["file"])}</a></td>'
+        f'<td style="text-align:right">{r["size"] / (1024 * 1024):.1f} MB</td><td>{r["modified"]}</td></tr>'
+        for r in reports
+    )
+    return (
+        '<!DOCTYPE html><html lang="ko"><head><meta charset="UTF-8"><title>리포트 미리보기</title>'
+        '<style>body{font-family:"Malgun Gothic",sans-serif;margin:2rem}table{border-collapse:collapse}'
+        'th,td{border:1px solid #dee2e6;padding:.5rem .75rem}th{background:#f8f9fa}</style></head><body>'
+        '<h1>그룹별 최신 리포트</h1><table><tr><th>그룹</th><th>월</th><th>파일</th><th>크기</th><th>생성 시각</th></tr>'
+        f'{rows}</table></body></html>'
+    )
+
+
+class PreviewRequestHandler(BaseHTTPRequestHandler):
+    """ETag/사전 압축본/Range를 지원하는 정적 파일 핸들러"""
+
+    server_version = "GrafanaReportPreview/1.0"
+    protocol_version = "HTTP/1.1"
+    root = Path("output")
+    etags = ETagCache()
+
+    def log_message(self, format, *args):
+        logging.info(f"{self.address_string()} - {format % args}")
+
+    def do_HEAD(self):
+        self.handle_request(send_body=False)
+
+    def do_GET(self):
+        self.handle_request(send_body=True)
+
+    def handle_request(self, send_body):
+        request_path = unquote(urlsplit(self.path).path)
+
+        if request_path in ('/', '/index.html'):
+            body = render_index_page(build_report_index(self.root)).encode('utf-8')
+            return self.send_bytes(body, 'text/html; charset=utf-8', send_body)
+        if request_path == '/index.json':
+            body = json.dumps(build_report_index(self.root), ensure_ascii=False, indent=2).encode('utf-8')
+            return self.send_bytes(body, 'application/json; charset=utf-8', send_body)
+
+        path = self.resolve_path(request_path)
+        if path is None:
+            return self.send_error(HTTPStatus.NOT_FOUND)
+
+        self.send_file(path, send_body)
+
+    def resolve_path(self, request_path):
+        """요청 경로를 output 폴더 내부 파일로 변환 (폴더 밖 접근, 제공 대상이 아닌 확장자 차단)"""
+        root = self.root.resolve()
+        try:
+            path = (root / request_path.lstrip('/')).resolve()
+            path.relative_to(root)
+        except (ValueError, OSError):
+            return None
+        name = path.name
+        for _, suffix in ENCODINGS:
+            name = name[:-len(suffix)] if name.endswith(suffix) else name
+        if Path(name).suffix.lower() not in SERVED_SUFFIXES:
+            return None
+        return path if path.is_file() else None
+
+    def select_variant(self, path):
+        """Accept-Encoding에 맞는 표현 선택 → (파일 경로, 콘텐츠 이름, Content-Encoding)
+
+        콘텐츠 이름은 Content-Type을 정할 파일명. 사전 압축본(.html.gz)을 직접 요청하면
+        클라이언트가 그 코딩을 받을 때만 원본 형식 + Content-Encoding으로 보내고, 아니면 압축 파일 그대로 보냄
+        """
+        weights = parse_accept_encoding(self.headers.get('Accept-Encoding'))
+        for encoding, suffix in ENCODINGS:
+            if path.name.endswith(suffix):
+                if encoding_accepted(weights, encoding):
+                    return path, path.name[:-len(suffix)], encoding
+                return path, path.name, None
+        for encoding, suffix in ENCODINGS:
+            variant = path.with_name(path.name + suffix)
+            if encoding_accepted(weights, encoding) and variant.is_file():
+                return variant, path.name, encoding
+        return path, path.name, None
+
+    def parse_range(self, size):
+        """단일 bytes 범위 해석 → (start, end) / None(전체) / False(범위 오류)"""
+        header = self.headers.get('Range')
+        if not header:
+            return None
+
+        if_range = self.headers.get('If-Range')
+        if if_range and if_range != self._etag:
+            return None
+
+        match = re.fullmatch(r'bytes=(\d*)-(\d*)', header.strip())
+        if not match or (not match.group(1) and not match.group(2)):
+            return None  # 다중 범위 등은 전체 전송으로 처리
+
+        if match.group(1):
+            start = int(match.group(1))
+            end = int(match.group(2)) if match.group(2) else size - 1
+        else:
+            start = max(0, size - int(match.group(2)))
+            end = size - 1
+
+        if start >= size or start > end:
+            return False
+        return start, min(end, size - 1)
+
+    def send_file(self, path, send_body):
+        file_path, content_name, encoding = self.select_variant(path)
+        etag = self.etags.get(file_path)
+        if encoding:
+            # 표현(representation)마다 다른 강한 ETag
+            etag = f'{etag[:-1]}-{encoding}"'
+        self._etag = etag
+
+        if_none_match = self.headers.get('If-None-Match')
+        if if_none_match and (if_none_match.strip() == '*' or etag in [t.strip() for t in if_none_match.split(',')]):
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_common_headers(etag, encoding)
+            self.end_headers()
+            return
+
+        size = file_path.stat().st_size
+        byte_range = self.parse_range(size)
+        if byte_range is False:
+            self.send_response(HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE)
+            self.send_header('Content-Range', f'bytes */{size}')
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        start, end = byte_range if byte_range else (0, size - 1)
+        length = end - start + 1 if size else 0
+
+        self.send_response(HTTPStatus.PARTIAL_CONTENT if byte_range else HTTPStatus.OK)
+        content_type, file_encoding = mimetypes.guess_type(content_name)
+        if file_encoding and not encoding:
+            # 압축 파일 자체를 내려받는 경우 (.gz/.br을 받지 않는 클라이언트)
+            content_type = {'gzip': 'application/gzip', 'br': 'application/x-brotli'}.get(file_encoding)
+        content_type = content_type or 'application/octet-stream'
+        if content_type.startswith('text/'):
+            content_type += '; charset=utf-8'
+        self.send_header('Content-Type', content_type)
+        self.send_common_headers(etag, encoding)
+        self.send_header('Content-Length', str(length))
+        if byte_range:
+            self.send_header('Content-Range', f'bytes {start}-{end}/{size}')
+        self.end_headers()
+
+        if not send_body or not length:
+            return
+        with open(file_path, 'rb') as f:
+            f.seek(start)
+            remaining = length
+            while remaining > 0:
+                chunk = f.read(min(1024 * 1024, remaining))
+                if not chunk:
+                    break
+                self.wfile.write(chunk)
+                remaining -= len(chunk)
+
+    def send_common_headers(self, etag, encoding):
+        self.send_header('ETag', etag)
+        self.send_header('Accept-Ranges', 'bytes')
+        self.send_header('Vary', 'Accept-Encoding')
+        # 매번 재검증하되 변경이 없으면 304로 끝남
+        self.send_header('Cache-Control', 'no-cache')
+        if encoding:
+            self.send_header('Content-Encoding', encoding)
+
+    def send_bytes(self, body, content_type, send_body):
+        self.send_response(HTTPStatus.OK)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Cache-Control', 'no-cache')
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+
+
+def main():
+    """미리보기 서버 실행"""
+    parser = argparse.ArgumentParser(description="리포트 미리보기 서버")
+    parser.add_argument("--bind", default="127.0.0.1", help="바인드 주소 (기본 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8000, help="포트 (기본 8000)")
+    parser.add_argument("--dir", default="output", help="제공할 폴더 (기본 output)")
+    args = parser.parse_args()
+
+    setup_logging()
+    root = Path(args.dir)
+    if not root.is_dir():
+        logging.error(f"폴더를 찾을 수 없습니다: {root}")
+        return False
+
+    PreviewRequestHandler.root = root
+    server = ThreadingHTTPServer((args.bind, args.port), PreviewRequestHandler)
+    logging.info(f"미리보기 서버 시작: http://{args.bind}:{args.port}/ ({root.resolve()})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        logging.info("미리보기 서버 종료")
+    finally:
+        server.server_close()
+    return True
+
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(0 if main() else 1)
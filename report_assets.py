@@ -0,0 +1,140 @@
+# report_assets.py - 템플릿/CSS 에셋 빌드 단계
+import re
+import hashlib
+import logging
+from pathlib import Path
+
+ASSET_CACHE_DIR = Path("cache/assets")
+# 압축 규칙이 바뀌면 올림 (이전 규칙으로 만든 캐시를 쓰지 않도록)
+ASSET_CACHE_VERSION = 3
+
+# 문자열 리터럴("..." / '...')과 주석을 구분하기 위한 토큰 패턴
+_CSS_TOKEN_PATTERN = re.compile(
+    r'("(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\')|(/\*.*?\*/)',
+    re.DOTALL
+)
+
+# HTML 주석과 공백을 그대로 둬야 하는 블록(<pre>/<textarea>/<script>)을 구분하기 위한 토큰 패턴
+# (주석 안의 블록은 주석과 함께 제거, 블록 안의 '<!--'는 유지)
+_HTML_TOKEN_PATTERN = re.compile(
+    r'(<!--.*?-->)|<(pre|textarea|script)\b[^>]*>.*?</\2\s*>',
+    re.DOTALL | re.IGNORECASE
+)
+
+
+def _minify_css_chunk(chunk):
+    """문자열 리터럴이 아닌 CSS 조각 압축 (주석은 이미 제거된 상태)"""
+    chunk = re.sub(r'\s+', ' ', chunk)
+    chunk = re.sub(r'\s*([{};,>])\s*', r'\1', chunk)
+    chunk = re.sub(r':\s+', ':', chunk)
+    chunk = chunk.replace(';}', '}')
+    return chunk
+
+
+def minify_css(css):
+    """CSS 주석 제거 및 공백 압축 (문자열 리터럴은 그대로 유지)"""
+    parts = []
+    pending = []  # 다음 문자열 리터럴 전까지의 코드 (주석 앞뒤 조각을 이어서 한 번에 압축)
+    last_end = 0
+    for match in _CSS_TOKEN_PATTERN.finditer(css):
+        pending.append(css[last_end:match.start()])
+        if match.group(1):
+            parts.append(_minify_css_chunk(''.join(pending)))
+            parts.append(match.group(1))
+            pending = []
+        else:
+            pending.append(' ')
+        last_end = match.end()
+    pending.append(css[last_end:])
+    parts.append(_minify_css_chunk(''.join(pending)))
+
+    return ''.join(parts).strip()
+
+
+def collapse_html_whitespace(html):
+    """템플릿의 주석, 들여쓰기 및 태그 사이 공백 제거 (<pre>/<textarea>/<script> 블록은 그대로 유지)"""
+    preserved = []
+
+    def split_out(match):
+        if match.group(1):
+            return ''
+        preserved.append(match.group(0))
+        return f'<\x00{len(preserved) - 1}\x00>'
+
+    html = _HTML_TOKEN_PATTERN.sub(split_out, html)
+    html = re.sub(r'\s+', ' ', html)
+    html = re.sub(r'>\s+<', '><', html)
+    html = re.sub(r'<\x00(\d+)\x00>', lambda match: preserved[int(match.group(1))], html)
+    return html.strip()
+
+
+def content_hash(text):
+    """텍스트 내용의 sha256 해시 (앞 16자리)"""
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()[:16]
+
+
+class AssetBuilder:
+    """템플릿/CSS 에셋 빌드 및 캐시 관리"""
+
+    def __init__(self, templates_dir="templates", cache_dir=ASSET_CACHE_DIR, minify=True):
+        self.templates_dir = Path(templates_dir)
+        self.cache_dir = Path(cache_dir)
+        self.minify = minify
+        self._css = None
+
+    def _cached(self, kind, source, builder):
+        """원본 해시 기준 디스크 캐시 조회 후 없으면 빌드"""
+        cache_path = self.cache_dir / f"{kind}.v{ASSET_CACHE_VERSION}.{content_hash(source)}"
+        if cache_path.exists():
+            try:
+                return cache_path.read_text(encoding='utf-8')
+            except Exception as e:
+                logging.warning(f"에셋 캐시 읽기 실패 {cache_path}: {e}")
+
+        result = builder(source)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            cache_path.write_text(result, encoding='utf-8')
+        except Exception as e:
+            logging.warning(f"에셋 캐시 저장 실패 {cache_path}: {e}")
+        return result
+
+    def compile_template(self, template_name, source):
+        """템플릿 공백 압축 (원본이 같으면 캐시 사용)"""
+        if not self.minify:
+            return source
+        return self._cached(f"{template_name}.html", source, collapse_html_whitespace)
+
+    def build_css(self):
+        """CSS 로드 및 압축 (프로세스 내 1회만 수행)"""
+        if self._css is not None:
+            return self._css
+
+        css_path = self.templates_dir / "assets" / "style.css"
+        if not css_path.exists():
+            logging.warning(f"CSS 파일 없음: {css_path}")
+            self._css = ""
+            return self._css
+
+        with open(css_path, 'r', encoding='utf-8') as f:
+            source = f.read()
+
+        if self.minify:
+            self._css = self._cached("style.css", source, minify_css)
+            logging.info(f"CSS 압축: {len(source):,} → {len(self._css):,} bytes")
+        else:
+            self._css = source
+        return self._css
+
+    def write_shared_css(self, output_dir):
+        """번들 배포용 공유 스타일 파일 생성 (내용 해시로 파일명 결정)"""
+        css = self.build_css()
+        assets_dir = Path(output_dir) / "assets"
+        assets_dir.mkdir(parents=True, exist_ok=True)
+
+        css_path = assets_dir / f"style.{content_hash(css)[:8]}.css"
+        if not css_path.exists():
+            with open(css_path, 'w', encoding='utf-8') as f:
+                f.write(css)
+            logging.info(f"공유 스타일 파일 생성: {css_path}")
+        return css_path
@@ -0,0 +1,160 @@
+# report_cas.py - 다운로드 이미지 내용 주소 저장소 (images/.cas/<sha256>)
+"""다운로드할 때마다 images/<시각>/ 폴더가 새로 생기고, 같은 달에 다시 받으면 거의 같은 PNG가 또 저장됩니다.
+내용이 같은 PNG는 images/.cas/<sha256> 파일 하나만 두고 시각 폴더의 파일은 그 파일의 하드링크로 바꿉니다.
+
+- 시각 폴더 구조와 파일 이름은 그대로이므로 리포트 생성기/검증기는 달라지는 것이 없음
+- 해시는 여러 스레드에서 병렬 계산
+- 처음 보는 내용은 저장소에 복사(해시 재확인)한 뒤 시각 폴더 파일을 그 복사본의 링크로 교체
+  (시각 폴더 파일 자체를 저장소 파일로 쓰지 않으므로, 그 파일에 쓰던 쪽이 있어도 저장소는 영향 없음)
+- 저장소 파일은 읽기 전용: 링크된 시각 폴더 파일을 제자리에서 다시 쓰려 하면 실패하므로
+  다른 폴더와 저장소가 함께 바뀌지 않음 (다운로드는 임시 파일에 쓴 뒤 교체)
+- 정리(gc): 시각 폴더를 지우면 저장소 파일의 링크 수가 1이 되므로, 링크 수 1인 파일만 삭제
+  (저장 중인 임시 파일 <해시>.<pid>.<tid>.tmp는 건너뛰고, 중단된 실행이 남긴 오래된 임시 파일만 삭제)
+"""
+import os
+import stat
+import hashlib
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from report_images import file_hash
+
+IMAGES_DIR = Path("images")
+CAS_DIR_NAME = ".cas"
+READ_ONLY = stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH
+TEMP_SUFFIX = ".tmp"
+# 이보다 오래된 임시 파일만 정리 (다운로드와 동시에 gc를 실행해도 저장 중인 파일을 지우지 않음)
+TEMP_GRACE_SECONDS = 3600
+
+
+def make_writable(path):
+    """읽기 전용 파일 삭제 전 - Windows만 (읽기 전용 파일을 삭제할 수 없음)
+
+    모드는 하드링크 전체가 공유하므로 다른 곳에서도 링크된 파일에 쓰면 그 파일들도 쓰기 가능해짐
+    """
+    if os.name == 'nt':
+        os.chmod(path, stat.S_IRUSR | stat.S_IWUSR)
+
+
+def image_trees(images_dir=IMAGES_DIR):
+    """images 아래의 시각 폴더 목록 (.cas 등 점으로 시작하는 폴더 제외)"""
+    images_dir = Path(images_dir)
+    if not images_dir.is_dir():
+        return []
+    return sorted(p for p in images_dir.iterdir() if p.is_dir() and not p.name.startswith('.'))
+
+
+class ImageStore:
+    """images/.cas 내용 주소 저장소"""
+
+    def __init__(self, images_dir=IMAGES_DIR, workers=8):
+        self.images_dir = Path(images_dir)
+        self.cas_dir = self.images_dir / CAS_DIR_NAME
+        self.workers = workers
+
+    def store_blob(self, path, digest):
+        """처음 보는 내용을 저장소에 읽기 전용 복사본으로 저장 → 새로 저장했으면 True
+
+        복사하면서 해시를 다시 계산하여, 해시 계산 후 파일이 바뀌었으면 저장하지 않음 (ValueError)
+        """
+        blob = self.cas_dir / digest
+        if blob.exists():
+            return False
+        temp = self.cas_dir / f"{digest}.{os.getpid()}.{threading.get_ident()}{TEMP_SUFFIX}"
+        try:
+            copied = hashlib.sha256()
+            with open(path, 'rb') as source, open(temp, 'wb') as target:
+                for chunk in iter(lambda: source.read(1024 * 1024), b""):
+                    copied.update(chunk)
+                    target.write(chunk)
+            if copied.hexdigest() != digest:
+                raise ValueError("해시 계산 후 파일 내용이 바뀌었습니다")
+            try:
+                os.link(temp, blob)  # 같은 내용을 동시에 저장하면 하나만 남음
+            except FileExistsError:
+                return False
+        finally:
+            if temp.exists():
+                temp.unlink()
+        # 임시 이름을 지운 뒤 읽기 전용으로 (임시 파일 삭제가 Windows에서 막히지 않도록)
+        os.chmod(blob, READ_ONLY)
+        return True
+
+    def link_file(self, path, digest):
+        """파일을 저장소 파일의 하드링크로 교체 → 절약한 바이트 (새로 저장소에 넣었으면 0)"""
+        created = self.store_blob(path, digest)
+        blob = self.cas_dir / digest
+        path_stat, blob_stat = path.stat(), blob.stat()
+        if (path_stat.st_dev, path_stat.st_ino) == (blob_stat.st_dev, blob_stat.st_ino):
+            return 0  # 이미 링크됨
+        temp = path.with_name(path.name + '.cas-tmp')
+        if temp.exists():
+            make_writable(temp)
+            temp.unlink()  # 이전 실행이 중단되며 남은 임시 링크
+        os.link(blob, temp)
+        os.replace(temp, path)
+        os.chmod(blob, READ_ONLY)  # 남은 임시 링크 삭제로 풀렸을 수 있는 읽기 전용 다시 지정
+        return 0 if created else path_stat.st_size
+
+    def add_tree(self, tree):
+        """시각 폴더의 PNG를 저장소에 넣고 하드링크로 교체 → (링크한 파일 수, 중복 파일 수, 절약한 바이트, 실패 수)"""
+        files = sorted(Path(tree).rglob("*.png"))
+        if not files:
+            return 0, 0, 0, 0
+        self.cas_dir.mkdir(parents=True, exist_ok=True)
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            digests = list(executor.map(file_hash, files))
+
+        linked = 0
+        duplicates = 0
+        saved = 0
+        failed = 0
+        for path, digest in zip(files, digests):
+            try:
+                size = self.link_file(path, digest)
+            except (OSError, ValueError) as e:
+                # 하드링크를 지원하지 않는 파일 시스템, 처리 중 바뀐 파일 등: 원본 파일은 그대로 둠
+                logging.warning(f"이미지 저장소 링크 실패 {path}: {e}")
+                failed += 1
+                continue
+            linked += 1
+            if size:
+                duplicates += 1
+                saved += size
+        return linked, duplicates, saved, failed
+
+    def gc(self):
+        """어느 시각 폴더에서도 링크하지 않는 저장소 파일 삭제 → (삭제한 파일 수, 확보한 바이트)"""
+        if not self.cas_dir.is_dir():
+            return 0, 0
+        removed = 0
+        freed = 0
+        with os.scandir(self.cas_dir) as entries:
+            for entry in entries:
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                st = os.stat(entry.path)  # DirEntry.stat()은 Windows에서 st_nlink가 0
+                if st.st_nlink > 1:
+                    continue
+                if entry.name.endswith(TEMP_SUFFIX) and time.time() - st.st_mtime < TEMP_GRACE_SECONDS:
+                    continue
+                try:
+                    make_writable(entry.path)
+                    os.unlink(entry.path)
+                except OSError as e:
+                    logging.warning(f"저장소 파일 삭제 실패 {entry.path}: {e}")
+                    continue
+                removed += 1
+                freed += st.st_size
+        return removed, freed
+
+    def usage(self):
+        """(저장소 파일 수, 저장소 크기)"""
+        if not self.cas_dir.is_dir():
+            return 0, 0
+        sizes = [entry.stat().st_size for entry in os.scandir(self.cas_dir) if entry.is_file()]
+        return len(sizes), sum(sizes)
@@ -0,0 +1,183 @@
+# report_catalog.py - 생성된 리포트 목록(카탈로그), 버전 파일명 할당, 보관 정책
+"""output 폴더에 생성한 리포트를 output/catalog.sqlite3에 기록합니다.
+
+- 리포트마다 그룹, 월, 버전, 크기, sha256, 파일 목록(분할 리포트 페이지 포함) 저장
+- 버전 파일명(_v001 ...)은 카탈로그의 마지막 버전 다음 번호로 바로 정하고 배타적 생성(O_EXCL)으로 선점
+  (exists() 확인을 반복하지 않으며, 동시에 실행된 두 생성기가 같은 이름을 쓰지 않음)
+- 보관 정책: 그룹/월별 최근 N개만 유지, 전체 크기 상한 (카탈로그에 기록된 리포트만 정리)
+"""
+import os
+import json
+import sqlite3
+import hashlib
+import logging
+from contextlib import closing
+from datetime import datetime
+from pathlib import Path
+
+from report_compress import COMPRESS_SUFFIXES
+from report_images import file_hash
+
+CATALOG_NAME = "catalog.sqlite3"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS reports (
+    filename TEXT PRIMARY KEY,
+    base TEXT NOT NULL,
+    group_name TEXT NOT NULL,
+    month TEXT NOT NULL,
+    version INTEGER NOT NULL,
+    created TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    sha256 TEXT NOT NULL,
+    files TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS reports_base ON reports (base, version);
+CREATE INDEX IF NOT EXISTS reports_created ON reports (created);
+"""
+
+
+def versioned_filename(base_filename, version):
+    """'그룹_2025_05_<시각>.html', 2 → '그룹_2025_05_<시각>_v002.html' (0이면 그대로)"""
+    if not version:
+        return base_filename
+    path = Path(base_filename)
+    return f"{path.stem}_v{version:03d}{path.suffix}"
+
+
+def files_size(paths):
+    """리포트 파일과 사전 압축본(.gz/.br)의 디스크 크기 합"""
+    total = 0
+    for path in paths:
+        for candidate in [path] + [path.with_name(path.name + suffix) for suffix in COMPRESS_SUFFIXES.values()]:
+            try:
+                total += candidate.stat().st_size
+            except OSError:
+                pass
+    return total
+
+
+class ReportCatalog:
+    """output 폴더 리포트 카탈로그"""
+
+    def __init__(self, output_dir, path=None):
+        self.output_dir = Path(output_dir)
+        self.path = Path(path) if path else self.output_dir / CATALOG_NAME
+
+    def connect(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(str(self.path), timeout=30)
+        connection.executescript(_SCHEMA)
+        return connection
+
+    def latest(self):
+        """그룹별 최신 리포트 [(파일명, 그룹, 월, 생성 시각, 크기), ...] (그룹 이름순, 파일이 남아 있는 것만)
+
+        카탈로그를 읽기 전용으로 열므로 미리보기 서버처럼 조회만 하는 쪽에서 써도 파일을 만들거나 고치지 않음
+        """
+        if not self.path.is_file():
+            return []
+        uri = self.path.resolve().as_uri() + "?mode=ro"
+        with closing(sqlite3.connect(uri, uri=True, timeout=30)) as connection:
+            rows = connection.execute(
+                "SELECT filename, group_name, month, created, size FROM reports ORDER BY created DESC, version DESC"
+            ).fetchall()
+
+        latest = {}
+        for filename, group_name, month, created, size in rows:
+            if group_name not in latest and (self.output_dir / filename).is_file():
+                latest[group_name] = (filename, group_name, month, created, size)
+        return [latest[group] for group in sorted(latest)]
+
+    def allocate(self, base_filename):
+        """사용할 리포트 파일명 선점 → (파일명, 버전)
+
+        카탈로그의 마지막 버전 다음 번호부터 배타적 생성을 시도하므로 보통 한 번에 끝나며,
+        카탈로그 밖에서 만든 파일이나 동시 실행으로 이미 있으면 다음 번호로 넘어감
+        """
+        with closing(self.connect()) as connection:
+            last = connection.execute("SELECT MAX(version) FROM reports WHERE base = ?",
+                                      (base_filename,)).fetchone()[0]
+        version = 0 if last is None else last + 1
+        while True:
+            filename = versioned_filename(base_filename, version)
+            try:
+                # 모드를 주지 않으면 실행 권한이 붙음 - 일반 open()처럼 0o666에 umask 적용
+                fd = os.open(str(self.output_dir / filename), os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o666)
+            except FileExistsError:
+                version += 1
+                continue
+            os.close(fd)
+            return filename, version
+
+    def release(self, filename):
+        """리포트를 만들지 못했을 때 선점한 빈 파일 삭제"""
+        try:
+            (self.output_dir / filename).unlink()
+        except OSError:
+            pass
+
+    def record(self, filename, base_filename, group_name, month, version, paths):
+        """생성한 리포트 기록 (paths: 목차 파일을 포함한 리포트 파일 목록)"""
+        paths = [Path(path) for path in paths]
+        if len(paths) == 1:
+            digest = file_hash(paths[0])
+        else:
+            digest = hashlib.sha256("".join(file_hash(path) for path in paths).encode()).hexdigest()
+        with closing(self.connect()) as connection, connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO reports VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (filename, base_filename, group_name, month, version,
+                 datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f'),
+                 sum(path.stat().st_size for path in paths), digest,
+                 json.dumps([path.name for path in paths], ensure_ascii=False))
+            )
+
+    def prune(self, keep_versions=0, max_total_mb=0):
+        """보관 정책 적용 → (삭제한 리포트 파일명 목록, 확보한 바이트)
+
+        최신 리포트부터 한 번 훑으며 그룹/월별 keep_versions개를 넘거나 전체 크기가 max_total_mb를
+        넘는 리포트를 삭제 (각 그룹의 최신 리포트 하나는 크기 상한과 관계없이 유지, 0이면 제한 없음)
+        """
+        max_bytes = max_total_mb * 1024 * 1024
+        with closing(self.connect()) as connection:
+            rows = connection.execute(
+                "SELECT filename, group_name, month, files FROM reports ORDER BY created DESC, version DESC"
+            ).fetchall()
+
+        kept_versions = {}
+        kept_groups = set()
+        total = 0
+        removed = []
+        freed = 0
+        for filename, group_name, month, files in rows:
+            paths = [self.output_dir / name for name in json.loads(files)]
+            size = files_size(paths)
+            if not paths[0].exists():
+                removed.append((filename, []))  # 직접 삭제된 리포트는 기록만 정리
+                continue
+            kept = kept_versions.get((group_name, month), 0)
+            over_versions = keep_versions and kept >= keep_versions
+            over_size = max_bytes and total + size > max_bytes and group_name in kept_groups
+            if over_versions or over_size:
+                removed.append((filename, paths))
+                freed += size
+                continue
+            kept_versions[(group_name, month)] = kept + 1
+            kept_groups.add(group_name)
+            total += size
+
+        if not removed:
+            return [], 0
+        for _, paths in removed:
+            for path in paths:
+                for candidate in [path] + [path.with_name(path.name + suffix) for suffix in COMPRESS_SUFFIXES.values()]:
+                    try:
+                        candidate.unlink()
+                    except FileNotFoundError:
+                        pass
+                    except OSError as e:
+                        logging.warning(f"오래된 리포트 삭제 실패 {candidate}: {e}")
+        with closing(self.connect()) as connection, connection:
+            connection.executemany("DELETE FROM reports WHERE filename = ?", [(filename,) for filename, _ in removed])
+        return [filename for filename, paths in removed if paths], freed
@@ -0,0 +1,131 @@
+# report_compress.py - 리포트 사전 압축(.gz/.br) 및 묶음 아카이브
+import os
+import gzip
+import tarfile
+import zipfile
+import logging
+from contextlib import ExitStack
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+COMPRESS_SUFFIXES = {
+    'gzip': '.gz',
+    'br': '.br'
+}
+# 압축할 때 한 번에 읽는 크기 (리포트 전체를 메모리에 올리지 않음)
+COMPRESS_CHUNK_SIZE = 1024 * 1024
+
+
+def _load_brotli():
+    """brotli 모듈 (설치되지 않았으면 None)"""
+    try:
+        import brotli
+        return brotli
+    except ImportError:
+        return None
+
+
+def available_formats(formats):
+    """요청된 압축 형식 중 사용 가능한 것만 반환"""
+    result = []
+    for fmt in formats or []:
+        if fmt not in COMPRESS_SUFFIXES:
+            logging.warning(f"지원하지 않는 압축 형식: {fmt}")
+        elif fmt == 'br' and _load_brotli() is None:
+            logging.warning("brotli 모듈이 없어 .br 압축을 건너뜁니다 (pip install brotli)")
+        else:
+            result.append(fmt)
+    return result
+
+
+def compress_file(path, formats):
+    """파일 옆에 .gz/.br 사전 압축본 생성, 형식별 압축 크기 반환
+
+    원본을 COMPRESS_CHUNK_SIZE 단위로 한 번만 읽으며 모든 형식에 동시에 스트리밍하고,
+    임시 파일(.tmp)에 쓴 뒤 교체 (중단되어도 반쯤 쓴 압축본이 남지 않음)
+    """
+    path = Path(path)
+    targets = {fmt: path.with_name(path.name + COMPRESS_SUFFIXES[fmt]) for fmt in formats}
+    temps = {fmt: target.with_name(target.name + '.tmp') for fmt, target in targets.items()}
+    try:
+        with ExitStack() as stack:
+            source = stack.enter_context(open(path, 'rb'))
+            outputs = {fmt: stack.enter_context(open(temp, 'wb')) for fmt, temp in temps.items()}
+            writers = {}
+            compressors = {}
+            for fmt, output in outputs.items():
+                if fmt == 'gzip':
+                    # mtime=0, filename='': 내용이 같으면 압축본도 바이트 단위로 동일 (임시 파일 이름을 넣지 않음)
+                    gz = stack.enter_context(gzip.GzipFile(filename='', fileobj=output, mode='wb',
+                                                           compresslevel=9, mtime=0))
+                    writers[fmt] = gz.write
+                else:
+                    compressors[fmt] = _load_brotli().Compressor(quality=11)
+                    writers[fmt] = lambda chunk, fmt=fmt: outputs[fmt].write(compressors[fmt].process(chunk))
+            for chunk in iter(lambda: source.read(COMPRESS_CHUNK_SIZE), b""):
+                for write in writers.values():
+                    write(chunk)
+            for fmt, compressor in compressors.items():
+                outputs[fmt].write(compressor.finish())
+        for fmt, temp in temps.items():
+            os.replace(temp, targets[fmt])
+    finally:
+        for temp in temps.values():
+            if temp.exists():
+                temp.unlink()
+
+    return {fmt: target.stat().st_size for fmt, target in targets.items()}
+
+
+class CompressionPool:
+    """리포트 작성 직후 백그라운드에서 압축 (다음 그룹 렌더링과 동시 진행)"""
+
+    def __init__(self, formats, max_workers=2):
+        self.formats = available_formats(formats)
+        self.executor = ThreadPoolExecutor(max_workers=max_workers) if self.formats else None
+        self.futures = {}
+
+    def submit(self, path):
+        """압축 작업 등록"""
+        if self.executor:
+            self.futures[Path(path)] = self.executor.submit(compress_file, path, self.formats)
+
+    def results(self):
+        """모든 작업 완료 대기 후 {파일 경로: {형식: 압축 크기}} 반환"""
+        results = {}
+        for path, future in self.futures.items():
+            try:
+                results[path] = future.result()
+            except Exception as e:
+                logging.error(f"❌ 압축 실패 ({path.name}): {e}")
+                results[path] = {}
+        if self.executor:
+            self.executor.shutdown()
+        return results
+
+
+def create_archive(files, archive_path, base_dir, archive_format='zip'):
+    """생성된 리포트와 참조 에셋을 하나의 아카이브로 묶기 (zip 또는 tar.zst)"""
+    archive_path = Path(archive_path)
+    base_dir = Path(base_dir)
+
+    if archive_format == 'tar.zst':
+        try:
+            import zstandard
+        except ImportError:
+            logging.warning("zstandard 모듈이 없어 zip으로 묶습니다 (pip install zstandard)")
+            archive_format = 'zip'
+            archive_path = archive_path.with_name(archive_path.name.replace('.tar.zst', '.zip'))
+
+    if archive_format == 'tar.zst':
+        compressor = zstandard.ZstdCompressor(level=10)
+        with open(archive_path, 'wb') as raw, compressor.stream_writer(raw) as writer:
+            with tarfile.open(fileobj=writer, mode='w|') as tar:
+                for file_path in files:
+                    tar.add(file_path, arcname=Path(file_path).relative_to(base_dir).as_posix())
+    else:
+        with zipfile.ZipFile(archive_path, 'w', compression=zipfile.ZIP_DEFLATED, compresslevel=9) as zf:
+            for file_path in files:
+                zf.write(file_path, arcname=Path(file_path).relative_to(base_dir).as_posix())
+
+    return archive_path
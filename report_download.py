@@ -0,0 +1,625 @@
+# report_download.py - 그라파나 패널 PNG 다운로드 (01_download_images.ps1의 파이썬 구현)
+"""01_download_images.ps1과 같은 요청(/render/d-solo)과 같은 폴더 구조
+(images/<시각>/<그라파나 서버>/<대시보드>/<패널명>_<ID>.png)로 패널 이미지를 받습니다.
+
+- 패널 목록을 먼저 모두 조회한 뒤 여러 스레드로 동시에 렌더링 요청
+- 완료된 패널은 결과 큐로 전달 (파이프라인 모드에서 리포트 생성기가 받아 바로 처리)
+- 큐 크기를 제한하면 생성기가 밀릴 때 다운로드가 잠시 기다림 (메모리/디스크 사용 제한)
+- 파일은 임시 파일에 쓴 뒤 교체 (이미지 저장소 하드링크 파일을 직접 덮어쓰지 않음)
+
+렌더링 방식 (strategy)
+- panel: 패널마다 /render/d-solo 요청 (01_download_images.ps1과 같음, 요청 수 = 패널 수)
+- dashboard: 대시보드마다 /render/d 한 번 요청 후 패널 gridPos 위치대로 Pillow로 잘라 패널 PNG 저장
+  (렌더러의 브라우저 페이지 로드가 패널 수 → 대시보드 수로 줄어듦, 저장 폴더 구조는 같음)
+
+렌더링 순서
+- 실행마다 패널별 렌더링 시간을 cache/render_times.sqlite3에 기록
+- 다음 실행은 예상 시간이 긴 요청부터 시작 (최근 기록의 중앙값, 기록이 없으면 패널 유형별 추정값)
+  → 느린 패널(로그/히트맵 등)이 마지막에 시작되어 전체 시간이 늘어지는 것을 방지
+
+이어받기 (resume)
+- 완료/실패한 패널을 다운로드 폴더의 download_journal.jsonl에 한 줄씩 기록
+  (줄마다 OS에 넘기고 fsync는 여러 줄을 모아서 → 프로세스가 죽어도 기록 유지, 전원 차단 시에는
+  마지막 fsync 이후 기록만 잃고 해당 패널을 다시 받음)
+- 중단된 다운로드는 같은 폴더에서 다시 시작하며, 같은 요청 인자로 완료된 패널은 건너뛰고
+  없거나 실패한 패널만 다시 받음
+- 기록 첫 줄에 리포트 기간(from/to)을 남기고 이어받을 때 그 기간을 그대로 사용
+  (grafana_time_from이 없어 현재 시각 기준 기간을 쓰면 실행마다 인자가 달라져 이어받지 못함)
+- 실패 없이 끝난 폴더에는 download_complete.json을 남기며 --resume 자동 선택에서 제외
+"""
+import io
+import os
+import json
+import stat
+import time
+import sqlite3
+import logging
+import statistics
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from datetime import datetime
+from pathlib import Path
+from urllib.error import HTTPError, URLError
+
+from report_series import clean_safe_filename, report_time_range
+
+# 01_download_images.ps1의 패널 렌더링 크기/시간대
+RENDER_WIDTH = 1200
+RENDER_HEIGHT = 800
+RENDER_TIMEZONE = "Asia/Seoul"
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+# 그라파나 대시보드 격자 (24열, 행 높이 30px, 패널 간격 8px, kiosk 모드 기준)
+GRID_COLUMNS = 24
+GRID_CELL_HEIGHT = 30
+GRID_MARGIN = 8
+# dashboard 방식 기본 렌더링 폭 (12열 패널이 d-solo 폭 1200px에 가깝도록)
+DASHBOARD_RENDER_WIDTH = 2400
+# 대시보드 페이지에서 격자 바깥 여백 기본값 (px) - 그라파나 버전/테마에 따라 다르므로
+# report_settings의 dashboard_page_padding(좌우/아래), dashboard_page_top(격자 위 헤더+여백)으로 조정
+DASHBOARD_PAGE_PADDING = 0
+DASHBOARD_PAGE_TOP = 0
+
+JOURNAL_NAME = "download_journal.jsonl"
+DOWNLOAD_COMPLETE_NAME = "download_complete.json"
+# 이 개수만큼 기록이 쌓이거나 이 시간(초)이 지나면 fsync
+JOURNAL_SYNC_ENTRIES = 32
+JOURNAL_SYNC_SECONDS = 2.0
+
+RENDER_TIMES_DB = Path("cache/render_times.sqlite3")
+# 예상 시간 계산에 쓰는 패널별 최근 기록 수, 보관할 실행 수
+RENDER_TIMES_SAMPLES = 5
+RENDER_TIMES_KEEP_RUNS = 20
+# 기록이 없는 패널의 유형별 예상 렌더링 시간 (초)
+PANEL_TYPE_SECONDS = {
+    'logs': 20.0,
+    'heatmap': 12.0,
+    'nodeGraph': 10.0,
+    'table': 4.0,
+    'table-old': 4.0,
+    'state-timeline': 3.0,
+    'status-history': 3.0,
+    'piechart': 3.0,
+    'timeseries': 2.0,
+    'graph': 2.0,
+    'barchart': 2.0,
+    'bargauge': 1.0,
+    'gauge': 1.0,
+    'stat': 1.0,
+    'singlestat': 1.0,
+    'text': 0.5,
+}
+DEFAULT_PANEL_SECONDS = 2.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS render_times (
+    server TEXT NOT NULL,
+    uid TEXT NOT NULL,
+    panel_id INTEGER NOT NULL,
+    strategy TEXT NOT NULL,
+    run TEXT NOT NULL,
+    panel_type TEXT,
+    seconds REAL NOT NULL,
+    ok INTEGER NOT NULL,
+    PRIMARY KEY (server, uid, panel_id, strategy, run)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS render_times_run ON render_times (run);
+"""
+
+
+def panel_render_params(report_settings):
+    """패널 공통 렌더링 인자 (리포트 기간: grafana_time_from~grafana_time_to)"""
+    time_from, time_to = report_time_range(report_settings)
+    return {
+        'orgId': 1,
+        'width': RENDER_WIDTH,
+        'height': RENDER_HEIGHT,
+        'scale': 1,
+        'from': time_from,
+        'to': time_to,
+        'tz': RENDER_TIMEZONE
+    }
+
+
+def dashboard_panels(dashboard):
+    """다운로드 대상 패널 (01_download_images.ps1과 같이 최상위의 row가 아닌 패널)"""
+    return [panel for panel in dashboard.get('panels') or []
+            if panel.get('id') is not None and panel.get('type') != 'row' and not panel.get('collapsed')]
+
+
+def discover_panel_jobs(client, server_name, target_folder):
+    """그라파나 서버의 모든 대시보드 패널 → 다운로드 작업 목록
+
+    작업: {'server', 'dashboard'(폴더 이름), 'uid', 'panel_id', 'title', 'type', 'grid', 'path'}
+    """
+    jobs = []
+    for entry in client.search_dashboards():
+        dashboard_name = clean_safe_filename(entry['title'])
+        try:
+            dashboard = client.get_dashboard(entry['uid'])
+        except (HTTPError, URLError, OSError, ValueError, KeyError) as e:
+            logging.warning(f"  대시보드 조회 실패 ({entry['title']}): {e}")
+            continue
+        dashboard_dir = Path(target_folder) / server_name / dashboard_name
+        for panel in dashboard_panels(dashboard):
+            title = clean_safe_filename(panel['title']) if panel.get('title') else "Panel"
+            jobs.append({
+                'server': server_name,
+                'dashboard': dashboard_name,
+                'uid': entry['uid'],
+                'panel_id': panel['id'],
+                'title': panel.get('title') or "Panel",
+                'type': panel.get('type'),
+                'grid': panel.get('gridPos'),
+                'path': dashboard_dir / f"{title}_{panel['id']}.png"
+            })
+    return jobs
+
+
+def dashboard_page_layout(report_settings):
+    """report_settings → 대시보드 페이지 여백 (좌우/아래 padding, 격자 위 top) px"""
+    return (report_settings.get('dashboard_page_padding', DASHBOARD_PAGE_PADDING),
+            report_settings.get('dashboard_page_top', DASHBOARD_PAGE_TOP))
+
+
+def panel_rect(grid, width, padding=0, page_top=0):
+    """gridPos {x, y, w, h} → 폭 width로 렌더링한 대시보드 안의 패널 위치 (left, top, right, bottom)
+
+    padding: 페이지 좌우 여백 (격자 폭 = width - 2 * padding), page_top: 격자 첫 행 위의 헤더/여백 높이
+    """
+    column = (width - 2 * padding - GRID_MARGIN * (GRID_COLUMNS - 1)) / GRID_COLUMNS
+    left = padding + round(grid['x'] * (column + GRID_MARGIN))
+    top = page_top + grid['y'] * (GRID_CELL_HEIGHT + GRID_MARGIN)
+    right = left + round(grid['w'] * column + (grid['w'] - 1) * GRID_MARGIN)
+    bottom = top + grid['h'] * GRID_CELL_HEIGHT + (grid['h'] - 1) * GRID_MARGIN
+    return left, top, right, bottom
+
+
+def has_grid(job):
+    """dashboard 방식으로 자를 수 있는 패널인지 (gridPos 값이 모두 있고 크기가 0보다 큼)"""
+    grid = job.get('grid') or {}
+    if not all(isinstance(grid.get(key), (int, float)) for key in ('x', 'y', 'w', 'h')):
+        return False
+    return grid['w'] > 0 and grid['h'] > 0
+
+
+def dashboard_viewport(jobs, width=DASHBOARD_RENDER_WIDTH, padding=0, page_top=0):
+    """대시보드 패널 전체가 들어가는 렌더링 크기 (width, height)"""
+    return width, max(panel_rect(job['grid'], width, padding, page_top)[3] for job in jobs) + padding
+
+
+class RenderTimes:
+    """패널 렌더링 시간 기록 (실행별) 및 예상 시간 조회"""
+
+    def __init__(self, path=RENDER_TIMES_DB):
+        self.path = Path(path)
+
+    def connect(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(str(self.path), timeout=30)
+        connection.executescript(_SCHEMA)
+        return connection
+
+    def expected(self, strategy):
+        """{(server, uid, panel_id): 예상 시간} - 패널별 최근 RENDER_TIMES_SAMPLES개 기록의 중앙값
+        (실패한 요청도 시간 초과까지 걸린 시간이므로 포함)"""
+        samples = defaultdict(list)
+        with closing(self.connect()) as connection:
+            rows = connection.execute(
+                "SELECT server, uid, panel_id, seconds FROM render_times WHERE strategy = ? ORDER BY run DESC",
+                (strategy,)
+            )
+            for server, uid, panel_id, seconds in rows:
+                key = (server, uid, panel_id)
+                if len(samples[key]) < RENDER_TIMES_SAMPLES:
+                    samples[key].append(seconds)
+        return {key: statistics.median(values) for key, values in samples.items()}
+
+    def record(self, results):
+        """이번 실행의 패널별 결과 기록 (오래된 실행은 정리) → 기록한 행 수"""
+        run = datetime.now().strftime('%Y%m%d_%H%M%S_%f')
+        rows = [(result['job']['server'], result['job']['uid'], result['job']['panel_id'], result['strategy'],
+                 run, result['job'].get('type'), result['seconds'], int(result['ok'])) for result in results]
+        with closing(self.connect()) as connection, connection:
+            connection.executemany("INSERT OR REPLACE INTO render_times VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+            connection.execute(
+                "DELETE FROM render_times WHERE run NOT IN "
+                "(SELECT DISTINCT run FROM render_times ORDER BY run DESC LIMIT ?)",
+                (RENDER_TIMES_KEEP_RUNS,)
+            )
+        return len(rows)
+
+
+class DownloadJournal:
+    """다운로드 폴더의 패널 완료 기록 (JSON Lines, 추가만 하며 줄마다 flush, 여러 줄을 모아 fsync)"""
+
+    def __init__(self, folder):
+        self.path = Path(folder) / JOURNAL_NAME
+        self.complete_path = Path(folder) / DOWNLOAD_COMPLETE_NAME
+        self._file = None
+        self._pending = 0
+        self._synced = time.monotonic()
+        self._lock = threading.Lock()
+
+    def load(self):
+        """{(server, uid, panel_id): 마지막 기록} (기록 중 중단되어 잘린 줄은 무시)"""
+        entries = {}
+        if not self.path.exists():
+            return entries
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                    entries[(entry['server'], entry['uid'], entry['panel_id'])] = entry
+                except (ValueError, KeyError, TypeError):
+                    continue
+        return entries
+
+    def time_range(self):
+        """기록된 리포트 기간 [from, to] (기간 기록 이전 형식이거나 기록이 없으면 None)"""
+        if not self.path.exists():
+            return None
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    time_range = json.loads(line)['time_range']
+                except (ValueError, KeyError, TypeError):
+                    continue
+                return time_range
+        return None
+
+    def pin_time_range(self, params):
+        """이어받기 폴더는 처음 실행의 리포트 기간으로 요청, 새 폴더는 이번 기간을 기록 → 요청 인자"""
+        time_range = self.time_range()
+        if time_range is None:
+            self._write({'time_range': [params['from'], params['to']]})
+            return params
+        if time_range != [params['from'], params['to']]:
+            logging.info("이어받기: 처음 다운로드한 리포트 기간 사용 "
+                         f"({datetime.fromtimestamp(time_range[0] / 1000):%Y-%m-%d %H:%M} ~ "
+                         f"{datetime.fromtimestamp(time_range[1] / 1000):%Y-%m-%d %H:%M})")
+        return dict(params, **{'from': time_range[0], 'to': time_range[1]})
+
+    def append(self, result, params):
+        """패널 결과 기록 (params: 요청 인자, 이어받기 시 같은 인자인지 비교)"""
+        job = result['job']
+        self._write({
+            'server': job['server'],
+            'uid': job['uid'],
+            'panel_id': job['panel_id'],
+            'params': params,
+            'ok': result['ok'],
+            'size': result['size']
+        })
+
+    def _write(self, entry):
+        line = json.dumps(entry, ensure_ascii=False, sort_keys=True) + "\n"
+        with self._lock:
+            if self._file is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._file = open(self.path, 'a', encoding='utf-8')
+            self._file.write(line)
+            self._file.flush()
+            self._pending += 1
+            if self._pending >= JOURNAL_SYNC_ENTRIES or time.monotonic() - self._synced >= JOURNAL_SYNC_SECONDS:
+                self._sync()
+
+    def _sync(self):
+        os.fsync(self._file.fileno())
+        self._pending = 0
+        self._synced = time.monotonic()
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._sync()
+                self._file.close()
+                self._file = None
+
+    def mark_complete(self, panels):
+        """모든 패널을 받은 폴더 표시 (이어받기 자동 선택에서 제외)"""
+        data = json.dumps({'panels': panels, 'finished': datetime.now().isoformat(timespec='seconds')})
+        write_file_atomic(self.complete_path, data.encode('utf-8'))
+
+    def clear_complete(self):
+        """완료 표시 제거 (완료된 폴더를 다시 이어받는 실행이 실패할 수 있으므로 시작할 때 지움)"""
+        try:
+            self.complete_path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def find_resume_folder(images_dir=Path("images")):
+    """기록(download_journal.jsonl)이 있고 완료 표시가 없는 가장 최근 다운로드 폴더 (없으면 None)"""
+    images_dir = Path(images_dir)
+    if not images_dir.is_dir():
+        return None
+    folders = [folder for folder in images_dir.iterdir()
+               if folder.is_dir() and not folder.name.startswith('.') and (folder / JOURNAL_NAME).exists()
+               and not (folder / DOWNLOAD_COMPLETE_NAME).exists()]
+    return max(folders, key=lambda folder: folder.name) if folders else None
+
+
+def remove_partial_files(folder):
+    """중단된 다운로드가 남긴 임시 파일(*.part) 삭제 → 삭제한 수"""
+    removed = 0
+    for path in Path(folder).rglob("*.part"):
+        try:
+            path.unlink()
+            removed += 1
+        except OSError:
+            pass
+    return removed
+
+
+def panel_type_seconds(job):
+    """기록이 없는 패널의 예상 렌더링 시간 (패널 유형별 추정값)"""
+    return PANEL_TYPE_SECONDS.get(job.get('type'), DEFAULT_PANEL_SECONDS)
+
+
+def write_file_atomic(path, data):
+    """임시 파일에 쓴 뒤 교체 (중단되어도 반쯤 쓴 PNG가 남지 않음)"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp = path.with_name(path.name + '.part')
+    with open(temp, 'wb') as f:
+        f.write(data)
+    try:
+        os.replace(temp, path)
+    except PermissionError:
+        # Windows는 읽기 전용 파일(이미지 저장소에 링크된 PNG)을 교체할 수 없음 - 속성을 풀고 교체
+        # (링크를 끊고 새 파일을 쓰므로 저장소와 다른 폴더의 내용은 그대로)
+        if os.name != 'nt' or not path.exists():
+            raise
+        os.chmod(path, stat.S_IRUSR | stat.S_IWUSR)
+        os.replace(temp, path)
+
+
+class PanelDownloader:
+    """패널 PNG 동시 다운로드
+
+    clients: {그라파나 서버 이름: GrafanaClient}, params: panel_render_params() 결과
+    strategy: 'panel' 또는 'dashboard' (dashboard_width: dashboard 방식 렌더링 폭,
+              page_layout: dashboard_page_layout() 페이지 여백)
+    render_times: RenderTimes - 주어지면 예상 시간이 긴 요청부터 시작하고 이번 렌더링 시간을 기록
+    journal: DownloadJournal - 주어지면 패널 결과를 기록하고 이미 완료된 패널은 건너뜀 (이어받기)
+    """
+
+    def __init__(self, clients, params, workers=4, strategy='panel', dashboard_width=DASHBOARD_RENDER_WIDTH,
+                 render_times=None, journal=None, page_layout=(DASHBOARD_PAGE_PADDING, DASHBOARD_PAGE_TOP)):
+        self.clients = clients
+        self.params = params
+        self.workers = max(1, workers)
+        self.strategy = strategy
+        self.dashboard_width = dashboard_width
+        self.page_padding, self.page_top = page_layout
+        self.render_times = render_times
+        self.journal = journal
+        if strategy == 'dashboard':
+            try:
+                import PIL  # noqa: F401
+            except ImportError:
+                logging.warning("Pillow가 설치되지 않아 패널별 렌더링으로 받습니다 (pip install -r requirements.txt)")
+                self.strategy = 'panel'
+
+    def download(self, job):
+        """패널 하나 다운로드 → 결과 {'job', 'ok', 'size', 'seconds', 'strategy', 'error', 'render_request'}
+
+        render_request: 이 결과의 seconds가 그라파나 렌더링 요청 한 번의 시간인지 (대시보드 방식은 첫 패널만 True,
+                        실행 지표의 렌더링 지연 히스토그램은 요청마다 한 번만 기록)
+        """
+        started = time.perf_counter()
+        params = dict(self.params, panelId=job['panel_id'])
+        try:
+            data = self.clients[job['server']].render(f"/render/d-solo/{job['uid']}", params)
+            if not data.startswith(PNG_SIGNATURE):
+                raise ValueError("응답이 PNG 이미지가 아닙니다")
+            write_file_atomic(job['path'], data)
+        except (HTTPError, URLError, OSError, ValueError) as e:
+            return {'job': job, 'ok': False, 'size': 0, 'seconds': time.perf_counter() - started,
+                    'strategy': 'panel', 'error': str(e), 'render_request': True}
+        return {'job': job, 'ok': True, 'size': len(data), 'seconds': time.perf_counter() - started,
+                'strategy': 'panel', 'error': None, 'render_request': True}
+
+    def download_dashboard(self, jobs):
+        """대시보드 한 번 렌더링 후 패널별로 잘라 저장 → 패널별 결과 목록
+
+        seconds는 모든 패널이 대시보드 렌더링 시간 (예상 시간 기록용), render_request는 첫 패널만 True
+        """
+        from PIL import Image
+
+        first = jobs[0]
+        width, height = dashboard_viewport(jobs, self.dashboard_width, self.page_padding, self.page_top)
+        params = {key: value for key, value in self.params.items() if key not in ('width', 'height')}
+        params.update(width=width, height=height, kiosk=1)
+        started = time.perf_counter()
+        try:
+            data = self.clients[first['server']].render(f"/render/d/{first['uid']}", params)
+            if not data.startswith(PNG_SIGNATURE):
+                raise ValueError("응답이 PNG 이미지가 아닙니다")
+            with Image.open(io.BytesIO(data)) as composite:
+                composite.load()
+                # 렌더러 배율(scale)로 이미지가 요청 크기와 다르면 같은 비율로 자름
+                ratio = composite.width / width
+                slices = []
+                for job in jobs:
+                    rect = tuple(round(value * ratio)
+                                 for value in panel_rect(job['grid'], width, self.page_padding, self.page_top))
+                    buffer = io.BytesIO()
+                    composite.crop(rect).save(buffer, format="PNG")
+                    slices.append((job, buffer.getvalue()))
+        except (HTTPError, URLError, OSError, ValueError) as e:
+            seconds = time.perf_counter() - started
+            return [{'job': job, 'ok': False, 'size': 0, 'seconds': seconds, 'strategy': 'dashboard', 'error': str(e),
+                     'render_request': index == 0} for index, job in enumerate(jobs)]
+        seconds = time.perf_counter() - started
+
+        results = []
+        for job, png in slices:
+            try:
+                write_file_atomic(job['path'], png)
+            except OSError as e:
+                results.append({'job': job, 'ok': False, 'size': 0, 'seconds': seconds, 'strategy': 'dashboard',
+                                'error': str(e)})
+                continue
+            results.append({'job': job, 'ok': True, 'size': len(png), 'seconds': seconds, 'strategy': 'dashboard',
+                            'error': None})
+        for index, result in enumerate(results):
+            result['render_request'] = index == 0
+        return results
+
+    def batches(self, jobs):
+        """렌더링 요청 단위 목록 - panel: 패널 하나씩, dashboard: 대시보드별 (gridPos 없는 패널은 따로)"""
+        if self.strategy != 'dashboard':
+            return [[job] for job in jobs]
+        dashboards = defaultdict(list)
+        singles = []
+        for job in jobs:
+            if has_grid(job):
+                dashboards[(job['server'], job['uid'])].append(job)
+            else:
+                singles.append([job])
+        return list(dashboards.values()) + singles
+
+    def schedule(self, batches):
+        """예상 렌더링 시간이 긴 요청부터 정렬 (작업자가 빈 순서대로 가져가므로 긴 작업이 먼저 시작)"""
+        if not self.render_times:
+            return batches
+        try:
+            expected = {strategy: self.render_times.expected(strategy) for strategy in ('panel', 'dashboard')}
+        except sqlite3.Error as e:
+            logging.warning(f"렌더링 시간 기록을 읽을 수 없어 조회 순서대로 받습니다: {e}")
+            return batches
+
+        known = 0
+        costs = []
+        for batch in batches:
+            strategy = self.job_strategy(batch[0])
+            seconds = []
+            for job in batch:
+                value = expected[strategy].get((job['server'], job['uid'], job['panel_id']))
+                known += value is not None
+                seconds.append(panel_type_seconds(job) if value is None else value)
+            # dashboard 방식은 패널을 한 페이지에서 함께 그리므로 가장 느린 패널 기준
+            costs.append(max(seconds) if strategy == 'dashboard' else sum(seconds))
+        order = sorted(range(len(batches)), key=lambda index: -costs[index])
+        total = sum(len(batch) for batch in batches)
+        logging.info(f"렌더링 순서: 예상 시간이 긴 요청부터 (기록 있는 패널 {known}개, 유형 추정 {total - known}개, "
+                     f"최장 예상 {max(costs, default=0):.1f}초)")
+        return [batches[index] for index in order]
+
+    def job_strategy(self, job):
+        """패널이 실제로 받는 렌더링 방식 (dashboard 방식이어도 gridPos 없는 패널은 panel)"""
+        return 'dashboard' if self.strategy == 'dashboard' and has_grid(job) else 'panel'
+
+    def failed_results(self, jobs, error):
+        """요청 단위가 예상하지 못한 예외로 끝났을 때 패널별 실패 결과"""
+        return [{'job': job, 'ok': False, 'size': 0, 'seconds': 0.0, 'strategy': self.job_strategy(job),
+                 'error': error} for job in jobs]
+
+    def job_params(self, job):
+        """기록에 남길 패널 요청 인자 (기간/크기/렌더링 방식이 바뀌면 이어받기에서 다시 받음)"""
+        strategy = self.job_strategy(job)
+        params = dict(self.params, panelId=job['panel_id'], strategy=strategy)
+        if strategy == 'dashboard':
+            params.update(width=self.dashboard_width, grid=job['grid'],
+                          page=[self.page_padding, self.page_top])
+            params.pop('height', None)
+        return params
+
+    def completed(self, jobs):
+        """기록에서 같은 요청 인자로 완료되었고 파일이 남아 있는 패널 → 건너뛸 결과 목록"""
+        entries = self.journal.load()
+        done = []
+        for job in jobs:
+            entry = entries.get((job['server'], job['uid'], job['panel_id']))
+            if not entry or not entry.get('ok') or entry.get('params') != self.job_params(job):
+                continue
+            try:
+                size = job['path'].stat().st_size
+            except OSError:
+                continue
+            done.append({'job': job, 'ok': True, 'size': size, 'seconds': 0.0, 'strategy': 'journal',
+                         'error': None, 'resumed': True})
+        return done
+
+    def run_batch(self, batch):
+        if self.job_strategy(batch[0]) == 'dashboard':
+            return self.download_dashboard(batch)
+        return [self.download(job) for job in batch]
+
+    def start(self, jobs, results):
+        """백그라운드에서 다운로드 시작 - 완료된 패널 결과를 results 큐에 넣고, 모두 끝나면 None을 넣음
+
+        results가 크기 제한 큐이면 소비자가 따라오지 못할 때 다운로드 스레드가 기다림
+        """
+        finished = []
+        reported = set()
+        failures = []
+
+        def report(result):
+            reported.add(id(result['job']))
+            if not result['ok']:
+                failures.append(result)
+            results.put(result)
+
+        def run_and_report(batch):
+            # 불완전한 응답(IncompleteRead), 이미지 크기 제한(DecompressionBombError) 등 예상하지 못한 예외도
+            # 패널별 실패로 넘겨야 소비자가 대시보드 완료를 기다리며 멈추지 않음
+            try:
+                batch_results = self.run_batch(batch)
+            except Exception as e:
+                logging.exception(f"렌더링 요청 실패 ({batch[0]['server']}/{batch[0]['dashboard']})")
+                batch_results = self.failed_results(batch, f"{type(e).__name__}: {e}")
+            for result in batch_results:
+                if self.journal:
+                    try:
+                        self.journal.append(result, self.job_params(result['job']))
+                    except OSError as e:
+                        logging.warning(f"다운로드 기록 실패: {e}")
+                finished.append(result)
+                report(result)
+
+        def run():
+            try:
+                pending = jobs
+                if self.journal:
+                    self.journal.clear_complete()
+                    # 이미 완료된 패널은 바로 결과로 넘기고 나머지만 요청
+                    done = self.completed(jobs)
+                    if done:
+                        done_keys = {id(result['job']) for result in done}
+                        pending = [job for job in jobs if id(job) not in done_keys]
+                        logging.info(f"이어받기: 완료된 패널 {len(done)}개 건너뜀, {len(pending)}개 다운로드")
+                    for result in done:
+                        report(result)
+                with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                    futures = [(executor.submit(run_and_report, batch), batch)
+                               for batch in self.schedule(self.batches(pending))]
+                for future, batch in futures:
+                    try:
+                        future.result()
+                    except Exception as e:
+                        # 결과 전달 중 실패: 아직 넘기지 못한 패널을 실패로 전달
+                        logging.exception("다운로드 작업자 오류")
+                        for result in self.failed_results([job for job in batch if id(job) not in reported],
+                                                          f"{type(e).__name__}: {e}"):
+                            report(result)
+                if self.render_times and finished:
+                    try:
+                        self.render_times.record(finished)
+                    except sqlite3.Error as e:
+                        logging.warning(f"렌더링 시간 기록 실패: {e}")
+                if self.journal and not failures:
+                    try:
+                        self.journal.mark_complete(len(jobs))
+                    except OSError as e:
+                        logging.warning(f"다운로드 완료 표시 실패: {e}")
+            finally:
+                if self.journal:
+                    self.journal.close()
+                results.put(None)
+
+        thread = threading.Thread(target=run, name="panel-downloader", daemon=True)
+        thread.start()
+        return thread
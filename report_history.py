@@ -0,0 +1,111 @@
+# report_history.py - 서버 월별 지표 이력 저장소 (SQLite)
+"""grafana_report.py stats가 계산한 서버별 월간 지표를 누적하여 월별 추이를 보여줍니다.
+
+- stats/history.sqlite3 한 파일, (server, month, metric) 기본 키 테이블 (WITHOUT ROWID → 키 순서로 저장)
+  + (month, server) 인덱스
+- 새 달 추가는 한 트랜잭션의 append (같은 달을 다시 계산하면 해당 서버의 그 달만 교체)
+- 리포트 생성 시 최근 N개월 이력을 month 인덱스 범위 조회 한 번으로 읽음 (서버 수와 무관)
+"""
+import json
+import sqlite3
+import logging
+from contextlib import closing
+from pathlib import Path
+
+HISTORY_DB = Path("stats/history.sqlite3")
+
+# 리포트 월별 추이 표에 표시할 지표 (지표, 표시 이름, 형식)
+TREND_METRICS = [
+    ('availability', '가용률', '{:.2f}%'),
+    ('cpu_p95', 'CPU p95', '{:.1f}%'),
+    ('memory_p95', '메모리 p95', '{:.1f}%'),
+    ('outages', '중단 횟수', '{:.0f}회'),
+]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS monthly_metrics (
+    server TEXT NOT NULL,
+    month TEXT NOT NULL,
+    metric TEXT NOT NULL,
+    value REAL,
+    PRIMARY KEY (server, month, metric)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS monthly_metrics_month ON monthly_metrics (month, server);
+"""
+
+
+def month_key(report_month):
+    """'2025. 05' → '2025-05' (문자열 정렬 = 시간 순서)"""
+    return report_month.replace('. ', '-')
+
+
+def shift_month(month, offset):
+    """'2025-05', -11 → '2024-06'"""
+    year, number = map(int, month.split('-'))
+    index = year * 12 + number - 1 + offset
+    return f"{index // 12:04d}-{index % 12 + 1:02d}"
+
+
+class MetricsHistory:
+    """서버/월/지표 단위 월간 집계 저장소"""
+
+    def __init__(self, path=HISTORY_DB):
+        self.path = Path(path)
+
+    def connect(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(str(self.path))
+        connection.executescript(_SCHEMA)
+        return connection
+
+    def append_month(self, report_month, servers_metrics):
+        """한 달치 서버별 지표 {서버: {지표: 값}} 추가 → 저장한 행 수"""
+        month = month_key(report_month)
+        rows = [
+            (server, month, metric, value)
+            for server, metrics in servers_metrics.items()
+            for metric, value in metrics.items()
+            if value is None or isinstance(value, (int, float))
+        ]
+        with closing(self.connect()) as connection, connection:
+            connection.executemany("DELETE FROM monthly_metrics WHERE month = ? AND server = ?",
+                                   [(month, server) for server in servers_metrics])
+            connection.executemany("INSERT INTO monthly_metrics VALUES (?, ?, ?, ?)", rows)
+        return len(rows)
+
+    def load(self, report_month, months=6, servers=None):
+        """최근 months개월(이번 달 포함) 이력 → {서버: {월: {지표: 값}}} (servers: 주어지면 해당 서버만)"""
+        if not self.path.exists() or months < 1:
+            return {}
+        last = month_key(report_month)
+        first = shift_month(last, -(months - 1))
+        history = {}
+        try:
+            with closing(sqlite3.connect(self.path.resolve().as_uri() + "?mode=ro", uri=True)) as connection:
+                # (month, server) 인덱스 범위 조회 한 번
+                cursor = connection.execute(
+                    "SELECT server, month, metric, value FROM monthly_metrics WHERE month BETWEEN ? AND ?",
+                    (first, last)
+                )
+                for server, month, metric, value in cursor:
+                    if servers is not None and server not in servers:
+                        continue
+                    history.setdefault(server, {}).setdefault(month, {})[metric] = value
+        except sqlite3.Error as e:
+            logging.warning(f"지표 이력 읽기 실패 {self.path}: {e}")
+            return {}
+        return history
+
+
+def rebuild_history(stats_dir, history=None):
+    """stats/<YYYY_MM>.json 파일들로 이력 저장소 다시 채우기 → 추가한 달 목록"""
+    history = history or MetricsHistory()
+    months = []
+    for path in sorted(Path(stats_dir).glob("[0-9][0-9][0-9][0-9]_[0-9][0-9].json")):
+        with open(path, 'r', encoding='utf-8') as f:
+            stats = json.load(f)
+        history.append_month(stats['report_month'], {
+            name: server.get('metrics', {}) for name, server in stats.get('servers', {}).items()
+        })
+        months.append(stats['report_month'])
+    return months
@@ -0,0 +1,238 @@
+# report_images.py - 차트 이미지 변환 (썸네일 / 원본 분리 저장)
+import io
+import os
+import json
+import hashlib
+import shutil
+import logging
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+THUMBNAIL_CACHE_DIR = Path("cache/thumbnails")
+PANEL_CHECK_CACHE_PATH = Path("cache/panel_checks.json")
+
+# 빈 패널 판정 기준 (축소본 기준)
+PANEL_SAMPLE_WIDTH = 240     # 판정용 축소 폭 (px)
+PANEL_TITLE_BAND = 0.1       # 패널 제목 영역으로 보고 제외할 상단 비율
+PANEL_INK_THRESHOLD = 24     # 배경 밝기와 이만큼 다르면 내용 픽셀
+PANEL_NO_DATA_BOX = (0.4, 0.15)  # 내용 픽셀 범위가 (폭, 높이) 비율 미만이면 "No data" 문구만 있는 패널
+# 판정 로직을 바꾸면 올림 (기준값과 함께 판정 캐시 키에 포함)
+PANEL_CLASSIFIER_VERSION = 1
+
+
+def file_hash(path):
+    """파일 내용의 sha256 해시"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ChartImageStore:
+    """썸네일 생성 및 원본 이미지 side file 관리"""
+
+    def __init__(self, thumbnail_width=480, thumbnail_quality=60, cache_dir=THUMBNAIL_CACHE_DIR):
+        self.thumbnail_width = thumbnail_width
+        self.thumbnail_quality = thumbnail_quality
+        self.cache_dir = Path(cache_dir)
+        self._hashes = {}
+        # 캐시 적중/미적중 수 (실행 지표용, 페이지 병렬 생성 시 여러 스레드에서 호출)
+        self.cache_stats = Counter()
+        self._stats_lock = threading.Lock()
+
+    def count(self, key):
+        with self._stats_lock:
+            self.cache_stats[key] += 1
+
+    def image_hash(self, image_path):
+        """이미지 해시 (파일이 바뀌지 않았으면 다시 계산하지 않음)"""
+        stat = os.stat(image_path)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        cached = self._hashes.get(str(image_path))
+        if not cached or cached[0] != stamp:
+            cached = (stamp, file_hash(image_path))
+            self._hashes[str(image_path)] = cached
+            self.count('hash_misses')
+        else:
+            self.count('hash_hits')
+        return cached[1]
+
+    def make_thumbnail(self, image_path):
+        """축소/고압축 JPEG 썸네일 bytes와 크기 반환 (원본 해시 기준 캐시)"""
+        digest = self.image_hash(image_path)
+        cache_path = self.cache_dir / f"{digest}_{self.thumbnail_width}_{self.thumbnail_quality}.jpg"
+
+        try:
+            from PIL import Image
+        except ImportError:
+            logging.warning("Pillow가 설치되지 않아 썸네일을 만들 수 없습니다 (pip install -r requirements.txt)")
+            return None
+
+        if cache_path.exists():
+            self.count('thumbnail_hits')
+            data = cache_path.read_bytes()
+            with Image.open(io.BytesIO(data)) as thumb:
+                return data, thumb.size
+
+        self.count('thumbnail_misses')
+        with Image.open(image_path) as img:
+            img = img.convert("RGB")
+            if img.width > self.thumbnail_width:
+                height = max(1, round(img.height * self.thumbnail_width / img.width))
+                img = img.resize((self.thumbnail_width, height), Image.LANCZOS)
+            buffer = io.BytesIO()
+            img.save(buffer, format="JPEG", quality=self.thumbnail_quality, optimize=True)
+            data = buffer.getvalue()
+            size = img.size
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            cache_path.write_bytes(data)
+        except Exception as e:
+            logging.warning(f"썸네일 캐시 저장 실패 {cache_path}: {e}")
+        return data, size
+
+    def publish_full_image(self, image_path, output_dir):
+        """원본 이미지를 output/assets/charts/<해시>.png로 복사 후 상대 경로 반환"""
+        charts_dir = Path(output_dir) / "assets" / "charts"
+        charts_dir.mkdir(parents=True, exist_ok=True)
+
+        target = charts_dir / f"{self.image_hash(image_path)[:16]}{Path(image_path).suffix}"
+        if not target.exists():
+            shutil.copyfile(image_path, target)
+        return target.relative_to(output_dir).as_posix()
+
+
+def classify_panel_image(image_path, sample_width=PANEL_SAMPLE_WIDTH):
+    """축소본의 밝기 히스토그램으로 빈 패널 판정 → 'blank', 'no_data' 또는 None (정상 차트)
+
+    배경(가장 많은 밝기 값)과 다른 픽셀이 없으면 빈 이미지, 가운데 작은 범위에만 있으면
+    "No data" 문구뿐인 패널로 봅니다. 차트는 축/격자/범례가 패널 전체에 퍼져 있습니다.
+    """
+    import numpy as np
+    from PIL import Image
+
+    with Image.open(image_path) as img:
+        factor = max(1, img.width // sample_width)
+        small = img.convert("L").reduce(factor)
+    gray = np.asarray(small, dtype=np.int16)
+    body = gray[int(gray.shape[0] * PANEL_TITLE_BAND):]
+
+    background = np.bincount(body.ravel(), minlength=256).argmax()
+    ink = np.abs(body - background) > PANEL_INK_THRESHOLD
+    if not ink.any():
+        return 'blank'
+    rows = np.flatnonzero(ink.any(axis=1))
+    cols = np.flatnonzero(ink.any(axis=0))
+    box_width = (cols[-1] - cols[0] + 1) / body.shape[1]
+    box_height = (rows[-1] - rows[0] + 1) / body.shape[0]
+    if box_width < PANEL_NO_DATA_BOX[0] and box_height < PANEL_NO_DATA_BOX[1]:
+        return 'no_data'
+    return None
+
+
+def panel_classifier_key():
+    """판정 로직 버전 + 판정 기준값 해시 (바뀌면 이전 판정 캐시를 버림)"""
+    params = [PANEL_CLASSIFIER_VERSION, PANEL_SAMPLE_WIDTH, PANEL_TITLE_BAND, PANEL_INK_THRESHOLD,
+              list(PANEL_NO_DATA_BOX)]
+    return hashlib.sha256(json.dumps(params).encode()).hexdigest()[:16]
+
+
+class PanelChecker:
+    """빈 패널/No data 패널 판정 (이미지 해시 기준 캐시 → 같은 이미지는 한 번만 판정)
+
+    캐시 파일: {'classifier': panel_classifier_key(), 'results': {이미지 해시: 판정 결과}}
+    판정 기준이나 로직이 바뀌면 캐시 전체를 다시 판정하고, 판정 중 오류가 난 이미지는 저장하지 않음
+    """
+
+    def __init__(self, image_hash=file_hash, cache_path=PANEL_CHECK_CACHE_PATH, workers=4):
+        self.image_hash = image_hash
+        self.cache_path = Path(cache_path)
+        self.workers = workers
+        self.results = {}
+        # 판정 캐시 적중/미적중 수 (실행 지표용)
+        self.hits = 0
+        self.misses = 0
+        self.classifier = panel_classifier_key()
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            if cached.get('classifier') == self.classifier and isinstance(cached.get('results'), dict):
+                self.results = cached['results']
+        except (OSError, ValueError, AttributeError):
+            pass
+
+    def check(self, image_path):
+        """이미지 한 개 판정 → (해시, 판정 결과, 'cache' | 'new' | 'failed')"""
+        digest = self.image_hash(image_path)
+        if digest in self.results:
+            return digest, self.results[digest], 'cache'
+        try:
+            return digest, classify_panel_image(image_path), 'new'
+        except Exception as e:
+            logging.warning(f"빈 패널 판정 실패 {image_path}: {e}")
+            return digest, None, 'failed'
+
+    def classify_many(self, image_paths):
+        """여러 이미지 병렬 판정 → {경로: 'blank' | 'no_data' | None}, 새 판정 결과는 캐시에 저장
+
+        판정에 실패한 이미지는 정상 차트(None)로 보되 캐시하지 않아 다음 실행에서 다시 판정
+        """
+        image_paths = list(image_paths)
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            checked = list(executor.map(self.check, image_paths))
+
+        new_results = {digest: result for digest, result, source in checked if source == 'new'}
+        self.hits += sum(1 for _, _, source in checked if source == 'cache')
+        self.misses += sum(1 for _, _, source in checked if source != 'cache')
+        if new_results:
+            self.results.update(new_results)
+            try:
+                self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+                temp_path = self.cache_path.with_name(self.cache_path.name + '.tmp')
+                temp_path.write_text(json.dumps({'classifier': self.classifier, 'results': self.results}),
+                                     encoding='utf-8')
+                temp_path.replace(self.cache_path)
+            except OSError as e:
+                logging.warning(f"빈 패널 판정 캐시 저장 실패 {self.cache_path}: {e}")
+        return {path: result for path, (_, result, _) in zip(image_paths, checked)}
+
+
+class SharedImages:
+    """HTML 문서 하나 안에서 같은 내용의 이미지를 한 번만 포함
+
+    문서에 두 번 이상 나오는 이미지(No data 패널, 여러 대시보드의 같은 패널 등)는
+    <style>의 CSS 클래스 배경으로 한 번만 넣고, 차트 카드는 클래스 이름으로 참조합니다.
+    """
+
+    def __init__(self, hashes):
+        self.shared = {digest for digest, count in Counter(hashes).items() if count > 1}
+        self.payloads = {}
+        self.duplicates = 0
+        self.saved_bytes = 0
+
+    @staticmethod
+    def class_name(digest):
+        return f"img-{digest[:16]}"
+
+    def use(self, digest, payload, size):
+        """공유 대상이면 CSS 클래스 이름 반환 (payload는 처음 한 번만 포함, size: payload 데이터 크기), 아니면 None"""
+        if digest not in self.shared:
+            return None
+        if digest in self.payloads:
+            self.duplicates += 1
+            self.saved_bytes += size
+        else:
+            self.payloads[digest] = payload
+        return self.class_name(digest)
+
+    def build_style(self, mime_type="image/png"):
+        """공유 이미지 CSS 규칙 (<style> 태그, 공유 이미지가 없으면 빈 문자열)"""
+        rules = "".join(
+            f".{self.class_name(digest)}{{background-image:url(data:{mime_type};base64,{payload})}}"
+            for digest, payload in self.payloads.items()
+        )
+        return f"<style>{rules}</style>" if rules else ""
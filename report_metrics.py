@@ -0,0 +1,186 @@
+# report_metrics.py - 실행 지표를 node_exporter textfile(.prom)로 저장
+"""리포트 생성(generate)과 다운로드+생성(run) 실행이 끝날 때 실행 지표를 Prometheus 텍스트 형식으로 저장합니다.
+node_exporter의 textfile collector가 읽는 폴더(output_settings.metrics_dir)를 지정하면
+스케줄러로 돌리는 실행의 소요 시간/실패/렌더러 지연을 알림 규칙으로 감시할 수 있습니다.
+
+- 파일: <metrics_dir>/grafana_report_<모드>.prom (모드별로 덮어씀, 임시 파일에 쓴 뒤 교체)
+- 단계별 소요 시간, 서버/대시보드별 패널 시도/성공/실패 수, 렌더링 지연 히스토그램, 다운로드 바이트,
+  리포트 크기, 캐시 적중률, 최대 RSS, 마지막 실행 성공 여부/시각
+"""
+import os
+import sys
+import time
+import logging
+from collections import defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+
+METRICS_PREFIX = "grafana_report"
+# 패널 렌더링 지연 히스토그램 구간 (초)
+RENDER_SECONDS_BUCKETS = (0.25, 0.5, 1, 2, 5, 10, 20, 30, 60)
+
+
+def peak_rss_bytes():
+    """현재 프로세스의 최대 RSS (바이트, 측정 불가 시 None)"""
+    try:
+        import resource
+    except ImportError:
+        return _windows_peak_rss()
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _windows_peak_rss():
+    """Windows: GetProcessMemoryInfo의 PeakWorkingSetSize"""
+    try:
+        import ctypes
+        from ctypes import wintypes
+
+        class ProcessMemoryCounters(ctypes.Structure):
+            _fields_ = [('cb', wintypes.DWORD), ('PageFaultCount', wintypes.DWORD),
+                        ('PeakWorkingSetSize', ctypes.c_size_t), ('WorkingSetSize', ctypes.c_size_t),
+                        ('QuotaPeakPagedPoolUsage', ctypes.c_size_t), ('QuotaPagedPoolUsage', ctypes.c_size_t),
+                        ('QuotaPeakNonPagedPoolUsage', ctypes.c_size_t), ('QuotaNonPagedPoolUsage', ctypes.c_size_t),
+                        ('PagefileUsage', ctypes.c_size_t), ('PeakPagefileUsage', ctypes.c_size_t)]
+
+        counters = ProcessMemoryCounters()
+        counters.cb = ctypes.sizeof(counters)
+        process = ctypes.windll.kernel32.GetCurrentProcess()
+        if not ctypes.windll.psapi.GetProcessMemoryInfo(process, ctypes.byref(counters), counters.cb):
+            return None
+        return counters.PeakWorkingSetSize
+    except (ImportError, AttributeError, OSError):
+        return None
+
+
+def escape_label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def format_value(value):
+    """정수는 그대로, 실수는 반올림 없이 (타임스탬프/바이트가 지수 표기로 잘리지 않도록)"""
+    if isinstance(value, int):
+        return str(value)
+    return repr(float(value))
+
+
+def format_labels(labels):
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{escape_label(value)}"' for key, value in labels.items()) + "}"
+
+
+class RunMetrics:
+    """실행 한 번의 지표 수집 (mode: 'generate' | 'run')"""
+
+    def __init__(self, mode):
+        self.mode = mode
+        self.started = time.perf_counter()
+        self.phases = {}
+        # (서버, 대시보드) → {'attempted', 'succeeded', 'failed', 'resumed'}
+        self.panels = defaultdict(lambda: dict.fromkeys(('attempted', 'succeeded', 'failed', 'resumed'), 0))
+        self.render_seconds = []
+        self.downloaded_bytes = 0
+        self.reports = []
+        self.caches = {}
+        # 실행이 확정한 통합 설정과 리포트 빌더 (저장 위치 metrics_dir, 캐시 적중률을 읽음, 없으면 None)
+        self.config = None
+        self.builder = None
+
+    @contextmanager
+    def phase(self, name):
+        """단계 소요 시간 측정 (같은 단계를 여러 번 측정하면 합산)"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + time.perf_counter() - started
+
+    def add_panel_result(self, result):
+        """다운로드 결과 (report_download.PanelDownloader) 반영 - 이어받기로 건너뛴 패널은 시도에서 제외
+
+        렌더링 지연은 렌더링 요청마다 한 번만 기록 (dashboard 방식은 패널 N개가 요청 한 번을 공유)
+        """
+        job = result['job']
+        counts = self.panels[(job['server'], job['dashboard'])]
+        if result.get('resumed'):
+            counts['resumed'] += 1
+            return
+        counts['attempted'] += 1
+        counts['succeeded' if result['ok'] else 'failed'] += 1
+        if result.get('render_request'):
+            self.render_seconds.append(result['seconds'])
+        self.downloaded_bytes += result['size']
+
+    def add_report(self, group_name, report_month, paths):
+        """생성한 리포트 (분할 리포트는 목차+페이지 합계)"""
+        self.reports.append((group_name, report_month, sum(Path(path).stat().st_size for path in paths)))
+
+    def set_cache(self, name, hits, misses):
+        self.caches[name] = (hits, misses)
+
+    def render(self, success):
+        """Prometheus 텍스트 형식"""
+        lines = []
+        base = {'mode': self.mode}
+
+        def metric(name, kind, help_text, samples):
+            lines.append(f"# HELP {METRICS_PREFIX}_{name} {help_text}")
+            lines.append(f"# TYPE {METRICS_PREFIX}_{name} {kind}")
+            for suffix, labels, value in samples:
+                lines.append(f"{METRICS_PREFIX}_{name}{suffix}{format_labels(dict(base, **labels))} {format_value(value)}")
+
+        phases = dict(self.phases, total=time.perf_counter() - self.started)
+        metric("last_run_success", "gauge", "1 if the last run succeeded", [("", {}, 1 if success else 0)])
+        metric("last_run_timestamp_seconds", "gauge", "Unix time the last run finished", [("", {}, time.time())])
+        metric("phase_duration_seconds", "gauge", "Duration of each run phase",
+               [("", {'phase': name}, seconds) for name, seconds in phases.items()])
+
+        if self.panels:
+            for state in ('attempted', 'succeeded', 'failed', 'resumed'):
+                metric(f"panels_{state}", "gauge", f"Panels {state} per server and dashboard",
+                       [("", {'server': server, 'dashboard': dashboard}, counts[state])
+                        for (server, dashboard), counts in sorted(self.panels.items())])
+            metric("downloaded_bytes", "gauge", "Bytes of panel images downloaded", [("", {}, self.downloaded_bytes)])
+
+            samples = []
+            for bound in RENDER_SECONDS_BUCKETS:
+                samples.append(("_bucket", {'le': f"{bound:g}"}, sum(1 for s in self.render_seconds if s <= bound)))
+            samples.append(("_bucket", {'le': "+Inf"}, len(self.render_seconds)))
+            samples.append(("_sum", {}, sum(self.render_seconds)))
+            samples.append(("_count", {}, len(self.render_seconds)))
+            metric("render_seconds", "histogram", "Grafana render request latency", samples)
+
+        if self.reports:
+            metric("report_bytes", "gauge", "Size of each generated report",
+                   [("", {'group': group, 'month': month}, size) for group, month, size in self.reports])
+
+        # 이번 실행에서 사용하지 않은 캐시(썸네일 모드가 아닐 때 등)는 적중률 0으로 보이지 않도록 생략
+        caches = [(name, hits, misses) for name, (hits, misses) in sorted(self.caches.items()) if hits + misses]
+        if caches:
+            metric("cache_hits", "gauge", "Cache hits during the run",
+                   [("", {'cache': name}, hits) for name, hits, _ in caches])
+            metric("cache_misses", "gauge", "Cache misses during the run",
+                   [("", {'cache': name}, misses) for name, _, misses in caches])
+            metric("cache_hit_ratio", "gauge", "Cache hit ratio during the run",
+                   [("", {'cache': name}, hits / (hits + misses)) for name, hits, misses in caches])
+
+        rss = peak_rss_bytes()
+        if rss is not None:
+            metric("peak_rss_bytes", "gauge", "Peak resident set size of the run", [("", {}, rss)])
+        return "\n".join(lines) + "\n"
+
+    def write(self, metrics_dir, success):
+        """<metrics_dir>/grafana_report_<모드>.prom 저장 (node_exporter가 반쯤 쓴 파일을 읽지 않도록 교체) → 경로"""
+        if not metrics_dir:
+            return None
+        path = Path(metrics_dir) / f"{METRICS_PREFIX}_{self.mode}.prom"
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temp = path.with_name(path.name + f".{os.getpid()}.tmp")
+            temp.write_text(self.render(success), encoding='utf-8')
+            os.replace(temp, path)
+        except OSError as e:
+            logging.warning(f"실행 지표 저장 실패 {path}: {e}")
+            return None
+        return path
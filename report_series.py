@@ -0,0 +1,451 @@
+# report_series.py - 그라파나 원시 시계열 조회 및 SVG 차트 렌더링
+"""패널 PNG 대신 원시 시계열로 차트를 그리는 데이터 기반 차트 모드
+
+- 대시보드 JSON의 패널 targets로 /api/ds/query를 호출하여 원시 시계열 조회
+- NumPy 벡터 연산으로 차트 폭(픽셀 구간)에 맞춰 다운샘플링
+  (구간별 처음/최소/최대/마지막 값 유지 → 피크가 사라지지 않음)
+- 결과를 <패널명>_<ID>.series.json으로 저장하고 리포트에는 인라인 SVG로 삽입
+"""
+import re
+import json
+import html
+import logging
+from datetime import datetime, timedelta
+from pathlib import Path
+from urllib.error import HTTPError, URLError
+from urllib.parse import quote, urlencode
+from urllib.request import Request, urlopen
+
+import numpy as np
+
+SERIES_SUFFIX = ".series.json"
+# 시계열 조회 대상 패널 유형 (stat/table 등은 PNG 다운로드 사용)
+SERIES_PANEL_TYPES = ('timeseries', 'graph')
+# 그라파나 기본 팔레트
+SERIES_COLORS = ['#7EB26D', '#EAB839', '#6ED0E0', '#EF843C', '#E24D42',
+                 '#1F78C1', '#BA43A9', '#705DA0', '#508642', '#CCA300']
+# 범례에 표시할 최대 시리즈 수
+MAX_LEGEND_ITEMS = 6
+
+_INVALID_FILENAME_CHARS = re.compile(r'[\\/:*?"<>|]')
+_TEMPLATE_VARIABLE = re.compile(r'\$\{(\w+)(?::\w+)?\}|\[\[(\w+)\]\]|\$(\w+)')
+
+
+def clean_safe_filename(name):
+    """01_download_images.ps1의 Clean-SafeFileName과 같은 규칙"""
+    return _INVALID_FILENAME_CHARS.sub('_', name)
+
+
+def report_time_range(report_settings, now=None):
+    """리포트 기간 (epoch ms) - grafana_time_from~grafana_time_to(종료일 포함), 없으면 최근 30일"""
+    try:
+        start = datetime.strptime(report_settings['grafana_time_from'], '%Y-%m-%d')
+        end = datetime.strptime(report_settings['grafana_time_to'], '%Y-%m-%d') + timedelta(days=1)
+    except (KeyError, TypeError, ValueError):
+        end = now or datetime.now()
+        start = end - timedelta(days=30)
+    return int(start.timestamp() * 1000), int(end.timestamp() * 1000)
+
+
+class GrafanaClient:
+    """그라파나 HTTP API 클라이언트 (표준 라이브러리만 사용)"""
+
+    def __init__(self, url, token, timeout=30):
+        self.base_url = (url if url.startswith(('http://', 'https://')) else f"http://{url}").rstrip('/')
+        self.token = token
+        self.timeout = timeout
+        self._datasources = None
+
+    def request(self, path, body=None):
+        """GET(본문 없음)/POST(JSON 본문) 요청 → 응답 JSON"""
+        data = json.dumps(body).encode('utf-8') if body is not None else None
+        request = Request(self.base_url + path, data=data, headers={
+            'Authorization': f'Bearer {self.token}',
+            'Content-Type': 'application/json',
+            'Accept': 'application/json'
+        })
+        with urlopen(request, timeout=self.timeout) as response:
+            return json.loads(response.read().decode('utf-8'))
+
+    def render(self, path, params):
+        """이미지 렌더링 요청 (/render/...) → 응답 bytes"""
+        request = Request(f"{self.base_url}{path}?{urlencode(params)}",
+                          headers={'Authorization': f'Bearer {self.token}'})
+        with urlopen(request, timeout=self.timeout) as response:
+            return response.read()
+
+    def test_connection(self):
+        try:
+            self.request('/api/org')
+            return True
+        except (HTTPError, URLError, OSError, ValueError) as e:
+            logging.error(f"  그라파나 연결 실패 ({self.base_url}): {e}")
+            return False
+
+    def search_dashboards(self):
+        return self.request('/api/search?type=dash-db')
+
+    def get_dashboard(self, uid):
+        return self.request(f'/api/dashboards/uid/{quote(uid)}')['dashboard']
+
+    def resolve_datasource(self, datasource):
+        """패널/타깃의 datasource 값을 {uid, type} 참조로 변환 (이름 문자열, null=기본 데이터소스)"""
+        if isinstance(datasource, dict) and datasource.get('uid'):
+            return {key: datasource[key] for key in ('uid', 'type') if key in datasource}
+
+        if self._datasources is None:
+            self._datasources = self.request('/api/datasources')
+        for entry in self._datasources:
+            if (datasource is None and entry.get('isDefault')) or entry.get('name') == datasource:
+                return {'uid': entry['uid'], 'type': entry.get('type')}
+        return None
+
+    def query(self, queries, time_from, time_to):
+        """/api/ds/query 호출 → {refId: frames}"""
+        response = self.request('/api/ds/query', {
+            'queries': queries,
+            'from': str(time_from),
+            'to': str(time_to)
+        })
+        results = {}
+        for ref_id, result in response.get('results', {}).items():
+            if result.get('error'):
+                logging.warning(f"    쿼리 {ref_id} 오류: {result['error']}")
+            results[ref_id] = result.get('frames', [])
+        return results
+
+
+def iter_panels(panels):
+    """row 패널 내부(접힌 row 포함)까지 펼친 패널 목록"""
+    for panel in panels or []:
+        if panel.get('type') == 'row':
+            yield from iter_panels(panel.get('panels'))
+        else:
+            yield panel
+
+
+def template_values(dashboard):
+    """대시보드 변수의 현재 값 {이름: 값} (다중 선택은 정규식 (a|b) 형태)"""
+    values = {}
+    for variable in dashboard.get('templating', {}).get('list', []):
+        current = (variable.get('current') or {}).get('value')
+        if isinstance(current, list):
+            current = [v for v in current if v != '$__all'] or ['.*']
+            current = current[0] if len(current) == 1 else f"({'|'.join(current)})"
+        elif current == '$__all':
+            current = '.*'
+        if current is not None:
+            values[variable.get('name')] = str(current)
+    return values
+
+
+def interpolate(value, variables):
+    """문자열/딕셔너리/리스트 안의 $var, ${var}, [[var]]를 현재 값으로 치환 ($__interval 등은 그라파나가 처리)"""
+    if isinstance(value, str):
+        def replace(match):
+            name = match.group(1) or match.group(2) or match.group(3)
+            return variables.get(name, match.group(0))
+        return _TEMPLATE_VARIABLE.sub(replace, value)
+    if isinstance(value, dict):
+        return {key: interpolate(item, variables) for key, item in value.items()}
+    if isinstance(value, list):
+        return [interpolate(item, variables) for item in value]
+    return value
+
+
+def build_panel_queries(client, panel, variables, max_data_points, time_from, time_to):
+    """패널 targets → /api/ds/query 쿼리 목록"""
+    panel_datasource = interpolate(panel.get('datasource'), variables)
+    queries = []
+    for index, target in enumerate(panel.get('targets') or []):
+        if target.get('hide'):
+            continue
+        query = interpolate(dict(target), variables)
+        datasource = client.resolve_datasource(query.get('datasource') or panel_datasource)
+        if datasource is None:
+            logging.warning(f"    데이터소스를 찾을 수 없습니다: {panel.get('title')} ({query.get('datasource') or panel_datasource})")
+            continue
+        query['datasource'] = datasource
+        query['refId'] = query.get('refId') or chr(ord('A') + index)
+        query['maxDataPoints'] = max_data_points
+        query['intervalMs'] = max(1000, (time_to - time_from) // max_data_points)
+        queries.append(query)
+    return queries
+
+
+def series_name(frame, field, legend_format):
+    """시리즈 이름: legendFormat({{label}}) → displayNameFromDS → 라벨 → 프레임 이름"""
+    labels = field.get('labels') or {}
+    if legend_format and legend_format != '__auto':
+        name = re.sub(r'\{\{\s*(\w+)\s*\}\}', lambda m: labels.get(m.group(1), ''), legend_format)
+        if name.strip():
+            return name
+    config = field.get('config') or {}
+    if config.get('displayNameFromDS'):
+        return config['displayNameFromDS']
+    if labels:
+        return ', '.join(f"{key}={value}" for key, value in sorted(labels.items()) if key != '__name__') or labels.get('__name__', '')
+    return frame.get('schema', {}).get('name') or field.get('name', 'Value')
+
+
+def frames_to_series(frames, legend_format=None):
+    """data frame 목록 → [(이름, 시각 ms 배열, 값 배열)]"""
+    series = []
+    for frame in frames:
+        fields = frame.get('schema', {}).get('fields', [])
+        values = frame.get('data', {}).get('values', [])
+        time_index = next((i for i, field in enumerate(fields) if field.get('type') == 'time'), None)
+        if time_index is None or time_index >= len(values):
+            continue
+
+        times = np.asarray(values[time_index], dtype=np.float64)
+        for index, field in enumerate(fields):
+            if index == time_index or field.get('type') != 'number' or index >= len(values):
+                continue
+            # null → NaN
+            series.append((series_name(frame, field, legend_format), times,
+                           np.array(values[index], dtype=np.float64)))
+    return series
+
+
+def downsample_minmax(times, values, time_from, time_to, buckets):
+    """픽셀 구간별 처음/최소/최대/마지막 점만 남기는 벡터화 다운샘플링 (구간당 최대 4점)"""
+    times = np.asarray(times, dtype=np.float64)
+    values = np.asarray(values, dtype=np.float64)
+    finite = np.isfinite(values) & np.isfinite(times)
+    times, values = times[finite], values[finite]
+    if times.size and np.any(np.diff(times) < 0):
+        order = np.argsort(times, kind='stable')
+        times, values = times[order], values[order]
+    if times.size <= 4 * buckets or time_to <= time_from:
+        return times, values
+
+    bucket = ((times - time_from) * buckets // (time_to - time_from)).clip(0, buckets - 1).astype(np.int64)
+    starts = np.flatnonzero(np.r_[True, bucket[1:] != bucket[:-1]])
+    ends = np.r_[starts[1:], times.size] - 1
+
+    # 구간 번호 → 값 순으로 정렬하면 각 구간의 첫 원소가 최솟값, 마지막 원소가 최댓값
+    order = np.lexsort((values, bucket))
+    argmin = order[starts]
+    argmax = order[ends]
+
+    keep = np.unique(np.concatenate([starts, ends, argmin, argmax]))
+    return times[keep], values[keep]
+
+
+def median_step(times):
+    """원시 시계열의 수집 간격 (ms, 끊김 판단용)"""
+    if len(times) < 2:
+        return 0
+    return float(np.median(np.diff(np.sort(times))))
+
+
+def build_chart_series(panel, frames_by_ref, queries, time_from, time_to, buckets):
+    """패널 조회 결과 → .series.json 저장 형식"""
+    legend_formats = {query['refId']: query.get('legendFormat') for query in queries}
+    series = []
+    step = 0
+    for ref_id, frames in frames_by_ref.items():
+        for name, times, values in frames_to_series(frames, legend_formats.get(ref_id)):
+            step = max(step, median_step(times))
+            times, values = downsample_minmax(times, values, time_from, time_to, buckets)
+            series.append({
+                'name': name,
+                't': times.astype(np.int64).tolist(),
+                'v': [float(f"{value:.6g}") for value in values.tolist()]
+            })
+
+    return {
+        'title': panel.get('title') or 'Panel',
+        'panel_id': panel.get('id'),
+        'type': panel.get('type'),
+        'unit': ((panel.get('fieldConfig') or {}).get('defaults') or {}).get('unit')
+                or ((panel.get('yaxes') or [{}])[0]).get('format'),
+        'from': time_from,
+        'to': time_to,
+        'step': step,
+        'series': series
+    }
+
+
+def fetch_dashboard_series(client, uid, dashboard_dir, time_from, time_to, max_data_points=2400, buckets=1200):
+    """대시보드의 시계열 패널을 조회하여 dashboard_dir에 .series.json으로 저장 → (대상 패널 수, 성공 수)"""
+    dashboard = client.get_dashboard(uid)
+    variables = template_values(dashboard)
+    panels = [panel for panel in iter_panels(dashboard.get('panels'))
+              if panel.get('id') is not None and panel.get('type') in SERIES_PANEL_TYPES]
+
+    succeeded = 0
+    for panel in panels:
+        title = panel.get('title') or 'Panel'
+        try:
+            queries = build_panel_queries(client, panel, variables, max_data_points, time_from, time_to)
+            if not queries:
+                continue
+            frames_by_ref = client.query(queries, time_from, time_to)
+            chart = build_chart_series(panel, frames_by_ref, queries, time_from, time_to, buckets)
+        except (HTTPError, URLError, OSError, ValueError) as e:
+            logging.warning(f"    패널 {panel['id']} 조회 실패 ({title}): {e}")
+            continue
+
+        dashboard_dir.mkdir(parents=True, exist_ok=True)
+        target = dashboard_dir / f"{clean_safe_filename(title)}_{panel['id']}{SERIES_SUFFIX}"
+        target.write_text(json.dumps(chart, ensure_ascii=False, separators=(',', ':')), encoding='utf-8')
+        points = sum(len(s['t']) for s in chart['series'])
+        logging.info(f"    패널 {panel['id']} 완료: {title} (시리즈 {len(chart['series'])}개, {points}점)")
+        succeeded += 1
+    return len(panels), succeeded
+
+
+def download_series(unified_config, token, images_dir=Path("images"), url=None, target_folder=None,
+                    max_data_points=2400, buckets=1200):
+    """grafana_servers의 모든 대시보드 시계열을 images/<타임스탬프>/<서버>/<대시보드>/에 저장"""
+    time_from, time_to = report_time_range(unified_config.get('report_settings', {}))
+    if target_folder is None:
+        target_folder = Path(images_dir) / datetime.now().strftime('%Y%m%d_%H%M%S')
+    logging.info(f"시계열 저장 폴더: {target_folder}")
+
+    total = succeeded = 0
+    for server in unified_config.get('grafana_servers', []):
+        client = GrafanaClient(url or server['url'], token)
+        logging.info(f"=== 그라파나 서버: {server['name']} ({client.base_url}) ===")
+        if not client.test_connection():
+            continue
+
+        for dashboard in client.search_dashboards():
+            dashboard_dir = Path(target_folder) / server['name'] / clean_safe_filename(dashboard['title'])
+            logging.info(f"  대시보드: {dashboard['title']}")
+            try:
+                panels, done = fetch_dashboard_series(client, dashboard['uid'], dashboard_dir,
+                                                      time_from, time_to, max_data_points, buckets)
+            except (HTTPError, URLError, OSError, ValueError, KeyError) as e:
+                logging.warning(f"  대시보드 조회 실패 ({dashboard['title']}): {e}")
+                continue
+            total += panels
+            succeeded += done
+
+    logging.info(f"시계열 조회 완료: 대상 패널 {total}개, 성공 {succeeded}개")
+    return total, succeeded
+
+
+def load_chart_series(path):
+    """.series.json 로드"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+_BINARY_PREFIXES = ['', 'Ki', 'Mi', 'Gi', 'Ti', 'Pi']
+_SI_PREFIXES = ['', 'k', 'M', 'G', 'T', 'P']
+
+
+def _scaled(value, base, prefixes, suffix):
+    magnitude = 0
+    while abs(value) >= base and magnitude < len(prefixes) - 1:
+        value /= base
+        magnitude += 1
+    return f"{value:.3g} {prefixes[magnitude]}{suffix}".rstrip()
+
+
+def format_value(value, unit=None):
+    """축 눈금 값 표시 (그라파나 주요 단위)"""
+    if unit == 'percent':
+        return f"{value:.3g}%"
+    if unit == 'percentunit':
+        return f"{value * 100:.3g}%"
+    if unit in ('bytes', 'binbytes'):
+        return _scaled(value, 1024, _BINARY_PREFIXES, 'B')
+    if unit == 'decbytes':
+        return _scaled(value, 1000, _SI_PREFIXES, 'B')
+    if unit in ('bps', 'binbps'):
+        return _scaled(value, 1000, _SI_PREFIXES, 'b/s')
+    if unit in ('Bps', 'binBps'):
+        return _scaled(value, 1000, _SI_PREFIXES, 'B/s')
+    if unit == 's':
+        return f"{value:.3g}s"
+    if unit == 'ms':
+        return f"{value:.3g}ms"
+    return _scaled(value, 1000, _SI_PREFIXES, '')
+
+
+def nice_ticks(low, high, count=5):
+    """보기 좋은 축 눈금 (1/2/5 x 10^n 간격)"""
+    if high <= low:
+        high = low + 1
+    raw_step = (high - low) / count
+    magnitude = 10 ** np.floor(np.log10(raw_step))
+    step = magnitude * min((m for m in (1, 2, 5, 10) if m * magnitude >= raw_step), default=10)
+    start = np.floor(low / step) * step
+    stop = np.ceil(high / step) * step
+    return np.arange(start, stop + step / 2, step)
+
+
+def render_svg(chart, width=800, height=400):
+    """시계열 차트 → 인라인 SVG 문자열"""
+    series = [s for s in chart.get('series', []) if s['t']]
+    title = html.escape(chart.get('title', ''))
+    legend_rows = 1 if series else 0
+    left, right, top, bottom = 64, 12, 12, 28 + 18 * legend_rows
+    plot_w, plot_h = width - left - right, height - top - bottom
+    parts = [f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {width} {height}" class="chart-svg" role="img" aria-label="{title}">']
+
+    if not series:
+        parts.append(f'<text x="{width / 2:.0f}" y="{height / 2:.0f}" text-anchor="middle" class="chart-svg-empty">No data</text></svg>')
+        return ''.join(parts)
+
+    time_from, time_to = chart['from'], chart['to']
+    all_values = np.concatenate([np.asarray(s['v'], dtype=np.float64) for s in series])
+    ticks = nice_ticks(min(0.0, float(all_values.min())), float(all_values.max()))
+    y_low, y_high = float(ticks[0]), float(ticks[-1])
+
+    def x_of(times):
+        return left + (np.asarray(times, dtype=np.float64) - time_from) * plot_w / (time_to - time_from)
+
+    def y_of(values):
+        return top + plot_h - (np.asarray(values, dtype=np.float64) - y_low) * plot_h / (y_high - y_low)
+
+    # 가로 눈금선/값
+    parts.append('<g class="chart-svg-grid">')
+    for tick, y in zip(ticks, y_of(ticks)):
+        parts.append(f'<line x1="{left}" x2="{width - right}" y1="{y:.1f}" y2="{y:.1f}"/>'
+                     f'<text x="{left - 6}" y="{y + 4:.1f}" text-anchor="end">{html.escape(format_value(float(tick), chart.get("unit")))}</text>')
+    # 날짜 눈금 (최대 7개)
+    days = max(1, round((time_to - time_from) / 86400000))
+    day_step = max(1, int(np.ceil(days / 7)))
+    first_day = datetime.fromtimestamp(time_from / 1000).replace(hour=0, minute=0, second=0, microsecond=0)
+    for offset in range(0, days + 1, day_step):
+        day = first_day + timedelta(days=offset)
+        stamp = day.timestamp() * 1000
+        if time_from <= stamp <= time_to:
+            x = float(x_of(stamp))
+            parts.append(f'<text x="{x:.1f}" y="{top + plot_h + 16}" text-anchor="middle">{day:%m-%d}</text>')
+    parts.append('</g>')
+
+    # 시계열 (수집 간격의 3배 이상 비면 선을 끊음)
+    bucket_ms = (time_to - time_from) / plot_w
+    gap = 3 * max(chart.get('step') or 0, bucket_ms)
+    for index, s in enumerate(series):
+        times, values = downsample_minmax(s['t'], s['v'], time_from, time_to, plot_w)
+        xs, ys = x_of(times), y_of(values)
+        breaks = np.r_[True, np.diff(times) > gap]
+        path = ''.join(f"{'M' if brk else 'L'}{x:.1f} {y:.1f}" for brk, x, y in zip(breaks, xs, ys))
+        color = SERIES_COLORS[index % len(SERIES_COLORS)]
+        parts.append(f'<path d="{path}" fill="none" stroke="{color}" stroke-width="1.5" vector-effect="non-scaling-stroke"/>')
+
+    # 범례
+    x = left
+    legend_y = height - 8
+    shown = 0
+    for index, s in enumerate(series[:MAX_LEGEND_ITEMS]):
+        color = SERIES_COLORS[index % len(SERIES_COLORS)]
+        name = s['name'] if len(s['name']) <= 28 else s['name'][:27] + '…'
+        if x + 24 + 7 * len(name) > width - 40:
+            break
+        shown += 1
+        parts.append(f'<rect x="{x}" y="{legend_y - 8}" width="10" height="3" fill="{color}"/>'
+                     f'<text x="{x + 14}" y="{legend_y}" class="chart-svg-legend">{html.escape(name)}</text>')
+        x += 24 + 7 * len(name)
+    if len(series) > shown:
+        parts.append(f'<text x="{x}" y="{legend_y}" class="chart-svg-legend">+{len(series) - shown}</text>')
+
+    parts.append('</svg>')
+    return ''.join(parts)
@@ -0,0 +1,255 @@
+# report_stats.py - 서버 월간 요약 통계 계산 (가용률/CPU/메모리/임계치 초과)
+"""servers.<이름>.summary / availability를 손으로 입력하는 대신 원시 지표로 계산합니다.
+
+- 서버별 up/CPU/메모리 시계열을 /api/ds/query로 조회 (여러 서버를 한 요청으로 묶음)
+- 같은 시간 격자(step)에 정렬한 (서버 수 x 시점 수) 행렬에서 전체 서버를 한 번에 벡터 연산
+- 결과는 stats/<YYYY_MM>.json에 저장되고, 리포트 생성 시 설정 값이 없는 항목만 채움
+  (unified_config.json에 값이 있으면 설정 값이 우선)
+- 서버별 월간 지표는 이력 저장소(stats/history.sqlite3)에도 추가되어 월별 추이에 사용
+"""
+import json
+import logging
+import warnings
+from datetime import datetime
+from pathlib import Path
+
+from report_history import MetricsHistory
+
+STATS_DIR = Path("stats")
+
+# 설정의 stats_settings로 덮어쓸 수 있는 기본값 (node_exporter 기준)
+# $instance: servers.<이름>.instance (없으면 hostname)
+DEFAULT_STATS_SETTINGS = {
+    'datasource': None,
+    'step': 300,
+    'batch_size': 20,
+    'queries': {
+        'up': 'max(up{instance=~"$instance(:[0-9]+)?"})',
+        'cpu': '100 * (1 - avg(rate(node_cpu_seconds_total{mode="idle",instance=~"$instance(:[0-9]+)?"}[5m])))',
+        'memory': '100 * (1 - sum(node_memory_MemAvailable_bytes{instance=~"$instance(:[0-9]+)?"})'
+                  ' / sum(node_memory_MemTotal_bytes{instance=~"$instance(:[0-9]+)?"}))'
+    },
+    'thresholds': {
+        'cpu': {'warning': 80, 'critical': 90},
+        'memory': {'warning': 85, 'critical': 95}
+    }
+}
+STATS_METRICS = ('up', 'cpu', 'memory')
+METRIC_LABELS = {'cpu': 'CPU', 'memory': '메모리'}
+
+
+def stats_settings(unified_config):
+    """기본값에 stats_settings를 덮어쓴 설정"""
+    custom = (unified_config or {}).get('stats_settings', {})
+    settings = dict(DEFAULT_STATS_SETTINGS, **{k: v for k, v in custom.items() if k not in ('queries', 'thresholds')})
+    settings['queries'] = dict(DEFAULT_STATS_SETTINGS['queries'], **custom.get('queries', {}))
+    settings['thresholds'] = {
+        metric: dict(DEFAULT_STATS_SETTINGS['thresholds'].get(metric, {}), **custom.get('thresholds', {}).get(metric, {}))
+        for metric in set(DEFAULT_STATS_SETTINGS['thresholds']) | set(custom.get('thresholds', {}))
+    }
+    return settings
+
+
+def stats_path(report_month, stats_dir=STATS_DIR):
+    """'2025. 05' → stats/2025_05.json"""
+    return Path(stats_dir) / f"{report_month.replace('. ', '_')}.json"
+
+
+def load_server_stats(report_month, stats_dir=STATS_DIR):
+    """계산된 서버 통계 {서버명: {...}} (없으면 빈 dict)"""
+    path = stats_path(report_month, stats_dir)
+    if not report_month or not path.exists():
+        return {}
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f).get('servers', {})
+    except (OSError, ValueError) as e:
+        logging.warning(f"서버 통계 파일 읽기 실패 {path}: {e}")
+        return {}
+
+
+def merge_server_details(server_details, computed):
+    """계산 값 위에 설정 값을 덮어씀 (설정에 있는 키가 우선, summary는 항목별)"""
+    if not computed:
+        return server_details
+    merged = dict(server_details)
+    if 'availability' not in server_details:
+        merged['availability'] = computed['availability']
+    summary = dict(computed['summary'])
+    summary.update(server_details.get('summary', {}))
+    merged['summary'] = summary
+    return merged
+
+
+def align_series(frames, time_from, step_ms, length):
+    """data frame 목록을 고정 시간 격자 벡터로 정렬 (값이 없으면 NaN, 여러 시리즈는 시점별 최댓값)"""
+    import numpy as np
+    from report_series import frames_to_series
+
+    row = np.full(length, np.nan)
+    for _, times, values in frames_to_series(frames):
+        index = np.rint((times - time_from) / step_ms).astype(np.int64)
+        valid = (index >= 0) & (index < length) & np.isfinite(values)
+        np.fmax.at(row, index[valid], values[valid])
+    return row
+
+
+def count_episodes(breached):
+    """행별 연속 구간 수 (False→True 전환 횟수)"""
+    starts = breached.copy()
+    starts[:, 1:] &= ~breached[:, :-1]
+    return starts.sum(axis=1)
+
+
+def classify_breaches(values, warning, critical):
+    """임계치(warning) 이상 연속 구간을 구간 최댓값 기준으로 긴급/경고로 분류 → (경고 수, 긴급 수)"""
+    import numpy as np
+    breached = np.nan_to_num(values, nan=-np.inf) >= warning
+    starts = breached.copy()
+    starts[:, 1:] &= ~breached[:, :-1]
+
+    # 전체 서버를 1차원으로 펼쳐 구간 번호 부여 (행 경계에서는 항상 새 구간)
+    episode = np.cumsum(starts.ravel()) - 1
+    flat = breached.ravel()
+    n_episodes = int(starts.sum())
+    if not n_episodes:
+        zeros = np.zeros(values.shape[0], dtype=np.int64)
+        return zeros, zeros
+    peak = np.full(n_episodes, -np.inf)
+    np.maximum.at(peak, episode[flat], values.ravel()[flat])
+    episode_row = np.nonzero(starts)[0]
+    is_critical = (peak >= critical).astype(np.float64)
+    critical_count = np.bincount(episode_row, weights=is_critical, minlength=values.shape[0]).astype(np.int64)
+    warning_count = np.bincount(episode_row, weights=1 - is_critical, minlength=values.shape[0]).astype(np.int64)
+    return warning_count, critical_count
+
+
+def compute_fleet_stats(matrices, thresholds, step_ms):
+    """(서버 수 x 시점 수) 지표 행렬 → 지표별 서버 벡터 (전체 서버 한 번에 계산)"""
+    import numpy as np
+    up = matrices['up']
+    stats = {}
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)  # 데이터가 전혀 없는 서버 (NaN)
+        has_up = np.isfinite(up).any(axis=1)
+        running = np.nan_to_num(up, nan=0.0) > 0
+        stats['availability'] = np.where(has_up, running.mean(axis=1) * 100, np.nan)
+        stats['downtime_minutes'] = np.where(has_up, (~running).sum(axis=1) * step_ms / 60000, np.nan)
+        stats['outages'] = np.where(has_up, count_episodes(~running), 0)
+
+        for metric in ('cpu', 'memory'):
+            values = matrices[metric]
+            stats[f'{metric}_p95'] = np.nanpercentile(values, 95, axis=1)
+            stats[f'{metric}_max'] = np.nanmax(values, axis=1)
+            limits = thresholds.get(metric, {})
+            stats[f'{metric}_warning'], stats[f'{metric}_critical'] = classify_breaches(
+                values, limits.get('warning', np.inf), limits.get('critical', np.inf))
+    return stats
+
+
+def _number(value, digits=1):
+    return None if value != value else round(float(value), digits)  # NaN → None
+
+
+def build_server_summary(stats, index):
+    """서버 한 대의 통계 → server_section 표시 값"""
+    server = {key: (_number(values[index], 2) if values.dtype.kind == 'f' else int(values[index]))
+              for key, values in stats.items()}
+    warning = sum(server[f'{metric}_warning'] for metric in ('cpu', 'memory'))
+    critical = sum(server[f'{metric}_critical'] for metric in ('cpu', 'memory')) + server['outages']
+
+    notes = []
+    for metric in ('cpu', 'memory'):
+        if server[f'{metric}_max'] is not None:
+            notes.append(f"{METRIC_LABELS[metric]} 최대 {server[f'{metric}_max']:.1f}% (p95 {server[f'{metric}_p95']:.1f}%)")
+    if server['outages']:
+        notes.append(f"중단 {server['outages']}회 ({server['downtime_minutes']:.0f}분)")
+    notes.append(f"임계치 초과 긴급 {critical}건 · 경고 {warning}건" if warning or critical else "임계치 초과 없음")
+
+    availability = server['availability']
+    return {
+        'availability': f"{availability:.2f}%" if availability is not None else 'unknown',
+        'summary': {
+            'total_alerts': {'value': warning + critical, 'label': '전체'},
+            'critical_alerts': {'value': critical, 'label': '긴급'},
+            'warning_alerts': {'value': warning, 'label': '경고'},
+            'top5_note': ' · '.join(notes)
+        },
+        'metrics': server
+    }
+
+
+def collect_fleet_stats(client, servers, settings, time_from, time_to):
+    """서버별 지표 조회 → (서버 이름 목록, {지표: 행렬})"""
+    import numpy as np
+    from report_series import interpolate
+
+    step_ms = int(settings['step']) * 1000
+    length = max(1, int(np.ceil((time_to - time_from) / step_ms)))
+    names = sorted(servers)
+    matrices = {metric: np.full((len(names), length), np.nan) for metric in STATS_METRICS}
+    datasource = client.resolve_datasource(settings.get('datasource'))
+    if datasource is None:
+        raise ValueError(f"데이터소스를 찾을 수 없습니다: {settings.get('datasource') or '기본 데이터소스'}")
+
+    batch_size = max(1, int(settings.get('batch_size', 20)))
+    for start in range(0, len(names), batch_size):
+        queries = []
+        for row in range(start, min(start + batch_size, len(names))):
+            info = servers[names[row]]
+            variables = {'instance': info.get('instance') or info.get('hostname', names[row]),
+                         'hostname': info.get('hostname', names[row]), 'server': names[row]}
+            for metric in STATS_METRICS:
+                queries.append({
+                    'refId': f"{row}:{metric}",
+                    'datasource': datasource,
+                    'expr': interpolate(settings['queries'][metric], variables),
+                    'intervalMs': step_ms,
+                    'maxDataPoints': length
+                })
+        logging.info(f"  지표 조회: 서버 {start + 1}~{min(start + batch_size, len(names))} / {len(names)}")
+        for ref_id, frames in client.query(queries, time_from, time_to).items():
+            row, metric = ref_id.split(':', 1)
+            matrices[metric][int(row)] = align_series(frames, time_from, step_ms, length)
+    return names, matrices
+
+
+def compute_server_stats(unified_config, client, stats_dir=STATS_DIR, history=None):
+    """이번 달 서버 통계 계산 후 stats/<YYYY_MM>.json 저장 → 저장 경로"""
+    from report_series import report_time_range
+
+    settings = stats_settings(unified_config)
+    report_month = unified_config.get('report_settings', {}).get('report_month', '')
+    time_from, time_to = report_time_range(unified_config.get('report_settings', {}))
+    # 진행 중인 달은 현재 시각까지만 (미래 구간을 중단으로 계산하지 않도록)
+    time_to = min(time_to, int(datetime.now().timestamp() * 1000))
+    servers = unified_config.get('servers', {})
+    if not servers:
+        raise ValueError("servers 섹션에 서버가 없습니다")
+
+    names, matrices = collect_fleet_stats(client, servers, settings, time_from, time_to)
+    stats = compute_fleet_stats(matrices, settings['thresholds'], int(settings['step']) * 1000)
+    result = {
+        'report_month': report_month,
+        'generated': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'from': time_from,
+        'to': time_to,
+        'step': settings['step'],
+        'thresholds': settings['thresholds'],
+        'servers': {name: build_server_summary(stats, index) for index, name in enumerate(names)}
+    }
+
+    path = stats_path(report_month, stats_dir)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(path.name + '.tmp')
+    temp_path.write_text(json.dumps(result, ensure_ascii=False, indent=2), encoding='utf-8')
+    temp_path.replace(path)
+
+    history = history or MetricsHistory()
+    rows = history.append_month(report_month, {name: server['metrics'] for name, server in result['servers'].items()})
+    logging.info(f"  지표 이력 추가: {report_month} ({rows}개 값, {history.path})")
+
+    for name in names:
+        server = result['servers'][name]
+        logging.info(f"  {name}: 가용률 {server['availability']}, {server['summary']['top5_note']}")
+    return path
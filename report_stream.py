@@ -0,0 +1,54 @@
+# report_stream.py - 리포트 HTML 저장 시 이미지 base64 스트리밍 인코딩
+"""이미지를 base64 문자열로 만들어 템플릿에 넣는 대신, HTML에는 이미지 경로 표시(marker)만 넣고
+파일로 저장할 때 이미지를 mmap으로 열어 3의 배수 크기 조각 단위로 base64 인코딩하여 바로 씁니다.
+
+- 기존: 파일 bytes → base64 bytes → str → 템플릿 치환 str → 리포트 문자열 연결 (이미지마다 여러 번 복사)
+- 변경: mmap 조각(memoryview, 복사 없음) → base64 조각 → 파일 (이미지 데이터는 조각 단위로 한 번만 복사)
+리포트 문자열에는 이미지 데이터가 들어가지 않으므로 메모리 사용량이 이미지 크기와 거의 무관합니다.
+"""
+import mmap
+import logging
+import binascii
+
+# base64는 3바이트 → 4문자 단위이므로 조각 크기가 3의 배수이면 조각별 결과를 그대로 이어 쓸 수 있음
+BASE64_CHUNK_SIZE = 3 * 256 * 1024
+# HTML 안의 이미지 표시 (파일 경로와 HTML에는 NUL 문자가 없음)
+IMAGE_MARKER = "\x00"
+
+
+def image_marker(image_path):
+    """리포트 HTML에 넣을 이미지 표시 (저장 시 base64 데이터로 바뀜)"""
+    return f"{IMAGE_MARKER}{image_path}{IMAGE_MARKER}"
+
+
+def base64_length(size):
+    """size 바이트를 base64로 인코딩한 길이"""
+    return 4 * ((size + 2) // 3)
+
+
+def write_base64_file(out, image_path, chunk_size=BASE64_CHUNK_SIZE):
+    """이미지 파일을 base64로 인코딩하여 열린 바이너리 파일에 씀 → 쓴 바이트 수"""
+    written = 0
+    with open(image_path, "rb") as image_file:
+        try:
+            mapped = mmap.mmap(image_file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return 0  # 빈 파일은 mmap 불가
+        with mapped, memoryview(mapped) as view:
+            for offset in range(0, len(view), chunk_size):
+                written += out.write(binascii.b2a_base64(view[offset:offset + chunk_size], newline=False))
+    return written
+
+
+def write_report_html(path, html, chunk_size=BASE64_CHUNK_SIZE):
+    """이미지 표시가 들어 있는 리포트 HTML을 저장 (표시 위치에 이미지 base64 데이터를 스트리밍)"""
+    parts = html.split(IMAGE_MARKER)
+    with open(path, "wb") as out:
+        for index, part in enumerate(parts):
+            if index % 2 == 0:
+                out.write(part.encode("utf-8"))
+                continue
+            try:
+                write_base64_file(out, part, chunk_size)
+            except OSError as e:
+                logging.warning(f"이미지 변환 실패 {part}: {e}")
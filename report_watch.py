@@ -0,0 +1,70 @@
+# report_watch.py - 폴더 변경 감시 (watch 모드용 폴링 감시기)
+import os
+import time
+from pathlib import Path
+
+
+def is_relative_to(path, base):
+    """path가 base 폴더 아래에 있는지 확인 (Python 3.9 미만 호환)"""
+    try:
+        Path(path).relative_to(base)
+        return True
+    except ValueError:
+        return False
+
+
+def snapshot(roots):
+    """감시 대상 파일의 {경로: (수정시각, 크기)} 스냅샷
+
+    roots: [(폴더 경로, 하위 폴더 포함 여부), ...]
+    """
+    entries = {}
+    pending = [(Path(root), recursive) for root, recursive in roots]
+    while pending:
+        folder, recursive = pending.pop()
+        try:
+            with os.scandir(folder) as it:
+                for entry in it:
+                    path = Path(entry.path)
+                    if entry.is_dir(follow_symlinks=False):
+                        entries[path] = (None, None)
+                        if recursive:
+                            pending.append((path, True))
+                    else:
+                        stat = entry.stat()
+                        entries[path] = (stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            continue
+    return entries
+
+
+class FolderWatcher:
+    """주기적 스냅샷 비교로 변경 파일 감지 (외부 패키지 없이 동작)"""
+
+    def __init__(self, roots, interval=1.0, debounce=2.0):
+        # roots: 감시 대상 목록을 반환하는 함수 (최신 이미지 폴더가 바뀔 수 있으므로)
+        self.roots = roots
+        self.interval = interval
+        self.debounce = debounce
+        self.previous = snapshot(self.roots())
+
+    def _diff(self, current):
+        changed = {path for path, stamp in current.items() if self.previous.get(path) != stamp}
+        changed.update(path for path in self.previous if path not in current)
+        return changed
+
+    def wait_for_changes(self):
+        """변경이 생긴 뒤 debounce 시간 동안 추가 변경이 없으면 변경 경로 집합 반환"""
+        changed = set()
+        last_change = None
+        while True:
+            time.sleep(self.interval)
+            current = snapshot(self.roots())
+            diff = self._diff(current)
+            self.previous = current
+
+            if diff:
+                changed |= diff
+                last_change = time.monotonic()
+            elif changed and time.monotonic() - last_change >= self.debounce:
+                return changed
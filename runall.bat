@@ -33,7 +33,7 @@ if not exist "config\unified_config.json" (
 :: 0단계: 설정 파일 검증
 echo [0/3] 통합 설정 파일 검증 중...
 echo.
-python enhanced_config_validator.py
+python grafana_report.py validate
 
 if %ERRORLEVEL% neq 0 (
     echo.
@@ -95,7 +95,7 @@ if %ERRORLEVEL% neq 0 (
 echo.
 echo [2/3] 통합 설정 기반 리포트 생성 중...
 echo.
-python "02_generate_report_unified.py"
+python grafana_report.py generate
 
 if %ERRORLEVEL% neq 0 (
     echo.
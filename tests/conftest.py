@@ -0,0 +1,91 @@
+# tests/conftest.py - 프로젝트 루트의 모듈(report_*.py, grafana_report.py)을 import 할 수 있도록 경로 추가
+import json
+import shutil
+import struct
+import sys
+import threading
+import zlib
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+
+def load_grafana_stub():
+    """tools/grafana_stub.py 모듈 로드 (tools는 패키지가 아님)"""
+    import importlib.util
+    spec = importlib.util.spec_from_file_location("grafana_stub", PROJECT_ROOT / "tools" / "grafana_stub.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def grafana_stub():
+    """같은 프로세스에서 임의 포트로 띄운 그라파나 API 스텁 → (스텁 모듈, 주소 'HOST:PORT')"""
+    stub = load_grafana_stub()
+    stub.GrafanaStubHandler.quiet = True
+    server = stub.ThreadingHTTPServer(("127.0.0.1", 0), stub.GrafanaStubHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield stub, f"127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def write_png(path, width=120, height=80, color=(24, 27, 31), line=None):
+    """Pillow 없이 단색 RGB PNG 저장 (line: 주어지면 가운데에 그 색의 가로선)"""
+    rows = []
+    for y in range(height):
+        pixel = bytes(line if line and y == height // 2 else color)
+        rows.append(b"\x00" + pixel * width)
+
+    def chunk(kind, data):
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data) & 0xffffffff)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"\x89PNG\r\n\x1a\n"
+                     + chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0))
+                     + chunk(b"IDAT", zlib.compress(b"".join(rows)))
+                     + chunk(b"IEND", b""))
+    return path
+
+
+def load_generator():
+    """02_generate_report_unified.py 모듈 (grafana_report.load_generator와 같은 방식)"""
+    from grafana_report import load_generator
+    return load_generator()
+
+
+@pytest.fixture
+def workspace(tmp_path, monkeypatch):
+    """예시 설정/템플릿과 대시보드 3개의 이미지 폴더를 갖춘 작업 폴더 (현재 폴더로 이동) → 경로
+
+    images/20250601_000000/Production-Server/<대시보드>/<패널>_<ID>.png
+    """
+    shutil.copytree(PROJECT_ROOT / "templates", tmp_path / "templates")
+    (tmp_path / "config").mkdir()
+    config = json.loads((PROJECT_ROOT / "config" / "unified_config_example.json").read_text(encoding="utf-8"))
+    config["output_settings"]["metrics_dir"] = ""
+    (tmp_path / "config" / "unified_config.json").write_text(json.dumps(config, ensure_ascii=False, indent=2),
+                                                              encoding="utf-8")
+    server_folder = tmp_path / "images" / "20250601_000000" / "Production-Server"
+    for dashboard in ("Mail-Server", "Web-Server", "DB-Server"):
+        for panel_id, name in enumerate(("CPU_Usage", "Memory_Usage"), start=1):
+            write_png(server_folder / dashboard / f"{name}_{panel_id}.png", line=(115, 191, 105 + panel_id))
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def update_config(workspace, section, **values):
+    """작업 폴더 설정 파일의 섹션 값 변경"""
+    path = workspace / "config" / "unified_config.json"
+    config = json.loads(path.read_text(encoding="utf-8"))
+    config.setdefault(section, {}).update(values)
+    path.write_text(json.dumps(config, ensure_ascii=False, indent=2), encoding="utf-8")
+    return config
@@ -0,0 +1,60 @@
+# tests/test_batch_months.py - 여러 월 일괄 생성 (--month/--months)
+import shutil
+from datetime import date
+
+import pytest
+
+from conftest import load_generator
+
+
+def test_month_settings_end_at_month_end_or_today():
+    generator = load_generator()
+    settings = generator.month_report_settings("2024-02", today=date(2025, 6, 10))
+    assert settings['report_month'] == "2024. 02"
+    assert settings['period'] == "2024-02-01 ~ 2024-02-29"
+    assert (settings['grafana_time_from'], settings['grafana_time_to']) == ("2024-02-01", "2024-02-29")
+
+    current = generator.month_report_settings("2025-06", today=date(2025, 6, 10))
+    assert current['grafana_time_to'] == "2025-06-10"
+
+
+def test_month_args_merge_range_and_folders():
+    generator = load_generator()
+    args = generator.parse_args(["--months", "2024-11..2025-01", "--month", "2024-12=images/old", "--month", "2025-03"])
+    assert args.months == [("2024-11", None), ("2024-12", "images/old"), ("2025-01", None), ("2025-03", None)]
+
+    for bad in (["--months", "2025-03..2025-01"], ["--month", "2025-13"], ["--watch", "--month", "2025-01"]):
+        with pytest.raises(SystemExit):
+            generator.parse_args(bad)
+
+
+def test_month_folder_is_latest_download_in_that_or_next_month(workspace):
+    generator = load_generator()
+    images = workspace / "images"
+    for name in ("20250415_000000", "20250502_000000", "20250503_000000", "backup"):
+        (images / name).mkdir()
+
+    assert generator.find_month_images_folder("2025-04") == images.relative_to(workspace) / "20250503_000000"
+    assert generator.find_month_images_folder("2025-05") == images.relative_to(workspace) / "20250601_000000"
+    assert generator.find_month_images_folder("2025-03") == images.relative_to(workspace) / "20250415_000000"
+    assert generator.find_month_images_folder("2024-12") is None
+
+
+def test_batch_generates_each_month_in_one_run(workspace):
+    shutil.copytree(workspace / "images" / "20250601_000000", workspace / "images" / "20250501_000000")
+    generator = load_generator()
+
+    assert generator.main(["--months", "2025-04..2025-05", "--group", "메일시스템"])
+
+    reports = sorted(path.name for path in (workspace / "output").glob("*.html"))
+    assert [name.rsplit("_", 2)[0] for name in reports] == ["메일시스템_2025_04", "메일시스템_2025_05"]
+    april = next((workspace / "output").glob("메일시스템_2025_04_*.html")).read_text(encoding="utf-8")
+    assert "2025-04-01 ~ 2025-04-30" in april
+    # 설정 파일의 report_settings는 바뀌지 않음
+    assert '"report_month": "2025. 05"' in (workspace / "config" / "unified_config.json").read_text(encoding="utf-8")
+
+
+def test_batch_fails_when_a_month_has_no_images(workspace):
+    generator = load_generator()
+    assert not generator.main(["--month", "2024-01", "--group", "메일시스템"])
+    assert not list(workspace.glob("output/*.html"))
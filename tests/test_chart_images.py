@@ -0,0 +1,55 @@
+# tests/test_chart_images.py - 썸네일 / 원본 side file
+import re
+
+import pytest
+
+pytest.importorskip("PIL")
+
+from conftest import load_generator, update_config, write_png
+from report_images import ChartImageStore
+
+
+def test_thumbnail_is_downscaled_jpeg_and_cached(tmp_path):
+    image = write_png(tmp_path / "chart.png", 1200, 800, line=(115, 191, 105))
+    store = ChartImageStore(thumbnail_width=300, thumbnail_quality=50, cache_dir=tmp_path / "thumbs")
+
+    data, size = store.make_thumbnail(image)
+    assert size == (300, 200)
+    assert data[:2] == b"\xff\xd8"   # JPEG
+    assert len(list((tmp_path / "thumbs").iterdir())) == 1
+
+    assert store.make_thumbnail(image) == (data, size)
+    assert store.cache_stats['thumbnail_misses'] == 1 and store.cache_stats['thumbnail_hits'] == 1
+
+
+def test_small_image_is_not_upscaled(tmp_path):
+    image = write_png(tmp_path / "chart.png", 120, 80)
+    store = ChartImageStore(thumbnail_width=300, cache_dir=tmp_path / "thumbs")
+    assert store.make_thumbnail(image)[1] == (120, 80)
+
+
+def test_full_image_is_published_once_per_content(tmp_path):
+    first = write_png(tmp_path / "a" / "chart.png", line=(1, 2, 3))
+    same = write_png(tmp_path / "b" / "chart.png", line=(1, 2, 3))
+    store = ChartImageStore(cache_dir=tmp_path / "thumbs")
+    output_dir = tmp_path / "output"
+
+    url = store.publish_full_image(first, output_dir)
+    assert re.fullmatch(r"assets/charts/[0-9a-f]{16}\.png", url)
+    assert store.publish_full_image(same, output_dir) == url
+    assert (output_dir / url).read_bytes() == first.read_bytes()
+
+
+def test_thumbnail_mode_links_full_resolution_side_files(workspace):
+    update_config(workspace, "output_settings", image_mode="thumbnail", thumbnail_width=60)
+    generator = load_generator()
+    assert generator.create_unified_report()
+
+    path, = (workspace / "output").glob("메일시스템_*.html")
+    html = path.read_text(encoding="utf-8")
+    links = re.findall(r'<a href="([^"]+)"[^>]*class="chart-zoom"', html)
+    assert len(links) == 2
+    assert all((workspace / "output" / link).is_file() for link in links)
+    assert html.count('src="data:image/jpeg;base64,') == 2
+    assert "data:image/png" not in html
+    assert html.count('width="60" height="40"') == 2
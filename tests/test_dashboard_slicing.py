@@ -0,0 +1,87 @@
+# tests/test_dashboard_slicing.py - dashboard 렌더링 방식의 gridPos → 픽셀 자르기
+import io
+
+import pytest
+
+Image = pytest.importorskip("PIL.Image")
+
+from report_download import PanelDownloader, dashboard_viewport, panel_rect
+
+# 폭 2400, 좌우 여백 16, 헤더 40인 페이지: 격자 폭 2368 → 열 폭 (2368 - 23 * 8) / 24 = 91
+WIDTH, PADDING, PAGE_TOP = 2400, 16, 40
+BACKGROUND = (17, 18, 23)
+BORDER = (255, 255, 255)
+# gridPos → 손으로 계산한 패널 위치 (left, top, right, bottom)와 내부 색
+PANELS = [
+    ({'x': 0, 'y': 0, 'w': 12, 'h': 8}, (16, 40, 1196, 336), (200, 0, 0)),
+    ({'x': 12, 'y': 0, 'w': 12, 'h': 8}, (1204, 40, 2384, 336), (0, 200, 0)),
+    ({'x': 0, 'y': 8, 'w': 24, 'h': 8}, (16, 344, 2384, 640), (0, 0, 200)),
+    ({'x': 6, 'y': 16, 'w': 6, 'h': 4}, (610, 648, 1196, 792), (200, 200, 0)),
+]
+HEIGHT = 792 + PADDING
+
+
+def synthetic_composite():
+    """패널마다 1px 흰 테두리와 고유 내부 색을 그린 대시보드 이미지"""
+    image = Image.new("RGB", (WIDTH, HEIGHT), BACKGROUND)
+    for _, (left, top, right, bottom), color in PANELS:
+        image.paste(BORDER, (left, top, right, bottom))
+        image.paste(color, (left + 1, top + 1, right - 1, bottom - 1))
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+class CompositeClient:
+    def __init__(self, png):
+        self.png = png
+        self.requests = []
+
+    def render(self, path, params):
+        self.requests.append((path, params))
+        return self.png
+
+
+def make_jobs(tmp_path):
+    return [{'server': 'S', 'dashboard': 'D', 'uid': 'uid1', 'panel_id': index, 'title': f'P{index}',
+             'type': 'timeseries', 'grid': grid, 'path': tmp_path / f"P{index}.png"}
+            for index, (grid, _, _) in enumerate(PANELS, start=1)]
+
+
+def test_panel_rect_with_page_padding():
+    for grid, rect, _ in PANELS:
+        assert panel_rect(grid, WIDTH, PADDING, PAGE_TOP) == rect
+
+
+def test_panel_rect_without_padding_spans_full_width():
+    assert panel_rect({'x': 0, 'y': 0, 'w': 24, 'h': 1}, WIDTH) == (0, 0, WIDTH, 30)
+
+
+def test_viewport_includes_bottom_padding(tmp_path):
+    assert dashboard_viewport(make_jobs(tmp_path), WIDTH, PADDING, PAGE_TOP) == (WIDTH, HEIGHT)
+
+
+def test_download_dashboard_slices_panels_at_borders(tmp_path):
+    client = CompositeClient(synthetic_composite())
+    downloader = PanelDownloader({'S': client}, {'orgId': 1, 'width': 1200, 'height': 800}, strategy='dashboard',
+                                 dashboard_width=WIDTH, page_layout=(PADDING, PAGE_TOP))
+    jobs = make_jobs(tmp_path)
+
+    results = downloader.download_dashboard(jobs)
+
+    assert [result['ok'] for result in results] == [True] * len(PANELS)
+    path, params = client.requests[0]
+    assert path == "/render/d/uid1"
+    assert (params['width'], params['height'], params['kiosk']) == (WIDTH, HEIGHT, 1)
+    for job, (_, (left, top, right, bottom), color) in zip(jobs, PANELS):
+        with Image.open(job['path']) as panel:
+            panel = panel.convert("RGB")
+            assert panel.size == (right - left, bottom - top)
+            # 네 모서리는 테두리, 테두리 안쪽은 패널 색 (배경이나 이웃 패널이 섞이지 않음)
+            last_x, last_y = panel.width - 1, panel.height - 1
+            for corner in ((0, 0), (last_x, 0), (0, last_y), (last_x, last_y)):
+                assert panel.getpixel(corner) == BORDER
+            assert panel.getpixel((1, 1)) == color
+            assert panel.getpixel((last_x - 1, last_y - 1)) == color
+            colors = {color for _, color in panel.getcolors(maxcolors=16)}
+            assert colors == {BORDER, color}
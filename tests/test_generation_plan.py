@@ -0,0 +1,57 @@
+# tests/test_generation_plan.py - 선택 생성 (--group/--server/--dashboard)
+import json
+
+import pytest
+
+from conftest import PROJECT_ROOT, load_generator
+
+
+def example_plan(**filters):
+    generator = load_generator()
+    config = json.loads((PROJECT_ROOT / "config" / "unified_config_example.json").read_text(encoding="utf-8"))
+    plan = generator.build_generation_plan(generator.load_system_groups(config),
+                                           generator.load_dashboard_config(config), **filters)
+    return {name: info['servers'] for name, info in plan.items()}
+
+
+def test_plan_without_filters_keeps_every_active_group():
+    assert example_plan() == {
+        "전체시스템": ["Mail-Server", "Web-Server", "DB-Server"],
+        "웹서비스": ["Web-Server", "DB-Server"],
+        "메일시스템": ["Mail-Server"],
+    }
+
+
+def test_plan_filters_groups_and_sections_with_wildcards():
+    assert example_plan(groups=["웹*"]) == {"웹서비스": ["Web-Server", "DB-Server"]}
+    assert example_plan(dashboards=["DB-*"]) == {"전체시스템": ["DB-Server"], "웹서비스": ["DB-Server"]}
+    assert example_plan(groups=["전체*"], servers=["Mail-Server", "Web-Server"]) == {
+        "전체시스템": ["Mail-Server", "Web-Server"]
+    }
+    assert example_plan(servers=["Unknown"]) == {}
+
+
+def test_args_reject_filters_in_watch_mode():
+    generator = load_generator()
+    args = generator.parse_args(["--group", "웹서비스", "--group", "메일*", "--dashboard", "DB-Server"])
+    assert (args.group, args.dashboard, args.server) == (["웹서비스", "메일*"], ["DB-Server"], None)
+
+    with pytest.raises(SystemExit):
+        generator.parse_args(["--watch", "--server", "Web-Server"])
+
+
+def test_selected_generation_writes_only_matching_sections(workspace):
+    generator = load_generator()
+    assert generator.main(["--group", "웹*", "--dashboard", "DB-Server"])
+
+    path, = (workspace / "output").glob("*.html")
+    assert path.name.startswith("웹서비스_")
+    html = path.read_text(encoding="utf-8")
+    assert html.count('class="server-section') == 1
+    assert "db-server-01" in html and "web-server-01" not in html
+
+
+def test_no_matching_group_fails(workspace):
+    generator = load_generator()
+    assert not generator.create_unified_report(groups=["없는그룹"])
+    assert not list(workspace.glob("output/*.html"))
@@ -0,0 +1,52 @@
+# tests/test_images_check.py - 이미지 폴더 사전 점검 (서버 폴더 누락 시 해당 그룹만 건너뜀)
+import shutil
+
+from conftest import load_generator, update_config
+from enhanced_config_validator import check_images_tree, load_validated_config
+
+SERVER_FOLDER = "images/20250601_000000/Production-Server"
+
+
+def test_missing_server_is_a_warning_by_default(workspace):
+    shutil.rmtree(workspace / SERVER_FOLDER / "Mail-Server")
+    (workspace / SERVER_FOLDER / "DB-Server" / "CPU_Usage_1.png").write_bytes(b"")
+    for path in (workspace / SERVER_FOLDER / "DB-Server").glob("Memory*"):
+        path.unlink()
+
+    ok, missing = check_images_tree(load_validated_config(use_cache=False))
+
+    # 크기 0 파일만 남은 DB-Server도 빈 폴더로 봄
+    assert ok
+    assert missing == {"Mail-Server", "DB-Server"}
+
+
+def test_strict_option_makes_missing_server_fatal(workspace):
+    update_config(workspace, "output_settings", strict_images_check=True)
+    shutil.rmtree(workspace / SERVER_FOLDER / "Mail-Server")
+
+    ok, missing = check_images_tree(load_validated_config(use_cache=False))
+
+    assert not ok
+    assert missing == {"Mail-Server"}
+
+
+def test_invalid_strict_option_is_rejected(workspace):
+    update_config(workspace, "output_settings", strict_images_check="yes")
+    assert load_validated_config(use_cache=False) is None
+
+
+def test_generation_skips_only_groups_with_missing_servers(workspace):
+    shutil.rmtree(workspace / SERVER_FOLDER / "Mail-Server")
+
+    assert load_generator().create_unified_report()
+
+    groups = sorted(path.name.split("_")[0] for path in (workspace / "output").glob("*.html"))
+    assert groups == ["웹서비스"]
+
+
+def test_generation_stops_with_strict_option(workspace):
+    update_config(workspace, "output_settings", strict_images_check=True)
+    shutil.rmtree(workspace / SERVER_FOLDER / "Mail-Server")
+
+    assert not load_generator().create_unified_report()
+    assert not list((workspace / "output").glob("*.html"))
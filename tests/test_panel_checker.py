@@ -0,0 +1,75 @@
+# tests/test_panel_checker.py - 빈 패널/No data 패널 판정과 판정 캐시
+import json
+
+import pytest
+
+pytest.importorskip("numpy")
+Image = pytest.importorskip("PIL.Image")
+
+import report_images
+from conftest import write_png
+from report_images import PanelChecker, classify_panel_image
+
+BACKGROUND = (24, 27, 31)
+
+
+def no_data_png(path):
+    """가운데에 작은 글자 크기 상자만 있는 패널"""
+    image = Image.new("RGB", (1200, 800), BACKGROUND)
+    image.paste((200, 200, 200), (560, 390, 640, 410))
+    image.save(path)
+    return path
+
+
+@pytest.fixture
+def panels(tmp_path):
+    return {
+        'blank': write_png(tmp_path / "blank.png", 1200, 800, BACKGROUND),
+        'no_data': no_data_png(tmp_path / "no_data.png"),
+        'chart': write_png(tmp_path / "chart.png", 1200, 800, BACKGROUND, line=(115, 191, 105)),
+    }
+
+
+def test_classify_panel_image(panels):
+    assert classify_panel_image(panels['blank']) == 'blank'
+    assert classify_panel_image(panels['no_data']) == 'no_data'
+    assert classify_panel_image(panels['chart']) is None
+
+
+def test_verdicts_are_cached_by_image_hash(tmp_path, panels):
+    cache = tmp_path / "panel_checks.json"
+    first = PanelChecker(cache_path=cache)
+    assert first.classify_many(panels.values()) == {path: (None if kind == 'chart' else kind)
+                                                     for kind, path in panels.items()}
+    assert (first.hits, first.misses) == (0, 3)
+
+    second = PanelChecker(cache_path=cache)
+    second.classify_many(panels.values())
+    assert (second.hits, second.misses) == (3, 0)
+
+
+def test_threshold_change_discards_cached_verdicts(tmp_path, panels, monkeypatch):
+    cache = tmp_path / "panel_checks.json"
+    PanelChecker(cache_path=cache).classify_many([panels['chart']])
+
+    monkeypatch.setattr(report_images, "PANEL_INK_THRESHOLD", 250)
+    checker = PanelChecker(cache_path=cache)
+    # 선 색과 배경 차이가 기준보다 작아져 빈 패널로 다시 판정
+    assert checker.classify_many([panels['chart']]) == {panels['chart']: 'blank'}
+    assert (checker.hits, checker.misses) == (0, 1)
+
+    monkeypatch.setattr(report_images, "PANEL_CLASSIFIER_VERSION", 99)
+    assert PanelChecker(cache_path=cache).results == {}
+
+
+def test_failed_classification_is_not_cached(tmp_path):
+    cache = tmp_path / "panel_checks.json"
+    broken = tmp_path / "broken.png"
+    broken.write_bytes(b"\x89PNG\r\n\x1a\nnot really")
+
+    assert PanelChecker(cache_path=cache).classify_many([broken]) == {broken: None}
+    assert not cache.exists() or json.loads(cache.read_text())['results'] == {}
+
+    retry = PanelChecker(cache_path=cache)
+    retry.classify_many([broken])
+    assert (retry.hits, retry.misses) == (0, 1)
@@ -0,0 +1,124 @@
+# tests/test_preview_server.py - 미리보기 서버 (제공 확장자, 사전 압축본, Accept-Encoding, 카탈로그 목록)
+import gzip
+import http.client
+import json
+import threading
+
+import pytest
+
+from preview_server import PreviewRequestHandler, ThreadingHTTPServer, parse_accept_encoding, encoding_accepted
+from report_catalog import ReportCatalog
+
+REPORT = "Web_2025_05_20250601_090000.html"
+
+
+@pytest.fixture
+def preview(tmp_path):
+    """tmp_path를 제공하는 미리보기 서버 → GET 요청 함수 (경로, 헤더) → (상태, 헤더, 본문)"""
+    handler = type("Handler", (PreviewRequestHandler,), {'root': tmp_path, 'log_message': lambda *args: None})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    def get(path, headers=None):
+        connection = http.client.HTTPConnection("127.0.0.1", server.server_address[1], timeout=10)
+        try:
+            connection.request("GET", path, headers=headers or {})
+            response = connection.getresponse()
+            return response.status, dict(response.getheaders()), response.read()
+        finally:
+            connection.close()
+
+    try:
+        yield get
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def write_report(output_dir, name=REPORT, body=b"<html>report</html>"):
+    (output_dir / name).write_bytes(body)
+    (output_dir / (name + ".gz")).write_bytes(gzip.compress(body))
+    return body
+
+
+@pytest.mark.parametrize("header, expected", [
+    ("gzip, br", True),
+    ("gzip;q=0", False),
+    ("gzip; q=0", False),
+    ("gzip;q=0.0", False),
+    ("gzip;Q=0.000", False),
+    ("gzip;q=0.5", True),
+    ("*", True),
+    ("*;q=0", False),
+    ("br", False),
+    ("", False),
+])
+def test_accept_encoding_q_values(header, expected):
+    assert encoding_accepted(parse_accept_encoding(header), "gzip") is expected
+
+
+def test_internal_files_are_not_served(tmp_path, preview):
+    write_report(tmp_path)
+    ReportCatalog(tmp_path).connect().close()
+    (tmp_path / "download.jsonl").write_text("{}")
+
+    assert preview("/" + REPORT)[0] == 200
+    assert preview("/catalog.sqlite3")[0] == 404
+    assert preview("/download.jsonl")[0] == 404
+    assert preview("/../secret.html")[0] == 404
+
+
+def test_precompressed_variant_follows_q_values(tmp_path, preview):
+    body = write_report(tmp_path)
+
+    status, headers, data = preview("/" + REPORT, {"Accept-Encoding": "gzip"})
+    assert headers.get("Content-Encoding") == "gzip" and gzip.decompress(data) == body
+
+    status, headers, data = preview("/" + REPORT, {"Accept-Encoding": "gzip; q=0"})
+    assert "Content-Encoding" not in headers and data == body
+
+
+def test_direct_compressed_request(tmp_path, preview):
+    body = write_report(tmp_path)
+
+    status, headers, data = preview(f"/{REPORT}.gz", {"Accept-Encoding": "gzip"})
+    assert status == 200
+    assert headers["Content-Type"].startswith("text/html")
+    assert headers["Content-Encoding"] == "gzip"
+    assert gzip.decompress(data) == body
+
+    # gzip을 받지 않으면 압축 파일 그대로 (text/html로 속이지 않음)
+    status, headers, data = preview(f"/{REPORT}.gz", {"Accept-Encoding": "identity"})
+    assert headers["Content-Type"] == "application/gzip"
+    assert "Content-Encoding" not in headers
+    assert gzip.decompress(data) == body
+
+
+def test_index_reads_catalog(tmp_path, preview):
+    catalog = ReportCatalog(tmp_path)
+    for version in (0, 1):
+        filename, _ = catalog.allocate(REPORT)
+        write_report(tmp_path, filename, f"<html>v{version}</html>".encode())
+        catalog.record(filename, REPORT, "Web", "2025. 05", version, [tmp_path / filename])
+    # 카탈로그에 없는 파일은 목록에 나오지 않음 (폴더를 훑지 않음)
+    write_report(tmp_path, "Other_2025_05_20250601_090000.html")
+
+    status, _, data = preview("/index.json")
+    reports = json.loads(data)
+    assert status == 200
+    assert [(r["group"], r["month"], r["file"]) for r in reports] == [
+        ("Web", "2025. 05", "Web_2025_05_20250601_090000_v001.html")
+    ]
+
+    # 최신 버전을 직접 지우면 남아 있는 이전 버전을 보여줌
+    (tmp_path / "Web_2025_05_20250601_090000_v001.html").unlink()
+    assert [r["file"] for r in json.loads(preview("/index.json")[2])] == [REPORT]
+
+
+def test_index_without_catalog_scans_folder(tmp_path, preview):
+    write_report(tmp_path)
+    write_report(tmp_path, "Web_2025_05_20250601_090000_v002.html")
+
+    reports = json.loads(preview("/index.json")[2])
+    assert [(r["group"], r["file"]) for r in reports] == [("Web", "Web_2025_05_20250601_090000_v002.html")]
@@ -0,0 +1,77 @@
+# tests/test_render_schedule.py - 예상 렌더링 시간이 긴 요청부터 시작 (cache/render_times.sqlite3)
+from contextlib import closing
+
+import pytest
+
+import report_download
+from report_download import PanelDownloader, RenderTimes
+
+GRID = {'x': 0, 'y': 0, 'w': 12, 'h': 8}
+
+
+def job(panel_id, uid="web", panel_type='timeseries', grid=GRID):
+    return {'server': "Production-Server", 'dashboard': uid, 'uid': uid, 'panel_id': panel_id,
+            'title': f"Panel {panel_id}", 'type': panel_type, 'grid': grid}
+
+
+def result(job, seconds, strategy='panel', ok=True):
+    return {'job': job, 'ok': ok, 'size': 0, 'seconds': seconds, 'strategy': strategy, 'error': None}
+
+
+def order(downloader, jobs):
+    return [[job['panel_id'] for job in batch] for batch in downloader.schedule(downloader.batches(jobs))]
+
+
+def test_expected_is_median_of_recent_runs(tmp_path):
+    times = RenderTimes(tmp_path / "render_times.sqlite3")
+    panel = job(1)
+    for seconds in (1.0, 9.0, 2.0, 3.0, 4.0):
+        times.record([result(panel, seconds)])
+    for seconds in (5.0, 6.0):
+        times.record([result(panel, seconds, ok=False)])
+
+    # 최근 5회(2~6초)의 중앙값 - 실패한 요청도 시간 초과까지 걸린 시간이므로 포함
+    assert times.expected('panel') == {("Production-Server", "web", 1): 4.0}
+    assert times.expected('dashboard') == {}
+
+
+def test_old_runs_are_pruned(tmp_path, monkeypatch):
+    monkeypatch.setattr(report_download, "RENDER_TIMES_KEEP_RUNS", 3)
+    times = RenderTimes(tmp_path / "render_times.sqlite3")
+    for seconds in range(5):
+        times.record([result(job(1), float(seconds))])
+
+    with closing(times.connect()) as connection:
+        assert connection.execute("SELECT COUNT(DISTINCT run) FROM render_times").fetchone()[0] == 3
+
+
+def test_panels_start_longest_expected_first(tmp_path):
+    times = RenderTimes(tmp_path / "render_times.sqlite3")
+    jobs = [job(1), job(2), job(3, panel_type='logs'), job(4, panel_type='stat')]
+    times.record([result(jobs[0], 0.5), result(jobs[1], 30.0)])
+
+    downloader = PanelDownloader({}, {}, render_times=times)
+    # 기록: 2번 30초, 1번 0.5초 / 기록 없음: logs 20초, stat 1초
+    assert order(downloader, jobs) == [[2], [3], [4], [1]]
+
+
+def test_without_records_keeps_discovery_order():
+    jobs = [job(1), job(2, panel_type='logs')]
+    assert order(PanelDownloader({}, {}), jobs) == [[1], [2]]
+
+
+def test_dashboard_batches_use_slowest_panel_and_matching_strategy(tmp_path):
+    pytest.importorskip("PIL")
+    times = RenderTimes(tmp_path / "render_times.sqlite3")
+    web = [job(1, "web"), job(2, "web")]
+    db = [job(3, "db"), job(4, "db")]
+    loose = job(5, "db", grid=None)
+    times.record([result(web[0], 5.0, 'dashboard'), result(web[1], 5.0, 'dashboard'),
+                  result(db[0], 8.0, 'dashboard'), result(db[1], 1.0, 'dashboard'),
+                  # gridPos 없는 패널은 dashboard 방식에서도 panel 기록을 사용
+                  result(loose, 6.0, 'panel'), result(loose, 50.0, 'dashboard')])
+
+    downloader = PanelDownloader({}, {}, strategy='dashboard', render_times=times)
+    assert downloader.job_strategy(loose) == 'panel'
+    # db 대시보드 8초(가장 느린 패널), 따로 받는 5번 6초, web 대시보드 5초
+    assert order(downloader, web + db + [loose]) == [[3, 4], [5], [1, 2]]
@@ -0,0 +1,40 @@
+# tests/test_report_assets.py - 템플릿 공백 압축, CSS 압축
+from report_assets import AssetBuilder, collapse_html_whitespace, content_hash, minify_css
+
+PRE = "<pre class=\"log\">\n  line 1\n\n    line 2\n</pre>"
+TEXTAREA = "<textarea name=\"note\">첫 줄\n  들여쓴 줄</textarea>"
+SCRIPT = "<script>\n  var html = '<!-- not a comment -->';\n  if (a  >  b) {\n    go();\n  }\n</script>"
+
+
+def test_collapses_whitespace_between_tags():
+    html = "<div>\n    <!-- 주석 -->\n    <p>  가나   다  </p>\n</div>\n"
+    assert collapse_html_whitespace(html) == "<div><p> 가나 다 </p></div>"
+
+
+def test_keeps_pre_textarea_and_script_verbatim():
+    html = f"<div>\n  {PRE}\n  <p>a\n   b</p>\n  {TEXTAREA}\n</div>\n{SCRIPT}\n"
+    assert collapse_html_whitespace(html) == f"<div>{PRE}<p>a b</p>{TEXTAREA}</div>{SCRIPT}"
+
+
+def test_preserved_blocks_are_case_insensitive_and_comments_still_removed():
+    html = "<!-- <pre>\n  제거됨\n</pre> -->\n<PRE>\n  유지\n</PRE>\n<p>끝</p>"
+    assert collapse_html_whitespace(html) == "<PRE>\n  유지\n</PRE><p>끝</p>"
+
+
+def test_compile_template_ignores_cache_from_old_rules(tmp_path):
+    source = f"<div>\n  {PRE}\n</div>"
+    # 이전 규칙(모든 공백 압축)으로 만든 캐시 파일
+    (tmp_path / f"report.html.{content_hash(source)}").write_text("<div><pre> line 1 line 2 </pre></div>",
+                                                                 encoding="utf-8")
+    builder = AssetBuilder(templates_dir=tmp_path, cache_dir=tmp_path)
+    assert builder.compile_template("report", source) == f"<div>{PRE}</div>"
+
+
+def test_minify_css_keeps_string_literals():
+    css = 'a::after {\n  content: ";}" ;\n  font-family: "A  B";\n}\n'
+    assert minify_css(css) == 'a::after{content:";}";font-family:"A  B"}'
+
+
+def test_minify_css_leaves_no_spaces_around_removed_comments():
+    css = "a { color:red; /* 주석 */ }\n/* 머리 */ b /* 꼬리 */ {\n  margin:0;\n}\n"
+    assert minify_css(css) == "a{color:red}b{margin:0}"
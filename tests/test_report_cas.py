@@ -0,0 +1,96 @@
+# tests/test_report_cas.py - 이미지 저장소 (images/.cas 하드링크)
+import os
+import stat
+
+import pytest
+
+from report_cas import ImageStore
+from report_images import file_hash
+
+
+def make_tree(images_dir, name, files):
+    tree = images_dir / name / "Production-Server" / "Web-Server"
+    tree.mkdir(parents=True)
+    for filename, data in files.items():
+        (tree / filename).write_bytes(data)
+    return images_dir / name
+
+
+def test_first_file_is_copied_not_adopted(tmp_path):
+    tree = make_tree(tmp_path, "20250601_000000", {"CPU_1.png": b"cpu", "Mem_2.png": b"mem"})
+    original = tree / "Production-Server" / "Web-Server" / "CPU_1.png"
+    original_inode = original.stat().st_ino
+    store = ImageStore(tmp_path, workers=2)
+
+    assert store.add_tree(tree) == (2, 0, 0, 0)
+
+    blob = store.cas_dir / file_hash(original)
+    assert blob.stat().st_ino != original_inode          # 원래 파일이 저장소 파일이 되지 않음
+    assert blob.stat().st_ino == original.stat().st_ino  # 시각 폴더 파일은 저장소 파일의 링크
+    assert not blob.stat().st_mode & (stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH)
+
+
+def test_duplicates_link_to_one_blob(tmp_path):
+    first = make_tree(tmp_path, "20250601_000000", {"CPU_1.png": b"same"})
+    second = make_tree(tmp_path, "20250602_000000", {"CPU_1.png": b"same", "Mem_2.png": b"new"})
+    store = ImageStore(tmp_path, workers=2)
+
+    store.add_tree(first)
+    linked, duplicates, saved, failed = store.add_tree(second)
+
+    assert (linked, duplicates, saved, failed) == (2, 1, 4, 0)
+    assert store.usage() == (2, 7)
+
+
+@pytest.mark.skipif(os.name == 'nt' or getattr(os, 'geteuid', lambda: 1)() == 0,
+                    reason="root는 읽기 전용 파일에도 쓸 수 있음")
+def test_in_place_rewrite_cannot_corrupt_blob(tmp_path):
+    first = make_tree(tmp_path, "20250601_000000", {"CPU_1.png": b"same"})
+    second = make_tree(tmp_path, "20250602_000000", {"CPU_1.png": b"same"})
+    store = ImageStore(tmp_path, workers=2)
+    store.add_tree(first)
+    store.add_tree(second)
+
+    with pytest.raises(PermissionError):
+        (second / "Production-Server" / "Web-Server" / "CPU_1.png").write_bytes(b"changed")
+    assert (first / "Production-Server" / "Web-Server" / "CPU_1.png").read_bytes() == b"same"
+
+
+def test_link_failure_is_counted_and_continues(tmp_path, monkeypatch):
+    tree = make_tree(tmp_path, "20250601_000000", {"A_1.png": b"a", "B_2.png": b"b", "C_3.png": b"c"})
+    store = ImageStore(tmp_path, workers=2)
+    real_link = os.link
+
+    def flaky_link(source, target, *args, **kwargs):
+        if str(target).endswith("B_2.png.cas-tmp"):
+            raise OSError("hard links not supported")
+        return real_link(source, target, *args, **kwargs)
+
+    monkeypatch.setattr(os, "link", flaky_link)
+    assert store.add_tree(tree) == (2, 0, 0, 1)
+    assert (tree / "Production-Server" / "Web-Server" / "C_3.png").stat().st_nlink == 2
+
+
+def test_gc_removes_unreferenced_blobs(tmp_path):
+    tree = make_tree(tmp_path, "20250601_000000", {"CPU_1.png": b"cpu"})
+    store = ImageStore(tmp_path, workers=2)
+    store.add_tree(tree)
+    for path in tree.rglob("*.png"):
+        path.unlink()
+
+    assert store.gc() == (1, 3)
+    assert store.usage() == (0, 0)
+
+
+def test_gc_keeps_in_flight_temp_files(tmp_path):
+    store = ImageStore(tmp_path, workers=2)
+    store.cas_dir.mkdir(parents=True)
+    fresh = store.cas_dir / "abc.1.2.tmp"          # 다른 실행이 저장 중인 임시 파일
+    fresh.write_bytes(b"part")
+    stale = store.cas_dir / "def.3.4.tmp"          # 중단된 실행이 남긴 임시 파일
+    stale.write_bytes(b"old")
+    old = os.stat(stale).st_mtime - 2 * 3600
+    os.utime(stale, (old, old))
+
+    assert store.gc() == (1, 3)
+    assert fresh.exists() and not stale.exists()
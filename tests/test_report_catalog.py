@@ -0,0 +1,86 @@
+# tests/test_report_catalog.py - 리포트 카탈로그 (버전 파일명 선점, 보관 정책)
+import os
+import stat
+from contextlib import closing
+
+import pytest
+
+from report_catalog import ReportCatalog, versioned_filename
+
+BASE = "Web_2025_05_20250601_090000.html"
+
+
+def write_report(catalog, base, group, month, body):
+    filename, version = catalog.allocate(base)
+    path = catalog.output_dir / filename
+    path.write_bytes(body)
+    catalog.record(filename, base, group, month, version, [path])
+    return filename
+
+
+def test_versioned_filename():
+    assert versioned_filename(BASE, 0) == BASE
+    assert versioned_filename(BASE, 12) == "Web_2025_05_20250601_090000_v012.html"
+
+
+def test_allocate_continues_after_recorded_and_foreign_files(tmp_path):
+    catalog = ReportCatalog(tmp_path)
+    assert write_report(catalog, BASE, "Web", "2025. 05", b"a") == BASE
+    # 카탈로그 밖에서 만든 다음 버전 파일은 건너뜀
+    (tmp_path / versioned_filename(BASE, 1)).write_bytes(b"foreign")
+
+    assert catalog.allocate(BASE) == (versioned_filename(BASE, 2), 2)
+
+    catalog.release(versioned_filename(BASE, 2))
+    assert not (tmp_path / versioned_filename(BASE, 2)).exists()
+
+
+@pytest.mark.skipif(os.name == 'nt', reason="POSIX 권한 비트")
+def test_allocated_file_is_not_executable(tmp_path):
+    old_umask = os.umask(0o022)
+    try:
+        filename, _ = ReportCatalog(tmp_path).allocate(BASE)
+    finally:
+        os.umask(old_umask)
+    assert stat.S_IMODE((tmp_path / filename).stat().st_mode) == 0o644
+
+
+def test_prune_keeps_latest_versions_per_group_and_month(tmp_path):
+    catalog = ReportCatalog(tmp_path)
+    web = [write_report(catalog, BASE, "Web", "2025. 05", b"x" * 10) for _ in range(3)]
+    db = write_report(catalog, "DB_2025_05_20250601_090000.html", "DB", "2025. 05", b"y" * 10)
+    (tmp_path / (web[0] + ".gz")).write_bytes(b"gz")
+
+    removed, freed = catalog.prune(keep_versions=2)
+
+    assert removed == [web[0]]
+    assert freed == 12   # 리포트 + 사전 압축본
+    assert not (tmp_path / web[0]).exists() and not (tmp_path / (web[0] + ".gz")).exists()
+    assert all((tmp_path / name).exists() for name in web[1:] + [db])
+    assert catalog.prune(keep_versions=2) == ([], 0)
+
+
+def test_prune_size_limit_keeps_newest_report_of_each_group(tmp_path):
+    catalog = ReportCatalog(tmp_path)
+    mb = 1024 * 1024
+    old = write_report(catalog, BASE, "Web", "2025. 05", b"x" * mb)
+    new = write_report(catalog, BASE, "Web", "2025. 05", b"x" * mb)
+    db = write_report(catalog, "DB_2025_05_20250601_090000.html", "DB", "2025. 05", b"y" * (2 * mb))
+
+    removed, _ = catalog.prune(max_total_mb=1)
+
+    # 상한을 넘어도 그룹마다 최신 리포트 하나는 유지
+    assert removed == [old]
+    assert (tmp_path / new).exists() and (tmp_path / db).exists()
+
+
+def test_prune_forgets_reports_deleted_by_hand(tmp_path):
+    catalog = ReportCatalog(tmp_path)
+    first = write_report(catalog, BASE, "Web", "2025. 05", b"a")
+    write_report(catalog, BASE, "Web", "2025. 05", b"b")
+    (tmp_path / first).unlink()
+
+    assert catalog.prune(keep_versions=5) == ([], 0)
+    with closing(catalog.connect()) as connection:
+        rows = connection.execute("SELECT filename FROM reports").fetchall()
+    assert rows == [(versioned_filename(BASE, 1),)]
@@ -0,0 +1,72 @@
+# tests/test_report_compress.py - 리포트 사전 압축본(.gz/.br) 스트리밍 생성
+import gzip
+import io
+
+import pytest
+
+import report_compress
+from report_compress import compress_file
+
+
+class FakeBrotli:
+    """brotli.Compressor 대역 - 받은 조각 크기를 기록하고 입력을 그대로 이어 붙임"""
+
+    def __init__(self):
+        self.chunks = []
+
+    def Compressor(self, quality):
+        fake = self
+
+        class Compressor:
+            def process(self, chunk):
+                fake.chunks.append(len(chunk))
+                return chunk
+
+            def finish(self):
+                return b"<end>"
+
+        return Compressor()
+
+
+def test_gzip_is_deterministic_and_matches_one_shot(tmp_path):
+    report = tmp_path / "report.html"
+    report.write_bytes(b"<html>" + b"x" * 3_000_000 + b"</html>")
+
+    sizes = compress_file(report, ['gzip'])
+
+    compressed = (tmp_path / "report.html.gz").read_bytes()
+    buffer = io.BytesIO()
+    with gzip.GzipFile(fileobj=buffer, mode='wb', compresslevel=9, mtime=0) as gz:
+        gz.write(report.read_bytes())
+    assert compressed == buffer.getvalue()
+    assert sizes == {'gzip': len(compressed)}
+    assert gzip.decompress(compressed) == report.read_bytes()
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_brotli_streams_in_chunks(tmp_path, monkeypatch):
+    fake = FakeBrotli()
+    monkeypatch.setattr(report_compress, "_load_brotli", lambda: fake)
+    monkeypatch.setattr(report_compress, "COMPRESS_CHUNK_SIZE", 1000)
+    report = tmp_path / "report.html"
+    report.write_bytes(b"a" * 4500)
+
+    sizes = compress_file(report, ['gzip', 'br'])
+
+    assert fake.chunks == [1000, 1000, 1000, 1000, 500]
+    assert (tmp_path / "report.html.br").read_bytes() == b"a" * 4500 + b"<end>"
+    assert sizes['br'] == 4505
+    assert gzip.decompress((tmp_path / "report.html.gz").read_bytes()) == b"a" * 4500
+
+
+def test_failure_leaves_no_partial_output(tmp_path, monkeypatch):
+    class Broken(FakeBrotli):
+        def Compressor(self, quality):
+            raise RuntimeError("boom")
+
+    monkeypatch.setattr(report_compress, "_load_brotli", lambda: Broken())
+    report = tmp_path / "report.html"
+    report.write_bytes(b"data")
+    with pytest.raises(RuntimeError):
+        compress_file(report, ['gzip', 'br'])
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["report.html"]
@@ -0,0 +1,79 @@
+# tests/test_report_download.py - 다운로드 이어받기 (완료 표시, 기록된 리포트 기간)
+import json
+import queue
+
+from report_download import (DOWNLOAD_COMPLETE_NAME, JOURNAL_NAME, DownloadJournal, PanelDownloader,
+                             discover_panel_jobs, find_resume_folder, panel_render_params)
+from report_series import GrafanaClient
+
+
+def make_download_folder(images_dir, name, complete=False):
+    folder = images_dir / name
+    folder.mkdir(parents=True)
+    (folder / JOURNAL_NAME).write_text("")
+    if complete:
+        (folder / DOWNLOAD_COMPLETE_NAME).write_text("{}")
+    return folder
+
+
+def run_download(client, folder, params, fail_first=False):
+    """스텁 그라파나에서 패널 다운로드 → 결과 목록 (fail_first: 첫 패널을 렌더러 오류로 실패시킴)"""
+    jobs = discover_panel_jobs(client, "Production-Server", folder)
+    journal = DownloadJournal(folder)
+    downloader = PanelDownloader({"Production-Server": client}, journal.pin_time_range(params),
+                                 workers=2, journal=journal)
+    if fail_first:
+        download = downloader.download
+
+        def flaky(job):
+            if job is jobs[0]:
+                return {'job': job, 'ok': False, 'size': 0, 'seconds': 0.0, 'strategy': 'panel', 'error': "503"}
+            return download(job)
+        downloader.download = flaky
+
+    results = queue.Queue()
+    downloader.start(jobs, results).join()
+    return [result for result in iter(results.get, None)]
+
+
+def test_resume_skips_completed_folders(tmp_path):
+    make_download_folder(tmp_path, "20250601_090000")
+    make_download_folder(tmp_path, "20250602_090000", complete=True)
+
+    assert find_resume_folder(tmp_path) == tmp_path / "20250601_090000"
+
+    (tmp_path / "20250601_090000" / DOWNLOAD_COMPLETE_NAME).write_text("{}")
+    assert find_resume_folder(tmp_path) is None
+
+
+def test_resume_reuses_recorded_time_range(tmp_path):
+    # grafana_time_from이 없으면 현재 시각 기준 최근 30일 → 실행마다 다른 기간
+    first = panel_render_params({})
+    assert DownloadJournal(tmp_path).pin_time_range(first) == first
+
+    later = dict(first, **{'from': first['from'] + 60000, 'to': first['to'] + 60000})
+    pinned = DownloadJournal(tmp_path).pin_time_range(later)
+    assert (pinned['from'], pinned['to']) == (first['from'], first['to'])
+    assert DownloadJournal(tmp_path).load() == {}   # 기간 기록은 패널 기록으로 읽지 않음
+
+
+def test_failed_run_resumes_and_then_completes(grafana_stub, tmp_path):
+    stub, url = grafana_stub
+    client = GrafanaClient(url, "token")
+    folder = tmp_path / "20250601_090000"
+    params = panel_render_params({})
+
+    results = run_download(client, folder, params, fail_first=True)
+    assert sum(not result['ok'] for result in results) == 1
+    assert not (folder / DOWNLOAD_COMPLETE_NAME).exists()
+    assert find_resume_folder(tmp_path) == folder
+
+    # 몇 분 뒤 이어받기: 기간이 달라져도 기록된 기간으로 요청하므로 실패한 패널만 다시 받음
+    later = dict(params, **{'from': params['from'] + 300000, 'to': params['to'] + 300000})
+    results = run_download(client, folder, later)
+    assert all(result['ok'] for result in results)
+    assert sum(1 for result in results if not result.get('resumed')) == 1
+
+    marker = json.loads((folder / DOWNLOAD_COMPLETE_NAME).read_text())
+    assert marker['panels'] == len(results)
+    assert find_resume_folder(tmp_path) is None
@@ -0,0 +1,54 @@
+# tests/test_report_generate.py - 리포트 생성 (차트 이미지 표시, 분할 레이아웃)
+import re
+
+from conftest import load_generator, update_config
+
+
+def report_html(workspace, group_name):
+    """output 폴더에서 그룹 리포트 HTML 읽기"""
+    path, = (workspace / "output").glob(f"{group_name}_*.html")
+    return path.read_text(encoding="utf-8")
+
+
+def test_chart_images_are_sized_and_decoded_lazily(workspace):
+    generator = load_generator()
+    assert generator.create_unified_report()
+
+    html = report_html(workspace, "메일시스템")
+    images = re.findall(r'<img [^>]*class="chart-image"[^>]*>', html)
+    assert len(images) == 2
+    for tag in images:
+        # 테스트 PNG 크기(120x80)를 헤더에서 읽어 자리를 미리 잡음
+        assert 'width="120"' in tag and 'height="80"' in tag
+        assert 'loading="lazy"' in tag and 'decoding="async"' in tag
+    assert re.search(r'\.server-section\{[^}]*content-visibility:auto', html)
+
+
+def test_read_image_size_falls_back_to_render_size(workspace):
+    generator = load_generator()
+    builder = generator.ReportBuilder()
+    not_png = workspace / "chart.png"
+    not_png.write_bytes(b"GIF89a" + b"\x00" * 32)
+
+    assert builder.read_image_size(not_png) == generator.DEFAULT_CHART_SIZE
+    assert builder.read_image_size(workspace / "missing.png") == generator.DEFAULT_CHART_SIZE
+
+
+def test_paged_layout_writes_index_and_server_pages(workspace):
+    update_config(workspace, "output_settings", layout="paged", servers_per_page=2)
+    generator = load_generator()
+    assert generator.create_unified_report(groups=["전체시스템"])
+
+    index, = [path for path in (workspace / "output").glob("전체시스템_*.html") if "_p0" not in path.name]
+    pages = sorted((workspace / "output").glob(f"{index.stem}_p*.html"))
+    assert [path.name for path in pages] == [f"{index.stem}_p001.html", f"{index.stem}_p002.html"]
+
+    index_html = index.read_text(encoding="utf-8")
+    assert index_html.count(f'href="{pages[0].name}"') == 2   # 서버 2개가 첫 페이지
+    assert index_html.count(f'href="{pages[1].name}"') == 1
+    assert "<img" not in index_html
+
+    first, second = (path.read_text(encoding="utf-8") for path in pages)
+    assert f'href="{index.name}">목차' in first and f'href="{pages[1].name}">다음' in first
+    assert f'href="{pages[0].name}">이전' in second and ">다음<" not in second
+    assert "1/2 페이지" in first and "2/2 페이지" in second
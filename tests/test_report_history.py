@@ -0,0 +1,56 @@
+# tests/test_report_history.py - 서버 월별 지표 이력 (stats/history.sqlite3)
+import json
+
+from conftest import load_generator
+from report_history import HISTORY_DB, MetricsHistory, month_key, rebuild_history, shift_month
+
+
+def test_month_keys_sort_in_time_order():
+    assert month_key("2025. 05") == "2025-05"
+    assert shift_month("2025-05", -11) == "2024-06"
+    assert shift_month("2024-12", 1) == "2025-01"
+    assert shift_month("2025-01", -1) == "2024-12"
+
+
+def test_append_replaces_only_that_month_and_server(tmp_path):
+    history = MetricsHistory(tmp_path / "history.sqlite3")
+    assert history.append_month("2025. 04", {"Web": {'availability': 99.0, 'cpu_p95': 40.0},
+                                             "DB": {'availability': 98.0, 'note': "문자열은 저장 안 함"}}) == 3
+    history.append_month("2025. 05", {"Web": {'availability': 99.5}})
+    history.append_month("2025. 05", {"Web": {'availability': 99.9, 'cpu_p95': None}})
+
+    assert history.load("2025. 05", 2) == {
+        "Web": {"2025-04": {'availability': 99.0, 'cpu_p95': 40.0},
+                "2025-05": {'availability': 99.9, 'cpu_p95': None}},
+        "DB": {"2025-04": {'availability': 98.0}},
+    }
+    assert history.load("2025. 05", 1, servers={"Web"}) == {"Web": {"2025-05": {'availability': 99.9, 'cpu_p95': None}}}
+    assert MetricsHistory(tmp_path / "missing.sqlite3").load("2025. 05") == {}
+
+
+def test_rebuild_from_stats_files(tmp_path):
+    for month, availability in (("2025_04", 99.0), ("2025_05", 99.5)):
+        (tmp_path / f"{month}.json").write_text(json.dumps({
+            'report_month': month.replace("_", ". "),
+            'servers': {"Web": {'metrics': {'availability': availability}}}
+        }), encoding="utf-8")
+    history = MetricsHistory(tmp_path / "history.sqlite3")
+
+    assert rebuild_history(tmp_path, history) == ["2025. 04", "2025. 05"]
+    assert history.load("2025. 05", 6)["Web"]["2025-04"] == {'availability': 99.0}
+
+
+def test_report_shows_monthly_trend(workspace):
+    history = MetricsHistory(workspace / HISTORY_DB)
+    history.append_month("2025. 03", {"Mail-Server": {'availability': 99.0, 'outages': 2}})
+    history.append_month("2025. 05", {"Mail-Server": {'availability': 99.5, 'outages': 0}})
+
+    generator = load_generator()
+    assert generator.create_unified_report(groups=["메일시스템"])
+
+    path, = (workspace / "output").glob("메일시스템_*.html")
+    html = path.read_text(encoding="utf-8")
+    assert "월별 추이 (최근 3개월)" in html
+    assert "<th>가용률</th>" in html and "99.00%" in html and "99.50%" in html
+    assert "2025. 04" in html and "2회" in html
+    assert '<td class="index-count">-</td>' in html   # 이력이 없는 달
@@ -0,0 +1,108 @@
+# tests/test_report_metrics.py - 실행 지표 (.prom textfile)
+import queue
+import shutil
+
+import pytest
+
+from conftest import load_generator, update_config
+from report_download import PanelDownloader, discover_panel_jobs
+from report_metrics import RunMetrics
+from report_series import GrafanaClient
+
+
+def samples(text):
+    """Prometheus 텍스트 → {'이름{라벨}': 값}"""
+    return {line.rsplit(" ", 1)[0]: float(line.rsplit(" ", 1)[1])
+            for line in text.splitlines() if line and not line.startswith("#")}
+
+
+def panel_result(dashboard, seconds, ok=True, render_request=True, **extra):
+    job = {'server': "Production-Server", 'dashboard': dashboard}
+    return dict({'job': job, 'ok': ok, 'size': 100 if ok else 0, 'seconds': seconds,
+                 'render_request': render_request}, **extra)
+
+
+def test_render_histogram_counts_and_panel_states(tmp_path):
+    metrics = RunMetrics('run')
+    for result in (panel_result("Web", 0.3), panel_result("Web", 1.5), panel_result("Web", 45, ok=False),
+                   panel_result("DB", 0, resumed=True)):
+        metrics.add_panel_result(result)
+    report = tmp_path / "report.html"
+    report.write_bytes(b"x" * 2048)
+    metrics.add_report("웹서비스", "2025. 05", [report])
+    metrics.set_cache('image_hash', 3, 1)
+    metrics.set_cache('thumbnail', 0, 0)
+
+    values = samples(metrics.render(success=False))
+
+    assert values['grafana_report_last_run_success{mode="run"}'] == 0
+    assert values['grafana_report_panels_attempted{mode="run",server="Production-Server",dashboard="Web"}'] == 3
+    assert values['grafana_report_panels_failed{mode="run",server="Production-Server",dashboard="Web"}'] == 1
+    assert values['grafana_report_panels_resumed{mode="run",server="Production-Server",dashboard="DB"}'] == 1
+    assert values['grafana_report_render_seconds_bucket{mode="run",le="0.5"}'] == 1
+    assert values['grafana_report_render_seconds_bucket{mode="run",le="2"}'] == 2
+    assert values['grafana_report_render_seconds_bucket{mode="run",le="60"}'] == 3
+    assert values['grafana_report_render_seconds_bucket{mode="run",le="+Inf"}'] == 3
+    assert values['grafana_report_render_seconds_count{mode="run"}'] == 3
+    assert values['grafana_report_render_seconds_sum{mode="run"}'] == pytest.approx(46.8)
+    assert values['grafana_report_downloaded_bytes{mode="run"}'] == 200
+    assert values['grafana_report_report_bytes{mode="run",group="웹서비스",month="2025. 05"}'] == 2048
+    assert values['grafana_report_cache_hit_ratio{mode="run",cache="image_hash"}'] == 0.75
+    # 사용하지 않은 캐시는 적중률 0으로 보이지 않도록 생략
+    assert not any('cache="thumbnail"' in name for name in values)
+
+
+def test_sliced_panels_count_one_render_request(tmp_path):
+    metrics = RunMetrics('run')
+    for index in range(4):
+        metrics.add_panel_result(panel_result("Web", 2.0, render_request=index == 0))
+
+    values = samples(metrics.render(success=True))
+    assert values['grafana_report_render_seconds_count{mode="run"}'] == 1
+    assert values['grafana_report_render_seconds_sum{mode="run"}'] == 2.0
+    assert values['grafana_report_panels_succeeded{mode="run",server="Production-Server",dashboard="Web"}'] == 4
+
+
+def test_dashboard_strategy_observes_each_dashboard_render_once(grafana_stub, tmp_path):
+    pytest.importorskip("PIL")
+    stub, url = grafana_stub
+    client = GrafanaClient(url, "token")
+    jobs = discover_panel_jobs(client, "Production-Server", tmp_path)
+    downloader = PanelDownloader({"Production-Server": client}, {'from': 0, 'to': 1, 'width': 1200, 'height': 800},
+                                 strategy='dashboard')
+    results = queue.Queue()
+    downloader.start(jobs, results).join()
+
+    metrics = RunMetrics('run')
+    for result in iter(results.get, None):
+        metrics.add_panel_result(result)
+
+    assert len(metrics.render_seconds) == len(downloader.batches(jobs)) < len(jobs)
+
+
+def test_write_replaces_file_and_can_be_disabled(tmp_path):
+    metrics = RunMetrics('generate')
+    assert metrics.write("", success=True) is None
+
+    path = metrics.write(tmp_path / "textfile", success=True)
+    assert path == tmp_path / "textfile" / "grafana_report_generate.prom"
+    assert samples(path.read_text(encoding="utf-8"))['grafana_report_last_run_success{mode="generate"}'] == 1
+    assert [p.name for p in path.parent.iterdir()] == [path.name]
+
+
+def test_generate_writes_metrics_on_success_and_failure(workspace):
+    update_config(workspace, "output_settings", metrics_dir="textfile")
+    generator = load_generator()
+
+    assert generator.create_unified_report()
+    values = samples((workspace / "textfile" / "grafana_report_generate.prom").read_text(encoding="utf-8"))
+    assert values['grafana_report_last_run_success{mode="generate"}'] == 1
+    assert values['grafana_report_phase_duration_seconds{mode="generate",phase="render"}'] > 0
+    assert sum(1 for name in values if name.startswith('grafana_report_report_bytes')) == 3
+
+    # 이미지 폴더가 없어 실패한 실행도 기록
+    update_config(workspace, "output_settings", strict_images_check=True)
+    shutil.rmtree(workspace / "images" / "20250601_000000" / "Production-Server" / "Web-Server")
+    assert not generator.create_unified_report()
+    values = samples((workspace / "textfile" / "grafana_report_generate.prom").read_text(encoding="utf-8"))
+    assert values['grafana_report_last_run_success{mode="generate"}'] == 0
@@ -0,0 +1,105 @@
+# tests/test_report_series.py - 시계열 다운샘플링과 그라파나 조회 (tools/grafana_stub.py 스텁 사용)
+import json
+
+import numpy as np
+
+from report_series import (GrafanaClient, build_panel_queries, downsample_minmax, fetch_dashboard_series,
+                           iter_panels, template_values)
+
+DAY_MS = 86400000
+
+
+def bucket_of(times, time_from, time_to, buckets):
+    return np.clip((times - time_from) * buckets // (time_to - time_from), 0, buckets - 1)
+
+
+def test_downsample_keeps_min_max_first_last_per_bucket():
+    rng = np.random.default_rng(0)
+    times = np.arange(10000, dtype=np.float64)
+    values = rng.normal(size=times.size)
+    out_times, out_values = downsample_minmax(times, values, 0, 10000, 10)
+
+    assert out_times.size <= 4 * 10
+    assert np.all(np.diff(out_times) > 0)
+    for index in range(10):
+        chunk = values[index * 1000:(index + 1) * 1000]
+        kept = out_values[bucket_of(out_times, 0, 10000, 10) == index]
+        assert chunk.min() in kept
+        assert chunk.max() in kept
+        assert chunk[0] == kept[0] and chunk[-1] == kept[-1]
+
+
+def test_downsample_edge_buckets_clip_out_of_range_points():
+    times = np.arange(-500, 10500, dtype=np.float64)
+    values = np.zeros(times.size)
+    values[0] = -7.0     # 조회 기간 이전 → 첫 구간
+    values[-1] = 9.0     # 조회 기간 이후 → 마지막 구간
+    out_times, out_values = downsample_minmax(times, values, 0, 10000, 10)
+
+    assert out_times[0] == -500 and out_values[0] == -7.0
+    assert out_times[-1] == 10499 and out_values[-1] == 9.0
+    assert out_times.size <= 4 * 10
+
+
+def test_downsample_drops_nan_gaps_and_keeps_peaks():
+    times = np.arange(10000, dtype=np.float64)
+    values = np.sin(times / 500)
+    values[2000:3000] = np.nan   # 수집 누락 구간
+    values[5123] = 50.0          # 순간 피크
+    out_times, out_values = downsample_minmax(times, values, 0, 10000, 10)
+
+    assert np.all(np.isfinite(out_values))
+    assert not np.any((out_times >= 2000) & (out_times < 3000))
+    assert 50.0 in out_values
+
+
+def test_downsample_small_series_unchanged_but_sorted():
+    times = np.array([3.0, 1.0, 2.0])
+    values = np.array([30.0, np.nan, 20.0])
+    out_times, out_values = downsample_minmax(times, values, 0, 10, 10)
+    assert out_times.tolist() == [2.0, 3.0]
+    assert out_values.tolist() == [20.0, 30.0]
+
+
+def test_build_panel_queries_resolves_variables_and_datasource(grafana_stub):
+    stub, url = grafana_stub
+    client = GrafanaClient(url, "token")
+    uid = stub.dashboard_uid("Web-Server")
+    dashboard = client.get_dashboard(uid)
+    variables = template_values(dashboard)
+    panel = next(panel for panel in iter_panels(dashboard['panels']) if panel['id'] == 1)
+    panel['targets'].append({'refId': 'C', 'expr': 'hidden', 'hide': True})
+    panel['targets'].append({'refId': 'D', 'expr': 'missing', 'datasource': 'No Such Datasource'})
+
+    queries = build_panel_queries(client, panel, variables, 1000, 0, 30 * DAY_MS)
+
+    assert [query['refId'] for query in queries] == ['A', 'B']
+    for query in queries:
+        assert query['datasource'] == {'uid': 'stub-prometheus', 'type': 'prometheus'}
+        assert 'job="Web-Server"' in query['expr']
+        assert query['maxDataPoints'] == 1000
+        assert query['intervalMs'] == 30 * DAY_MS // 1000
+
+
+def test_fetch_dashboard_series_writes_downsampled_series(grafana_stub, tmp_path):
+    stub, url = grafana_stub
+    client = GrafanaClient(url, "token")
+    time_from = 1748736000000   # 2025-06-01
+    time_to = time_from + 30 * DAY_MS
+
+    total, succeeded = fetch_dashboard_series(client, stub.dashboard_uid("DB-Server"), tmp_path,
+                                              time_from, time_to, max_data_points=2400, buckets=200)
+
+    assert (total, succeeded) == (len(stub.PANELS), len(stub.PANELS))   # row 안의 stat 패널은 제외
+    files = sorted(tmp_path.glob("*.series.json"))
+    assert [path.name for path in files] == ["CPU Usage_1.series.json", "Disk I_O_3.series.json",
+                                             "Memory Usage_2.series.json", "Network Traffic_4.series.json"]
+    chart = json.loads((tmp_path / "CPU Usage_1.series.json").read_text(encoding='utf-8'))
+    assert chart['step'] == 60000
+    assert chart['unit'] == 'percent'
+    assert [series['name'] for series in chart['series']] == ['user', 'system']
+    for series in chart['series']:
+        assert 0 < len(series['t']) <= 4 * 200
+        assert series['t'] == sorted(series['t'])
+        assert time_from <= series['t'][0] and series['t'][-1] < time_to
+
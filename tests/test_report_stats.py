@@ -0,0 +1,81 @@
+# tests/test_report_stats.py - 서버 요약 통계 (가용률, 임계치 초과 구간)
+import json
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from conftest import PROJECT_ROOT
+from report_history import MetricsHistory
+from report_series import GrafanaClient
+from report_stats import (build_server_summary, compute_fleet_stats, compute_server_stats, load_server_stats,
+                          merge_server_details, stats_path)
+
+NAN = float("nan")
+THRESHOLDS = {'cpu': {'warning': 80, 'critical': 90}, 'memory': {'warning': 85, 'critical': 95}}
+
+
+@pytest.fixture
+def fleet_stats():
+    """서버 0: 2분 중단 1회, CPU 경고 구간 1개 + 긴급 구간 1개 / 서버 1: 데이터 없음 (1분 간격)"""
+    matrices = {
+        'up': np.array([[1, 1, 0, 0, 1, 1], [NAN] * 6]),
+        'cpu': np.array([[50, 85, 70, 95, 82, 10], [NAN] * 6]),
+        'memory': np.array([[10] * 6, [NAN] * 6], dtype=float),
+    }
+    return compute_fleet_stats(matrices, THRESHOLDS, 60000)
+
+
+def test_fleet_stats_vectorized_per_server(fleet_stats):
+    assert fleet_stats['availability'][0] == pytest.approx(200 / 3)
+    assert fleet_stats['downtime_minutes'][0] == 2
+    assert list(fleet_stats['outages']) == [1, 0]
+    assert list(fleet_stats['cpu_warning']) == [1, 0]
+    assert list(fleet_stats['cpu_critical']) == [1, 0]
+    assert fleet_stats['cpu_max'][0] == 95
+    assert list(fleet_stats['memory_warning']) == [0, 0]
+    assert np.isnan(fleet_stats['availability'][1])
+
+
+def test_server_summary_counts_outages_as_critical(fleet_stats):
+    summary = build_server_summary(fleet_stats, 0)
+    assert summary['availability'] == "66.67%"
+    assert summary['summary']['warning_alerts']['value'] == 1
+    assert summary['summary']['critical_alerts']['value'] == 2
+    assert summary['summary']['total_alerts']['value'] == 3
+    assert "CPU 최대 95.0%" in summary['summary']['top5_note']
+    assert "중단 1회 (2분)" in summary['summary']['top5_note']
+
+    missing = build_server_summary(fleet_stats, 1)
+    assert missing['availability'] == 'unknown'
+    assert missing['metrics']['cpu_max'] is None
+    assert missing['summary']['top5_note'] == "임계치 초과 없음"
+
+
+def test_configured_values_override_computed_ones(fleet_stats):
+    computed = build_server_summary(fleet_stats, 0)
+    configured = {'hostname': "web-01", 'summary': {'top5_note': "점검 예정"}}
+
+    merged = merge_server_details(configured, computed)
+    assert merged['availability'] == "66.67%"
+    assert merged['summary']['top5_note'] == "점검 예정"
+    assert merged['summary']['critical_alerts']['value'] == 2
+    assert merge_server_details(dict(configured, availability="99.9%"), computed)['availability'] == "99.9%"
+    assert merge_server_details(configured, {}) is configured
+
+
+def test_compute_server_stats_from_grafana(grafana_stub, tmp_path):
+    stub, url = grafana_stub
+    config = json.loads((PROJECT_ROOT / "config" / "unified_config_example.json").read_text(encoding="utf-8"))
+    history = MetricsHistory(tmp_path / "history.sqlite3")
+
+    path = compute_server_stats(config, GrafanaClient(url, "token"), stats_dir=tmp_path, history=history)
+
+    report_month = config['report_settings']['report_month']
+    assert path == stats_path(report_month, tmp_path)
+    servers = load_server_stats(report_month, tmp_path)
+    assert sorted(servers) == sorted(config['servers'])
+    for server in servers.values():
+        assert server['availability'].endswith('%')
+        assert server['metrics']['cpu_max'] is not None
+    assert sorted(history.load(report_month, 1)) == sorted(config['servers'])
@@ -0,0 +1,46 @@
+# tests/test_report_stream.py - 이미지 base64 스트리밍 저장
+import base64
+import io
+import os
+
+import pytest
+
+from report_stream import base64_length, image_marker, write_base64_file, write_report_html
+
+
+def test_base64_length_matches_encoder():
+    for size in range(10):
+        assert base64_length(size) == len(base64.b64encode(b"x" * size))
+
+
+@pytest.mark.parametrize("size", [1, 11, 12, 13, 100])
+def test_chunked_encoding_equals_whole_file_encoding(tmp_path, size):
+    image = tmp_path / "chart.png"
+    image.write_bytes(os.urandom(size))
+    out = io.BytesIO()
+
+    assert write_base64_file(out, image, chunk_size=12) == base64_length(size)
+    assert out.getvalue() == base64.b64encode(image.read_bytes())
+
+
+def test_empty_image_writes_nothing(tmp_path):
+    (tmp_path / "empty.png").write_bytes(b"")
+    out = io.BytesIO()
+    assert write_base64_file(out, tmp_path / "empty.png") == 0
+    assert out.getvalue() == b""
+
+
+def test_report_markers_are_replaced_with_image_data(tmp_path):
+    first, second = tmp_path / "첫 차트.png", tmp_path / "second.png"
+    first.write_bytes(os.urandom(50))
+    second.write_bytes(os.urandom(7))
+    html = (f'<p>한글</p><img src="data:image/png;base64,{image_marker(first)}">'
+            f'<img src="data:image/png;base64,{image_marker(tmp_path / "missing.png")}">'
+            f'<i style="background:url(data:image/png;base64,{image_marker(second)})"></i>')
+
+    write_report_html(tmp_path / "report.html", html, chunk_size=9)
+
+    expected = (f'<p>한글</p><img src="data:image/png;base64,{base64.b64encode(first.read_bytes()).decode()}">'
+                '<img src="data:image/png;base64,">'   # 읽을 수 없는 이미지는 비워 두고 계속 저장
+                f'<i style="background:url(data:image/png;base64,{base64.b64encode(second.read_bytes()).decode()})"></i>')
+    assert (tmp_path / "report.html").read_text(encoding="utf-8") == expected
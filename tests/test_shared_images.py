@@ -0,0 +1,41 @@
+# tests/test_shared_images.py - 문서 안 중복 이미지 공유
+import base64
+
+from conftest import load_generator
+from report_images import SharedImages
+
+
+def test_only_repeated_images_are_shared():
+    shared = SharedImages(["a" * 64, "b" * 64, "a" * 64])
+
+    assert shared.use("b" * 64, "B", 10) is None
+    assert shared.use("a" * 64, "A", 10) == "img-" + "a" * 16
+    assert shared.use("a" * 64, "A", 10) == "img-" + "a" * 16
+    assert (shared.duplicates, shared.saved_bytes) == (1, 10)
+    assert shared.build_style() == "<style>.img-%s{background-image:url(data:image/png;base64,A)}</style>" % ("a" * 16)
+    assert SharedImages(["a" * 64]).build_style() == ""
+
+
+def test_report_embeds_each_duplicate_image_once(workspace):
+    generator = load_generator()
+    assert generator.create_unified_report(groups=["전체시스템"])
+
+    path, = (workspace / "output").glob("전체시스템_*.html")
+    html = path.read_text(encoding="utf-8")
+    # 대시보드 3개의 같은 패널 이미지 → 이미지 2개를 한 번씩만 포함하고 카드 6개가 참조
+    server_folder = workspace / "images" / "20250601_000000" / "Production-Server"
+    for name in ("CPU_Usage_1.png", "Memory_Usage_2.png"):
+        data = base64.b64encode((server_folder / "Web-Server" / name).read_bytes()).decode()
+        assert html.count(data) == 1
+    assert html.count("chart-image chart-image-shared") == 6
+    assert 'class="chart-image"' not in html
+
+
+def test_images_are_not_shared_across_documents(workspace):
+    generator = load_generator()
+    assert generator.create_unified_report(groups=["메일시스템"])
+
+    path, = (workspace / "output").glob("메일시스템_*.html")
+    html = path.read_text(encoding="utf-8")
+    assert "chart-image chart-image-shared" not in html and "background-image:url(data" not in html
+    assert html.count('class="chart-image"') == 2
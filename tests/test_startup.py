@@ -0,0 +1,29 @@
+# tests/test_startup.py - validate 명령의 시작 시간 예산 (python -X importtime)
+import shutil
+
+import grafana_report
+
+
+def test_validate_startup_budget(tmp_path):
+    (tmp_path / "config").mkdir()
+    shutil.copy(grafana_report.PROJECT_ROOT / "config" / "unified_config_example.json",
+                tmp_path / "config" / "unified_config.json")
+
+    import_ms, wall_ms, heavy, returncode = grafana_report.measure_startup(cwd=tmp_path)
+
+    assert returncode == 0
+    assert not heavy, f"무거운 모듈이 import 됨: {sorted(set(heavy))}"
+    assert import_ms <= grafana_report.STARTUP_BUDGET_MS, f"import 시간 {import_ms:.1f} ms"
+    assert wall_ms <= grafana_report.STARTUP_WALL_BUDGET_MS, f"실행 시간 {wall_ms:.1f} ms"
+
+
+def test_parse_importtime():
+    stderr = "\n".join([
+        "import time: self [us] | cumulative | imported package",
+        "import time:       100 |        300 | enhanced_config_validator",
+        "import time:       200 |        200 |   json",
+        "import time:        50 |       1500 | PIL.Image",
+    ])
+    import_ms, heavy = grafana_report.parse_importtime(stderr)
+    assert import_ms == 1.8
+    assert heavy == ["PIL.Image"]
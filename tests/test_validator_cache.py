@@ -0,0 +1,77 @@
+# tests/test_validator_cache.py - 검증 결과 캐시 (cache/validation.json)
+import json
+
+import pytest
+
+from conftest import update_config
+from enhanced_config_validator import UnifiedConfigValidator, VALIDATION_CACHE_PATH
+
+
+def validate(use_cache=True):
+    validator = UnifiedConfigValidator()
+    assert validator.validate_all(use_cache=use_cache)
+    return validator
+
+
+def without_metadata_key(workspace, key):
+    path = workspace / "config" / "unified_config.json"
+    config = json.loads(path.read_text(encoding="utf-8"))
+    del config["_metadata"][key]
+    path.write_text(json.dumps(config, ensure_ascii=False), encoding="utf-8")
+
+
+def fail_if_revalidated(monkeypatch):
+    def revalidated(self):
+        pytest.fail("캐시가 있는데 다시 검증함")
+    monkeypatch.setattr(UnifiedConfigValidator, "_validate_schema", revalidated)
+
+
+def test_cache_hit_skips_validation_and_repeats_warnings(workspace, monkeypatch, capsys):
+    without_metadata_key(workspace, "created")
+    first = validate()
+    assert [w.error_type for w in first.warnings] == ["MISSING_METADATA_KEY"]
+    capsys.readouterr()
+
+    fail_if_revalidated(monkeypatch)
+    second = validate()
+
+    output = capsys.readouterr().out
+    assert "이전 검증 결과를 사용합니다" in output
+    assert "MISSING_METADATA_KEY" in output
+    assert [(w.error_type, w.message) for w in second.warnings] == [(w.error_type, w.message) for w in first.warnings]
+
+
+def test_volatile_keys_do_not_invalidate_cache(workspace, monkeypatch):
+    validate()
+    update_config(workspace, "last_download", timestamp="20250602_000000")
+    update_config(workspace, "_metadata", last_updated="2025-06-02")
+
+    fail_if_revalidated(monkeypatch)
+    assert validate().config["last_download"]["timestamp"] == "20250602_000000"
+
+
+def test_config_change_invalidates_cache(workspace, capsys):
+    validate()
+    update_config(workspace, "output_settings", layout="paged")
+    capsys.readouterr()
+
+    validate()
+    assert "검증 시작" in capsys.readouterr().out
+
+
+def test_failed_validation_is_not_cached(workspace):
+    update_config(workspace, "output_settings", layout="nope")
+    assert not UnifiedConfigValidator().validate_all(use_cache=True)
+    assert not (workspace / VALIDATION_CACHE_PATH).exists()
+
+
+def test_cache_without_warning_list_is_revalidated(workspace, capsys):
+    validate()
+    cache = workspace / VALIDATION_CACHE_PATH
+    cached = json.loads(cache.read_text(encoding="utf-8"))
+    cache.write_text(json.dumps(dict(cached, warnings=1)), encoding="utf-8")
+    capsys.readouterr()
+
+    validate()
+    assert "검증 시작" in capsys.readouterr().out
+    assert isinstance(json.loads(cache.read_text(encoding="utf-8"))["warnings"], list)
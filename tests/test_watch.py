@@ -0,0 +1,78 @@
+# tests/test_watch.py - watch 모드 (폴더 변경 감지, 영향받는 그룹만 재생성)
+import json
+
+import pytest
+
+from conftest import load_generator
+from report_watch import FolderWatcher
+
+
+def test_watcher_reports_changes_after_debounce(tmp_path):
+    (tmp_path / "keep.txt").write_text("a")
+    (tmp_path / "gone.txt").write_text("b")
+    watcher = FolderWatcher(lambda: [(tmp_path, True)], interval=0.01, debounce=0.05)
+
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "new.txt").write_text("c")
+    (tmp_path / "gone.txt").unlink()
+
+    assert watcher.wait_for_changes() == {tmp_path / "sub", tmp_path / "sub" / "new.txt", tmp_path / "gone.txt"}
+
+
+@pytest.fixture
+def watch_run(workspace, monkeypatch):
+    """감시기를 정해진 변경 목록으로 바꿔 watch 모드 실행 → 변경 묶음마다 다시 생성한 그룹 목록"""
+    generator = load_generator()
+    regenerated = []
+    write_group_report = generator.write_group_report
+
+    def record(builder, group_name, *args, **kwargs):
+        regenerated[-1].append(group_name)
+        return write_group_report(builder, group_name, *args, **kwargs)
+
+    def run(*change_sets):
+        batches = list(change_sets)
+
+        class ScriptedWatcher:
+            def __init__(self, roots, interval, debounce):
+                pass
+
+            def wait_for_changes(self):
+                if not batches:
+                    raise KeyboardInterrupt
+                changed = batches.pop(0)
+                if callable(changed):
+                    changed = changed()
+                regenerated.append([])
+                return changed
+
+        monkeypatch.setattr(generator, "FolderWatcher", ScriptedWatcher)
+        monkeypatch.setattr(generator, "write_group_report", record)
+        regenerated.append([])
+        assert generator.run_watch_mode(interval=0, debounce=0)
+        return regenerated
+
+    return run
+
+
+def test_image_change_regenerates_groups_with_that_dashboard(workspace, watch_run):
+    server_folder = workspace / "images" / "20250601_000000" / "Production-Server"
+    images_folder = server_folder.parent.relative_to(workspace)
+    changed = {images_folder / "Production-Server" / "Web-Server" / "CPU_Usage_1.png"}
+
+    initial, after_change = watch_run(changed)
+    assert sorted(initial) == ["메일시스템", "웹서비스", "전체시스템"]
+    assert sorted(after_change) == ["웹서비스", "전체시스템"]
+
+
+def test_config_change_regenerates_only_affected_groups(workspace, watch_run):
+    config_path = workspace / "config" / "unified_config.json"
+
+    def edit_mail_server():
+        config = json.loads(config_path.read_text(encoding="utf-8"))
+        config["servers"]["Mail-Server"]["availability"] = "99.5%"
+        config_path.write_text(json.dumps(config, ensure_ascii=False), encoding="utf-8")
+        return {config_path.relative_to(workspace)}
+
+    _, after_change = watch_run(edit_mail_server)
+    assert sorted(after_change) == ["메일시스템", "전체시스템"]
@@ -0,0 +1,137 @@
+# tools/encode_benchmark.py - 리포트 이미지 base64 인코딩 메모리 사용량 측정
+"""기존 방식(문자열 base64 후 템플릿 치환)과 스트리밍 방식(report_stream.py)의 메모리 사용량을 비교합니다.
+
+사용법:
+    python tools/encode_benchmark.py                                   # 최신 images 폴더의 PNG
+    python tools/encode_benchmark.py images/20250601_000000 --repeat 20   # 이미지 목록을 20번 반복 (큰 리포트 모사)
+
+- 이미지별 최대 추가 할당량 (tracemalloc, 파일 크기 대비 배수)
+- 리포트 전체를 만들어 저장할 때의 최대 RSS (방식별로 별도 프로세스에서 측정, Windows는 측정 생략)
+두 방식이 저장한 파일이 같은지도 확인합니다.
+"""
+import argparse
+import base64
+import json
+import subprocess
+import sys
+import tempfile
+import tracemalloc
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from report_images import file_hash  # noqa: E402
+from report_stream import image_marker, write_report_html  # noqa: E402
+
+CARD_TEMPLATE = '<div class="chart-card"><img src="data:image/png;base64,{{CHART_IMAGE}}" class="chart-image"></div>'
+
+
+def build_before(image_path):
+    """기존 방식: bytes → base64 bytes → str → 템플릿 치환"""
+    with open(image_path, "rb") as img_file:
+        encoded = base64.b64encode(img_file.read()).decode()
+    return CARD_TEMPLATE.replace("{{CHART_IMAGE}}", encoded)
+
+
+def build_after(image_path):
+    """스트리밍 방식: 템플릿에는 이미지 표시만 (데이터는 저장 시 기록)"""
+    return CARD_TEMPLATE.replace("{{CHART_IMAGE}}", image_marker(image_path))
+
+
+def write_before(path, html):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(html)
+
+
+VARIANTS = {
+    'before': (build_before, write_before),
+    'after': (build_after, write_report_html),
+}
+
+
+def peak_rss_kb():
+    """현재 프로세스의 최대 RSS (KB, 측정 불가 시 None)"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def run_child(variant, image_paths, out_path):
+    """한 방식으로 이미지별 할당량과 리포트 전체 저장 시 최대 RSS 측정 → 결과 dict"""
+    build, write = VARIANTS[variant]
+
+    ratios = []
+    with tempfile.TemporaryDirectory() as temp_dir:
+        card_path = Path(temp_dir) / "card.html"
+        for image_path in image_paths:
+            tracemalloc.start()
+            write(card_path, build(image_path))
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            ratios.append(peak / max(1, Path(image_path).stat().st_size))
+
+    baseline_kb = peak_rss_kb()
+    html = ""
+    for image_path in image_paths:
+        html += build(image_path)
+    write(out_path, html)
+    peak_kb = peak_rss_kb()
+    return {'ratios': ratios, 'baseline_kb': baseline_kb, 'peak_kb': peak_kb, 'sha256': file_hash(out_path)}
+
+
+def find_images(folder):
+    """폴더(기본: 최신 images/<시각> 폴더)의 PNG 목록"""
+    if folder:
+        root = Path(folder)
+    else:
+        folders = sorted(p for p in (PROJECT_ROOT / "images").glob("*") if p.is_dir())
+        root = folders[-1] if folders else None
+    return sorted(root.rglob("*.png")) if root else []
+
+
+def main():
+    parser = argparse.ArgumentParser(description="리포트 이미지 인코딩 메모리 벤치마크")
+    parser.add_argument("folder", nargs="?", help="PNG 폴더 (기본: 최신 images 폴더)")
+    parser.add_argument("--repeat", type=int, default=1, help="이미지 목록 반복 횟수 (기본 1)")
+    parser.add_argument("--child", choices=sorted(VARIANTS), help=argparse.SUPPRESS)
+    parser.add_argument("--out", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    image_paths = [str(p) for p in find_images(args.folder)] * max(1, args.repeat)
+    if args.child:
+        print(json.dumps(run_child(args.child, image_paths, args.out)))
+        return True
+
+    if not image_paths:
+        print("❌ PNG 파일을 찾을 수 없습니다.")
+        return False
+    total_mb = sum(Path(p).stat().st_size for p in image_paths) / (1024 * 1024)
+    print(f"🖼️  이미지 {len(image_paths)}개 ({total_mb:.1f} MB)")
+
+    results = {}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for variant in VARIANTS:
+            cmd = [sys.executable, __file__, "--child", variant, "--out", str(Path(temp_dir) / f"{variant}.html"),
+                   "--repeat", str(args.repeat)] + ([args.folder] if args.folder else [])
+            completed = subprocess.run(cmd, capture_output=True, text=True, check=True)
+            results[variant] = json.loads(completed.stdout)
+
+    for variant, result in results.items():
+        ratios = result['ratios']
+        rss_text = "-"
+        if result['peak_kb'] is not None:
+            rss_text = f"{result['peak_kb'] / 1024:.1f} MB (시작 후 +{(result['peak_kb'] - result['baseline_kb']) / 1024:.1f} MB)"
+        print(f"  {variant:6s}: 이미지별 최대 할당 평균 {sum(ratios) / len(ratios):.2f}x / 최대 {max(ratios):.2f}x (파일 크기 대비), "
+              f"리포트 저장 최대 RSS {rss_text}")
+
+    same = results['before']['sha256'] == results['after']['sha256']
+    print("✅ 두 방식의 결과 파일이 같습니다" if same else "❌ 두 방식의 결과 파일이 다릅니다")
+    return same
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,295 @@
+# tools/grafana_stub.py - 로컬 그라파나 API 스텁 서버
+"""실제 그라파나 없이 시계열 조회(fetch-series)와 패널 다운로드(run)를 확인하기 위한 로컬 스텁 서버
+
+사용법:
+    python tools/grafana_stub.py                       # http://127.0.0.1:3999/
+    python tools/grafana_stub.py --dashboards Mail-Server Web-Server --step 60
+    python tools/grafana_stub.py --render-delay 0.5    # 패널 렌더링마다 0.5초 지연 (렌더러 모사)
+    python tools/grafana_stub.py --render-delay 0.3 --panel-delay 4=3  # 4번 패널만 3초 (느린 패널 모사)
+    python tools/grafana_stub.py --page-padding 16 --page-top 40        # 대시보드 페이지 여백/헤더 모사
+    python grafana_report.py fetch-series --url 127.0.0.1:3999
+    python grafana_report.py run --url 127.0.0.1:3999
+
+- /api/org, /api/search, /api/dashboards/uid/<uid>, /api/datasources, /api/ds/query 응답
+- /render/d-solo/<uid>?panelId=N&width=W&height=H 는 패널별 합성 PNG (표준 라이브러리로 생성)
+- /render/d/<uid>?width=W&height=H 는 패널을 gridPos 위치(2열 배치)에 그린 대시보드 합성 PNG
+  (run --render dashboard 확인용, 격자 계산은 report_download.py와 같은 그라파나 규칙)
+- 대시보드마다 CPU/메모리/디스크/네트워크 timeseries 패널과 stat 패널 1개 (stat은 조회 대상 아님)
+- /api/ds/query는 요청 기간을 --step 초 간격 합성 시계열로 응답 (maxDataPoints 무시 → 다운샘플링 확인용)
+- 서버 통계 기본 쿼리(up/node_cpu/node_memory)에도 응답 (grafana_report.py stats 확인용)
+- 같은 대시보드/패널/기간이면 항상 같은 값 (결정적)
+Authorization: Bearer 헤더가 없으면 401을 반환합니다.
+"""
+import argparse
+import json
+import math
+import sys
+import time
+import struct
+import zlib
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlsplit
+
+DATASOURCE = {"uid": "stub-prometheus", "type": "prometheus", "name": "Prometheus", "isDefault": True}
+
+# (패널 제목, 단위, 타깃 목록[(refId, legendFormat, 기준값, 변동폭)])
+PANELS = [
+    ("CPU Usage", "percent", [("A", "user", 35.0, 20.0), ("B", "system", 10.0, 5.0)]),
+    ("Memory Usage", "percent", [("A", "used", 60.0, 10.0)]),
+    ("Disk I/O", "Bps", [("A", "read", 2.0e6, 1.5e6), ("B", "write", 4.0e6, 3.0e6)]),
+    ("Network Traffic", "bps", [("A", "rx", 5.0e7, 4.0e7), ("B", "tx", 2.0e7, 1.5e7)]),
+]
+
+# 그라파나 대시보드 격자 (24열, 행 높이 30px, 패널 간격 8px)
+GRID_COLUMNS, GRID_CELL_HEIGHT, GRID_MARGIN = 24, 30, 8
+PANEL_GRID_W, PANEL_GRID_H = 12, 8
+
+# legendFormat 이름 → (기준값, 변동폭)
+SERIES_PROFILES = {legend: (base, amplitude) for _, _, targets in PANELS for _, legend, base, amplitude in targets}
+
+
+def dashboard_uid(title):
+    return f"stub-{zlib.crc32(title.encode('utf-8')):08x}"
+
+
+def build_dashboard(title):
+    """스텁 대시보드 JSON (row 안의 패널 포함)"""
+    panels = []
+    for index, (panel_title, unit, targets) in enumerate(PANELS, start=1):
+        panels.append({
+            "id": index,
+            "type": "timeseries",
+            "title": panel_title,
+            "gridPos": {"x": (index - 1) % 2 * PANEL_GRID_W, "y": (index - 1) // 2 * PANEL_GRID_H,
+                        "w": PANEL_GRID_W, "h": PANEL_GRID_H},
+            "datasource": {"uid": "${ds}", "type": "prometheus"},
+            "fieldConfig": {"defaults": {"unit": unit}},
+            "targets": [{"refId": ref_id, "expr": f'stub_metric{{job="$job",panel="{index}",series="{legend}"}}',
+                         "legendFormat": "{{series}}"} for ref_id, legend, _, _ in targets]
+        })
+    # 접힌 row 안의 패널과 시계열이 아닌 패널
+    rows_y = (len(PANELS) + 1) // 2 * PANEL_GRID_H
+    panels.append({"id": 90, "type": "row", "title": "Details", "collapsed": True,
+                   "gridPos": {"x": 0, "y": rows_y, "w": 24, "h": 1}, "panels": [
+        {"id": 91, "type": "stat", "title": "Uptime", "targets": [{"refId": "A", "expr": "up"}]}
+    ]})
+    return {
+        "uid": dashboard_uid(title),
+        "title": title,
+        "panels": panels,
+        "templating": {"list": [
+            {"name": "ds", "type": "datasource", "current": {"value": DATASOURCE["uid"]}},
+            {"name": "job", "type": "query", "current": {"value": title}}
+        ]}
+    }
+
+
+def synthetic_values(key, base, amplitude, times):
+    """일간 주기 + 결정적 잡음 + 가끔 튀는 값, 일부 구간은 null (수집 누락)"""
+    seed = zlib.crc32(key.encode('utf-8'))
+    values = []
+    for i, t in enumerate(times):
+        hours = t / 3600000
+        noise = ((seed * 1103515245 + i * 12345) % 1000) / 1000 - 0.5
+        value = base + amplitude * (0.6 * math.sin(2 * math.pi * hours / 24) + 0.4 * noise)
+        if (i + seed) % 997 == 0:
+            value = base + amplitude * 2.5  # 순간 피크
+        values.append(None if (i // 240) % 60 == 59 else round(max(0.0, value), 3))
+    return values
+
+
+def png_chunk(kind, data):
+    return struct.pack('>I', len(data)) + kind + data + struct.pack('>I', zlib.crc32(kind + data) & 0xffffffff)
+
+
+def encode_png(rows, width, height):
+    """RGB 행 목록 → PNG bytes"""
+    raw = b''.join(b'\x00' + bytes(row) for row in rows)
+    return (b'\x89PNG\r\n\x1a\n'
+            + png_chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 2, 0, 0, 0))
+            + png_chunk(b'IDAT', zlib.compress(raw, 6))
+            + png_chunk(b'IEND', b''))
+
+
+def synthetic_panel_rows(key, width, height):
+    """어두운 배경에 결정적 곡선 하나를 그린 RGB 행 목록"""
+    seed = zlib.crc32(key.encode('utf-8'))
+    color = bytes(((seed >> shift) & 0x7f) + 0x80 for shift in (0, 8, 16))
+    background = bytes((24, 27, 31))
+    rows = [bytearray(background * width) for _ in range(height)]
+    for x in range(width):
+        y = int(height / 2 + height / 4 * math.sin(2 * math.pi * (x / width) * (1 + seed % 5) + seed % 7))
+        for dy in (0, 1):
+            row = rows[min(height - 1, max(0, y + dy))]
+            row[3 * x:3 * x + 3] = color
+    return rows
+
+
+def synthetic_panel_png(key, width, height):
+    """패널 하나의 합성 PNG (Pillow 없이 생성)"""
+    return encode_png(synthetic_panel_rows(key, width, height), width, height)
+
+
+def synthetic_dashboard_png(uid, title, width, height):
+    """대시보드 합성 PNG - 최상위 패널을 gridPos 위치에 그리고 나머지는 배경색"""
+    rows = [bytearray(bytes((17, 18, 23)) * width) for _ in range(height)]
+    padding, page_top = GrafanaStubHandler.page_padding, GrafanaStubHandler.page_top
+    column = (width - 2 * padding - GRID_MARGIN * (GRID_COLUMNS - 1)) / GRID_COLUMNS
+    for panel in build_dashboard(title)['panels']:
+        grid = panel['gridPos']
+        if panel['type'] == 'row':
+            continue
+        left = padding + round(grid['x'] * (column + GRID_MARGIN))
+        top = page_top + grid['y'] * (GRID_CELL_HEIGHT + GRID_MARGIN)
+        panel_width = min(width - left, round(grid['w'] * column + (grid['w'] - 1) * GRID_MARGIN))
+        panel_height = min(height - top, grid['h'] * GRID_CELL_HEIGHT + (grid['h'] - 1) * GRID_MARGIN)
+        if panel_width <= 0 or panel_height <= 0:
+            continue
+        panel_rows = synthetic_panel_rows(f"/render/d-solo/{uid}:{panel['id']}", panel_width, panel_height)
+        for offset, panel_row in enumerate(panel_rows):
+            rows[top + offset][3 * left:3 * (left + panel_width)] = panel_row
+    return encode_png(rows, width, height)
+
+
+class GrafanaStubHandler(BaseHTTPRequestHandler):
+    dashboards = ["Mail-Server", "Web-Server", "DB-Server"]
+    step_ms = 60000
+    render_delay = 0.0
+    panel_delays = {}
+    page_padding = 0
+    page_top = 0
+    quiet = False
+
+    def log_message(self, format, *args):
+        if not self.quiet:
+            sys.stderr.write(f"{self.address_string()} - {format % args}\n")
+
+    def send_json(self, payload, status=HTTPStatus.OK):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_png(self, body):
+        self.send_response(HTTPStatus.OK)
+        self.send_header('Content-Type', 'image/png')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def authorized(self):
+        if self.headers.get('Authorization', '').startswith('Bearer '):
+            return True
+        self.send_json({"message": "Unauthorized"}, HTTPStatus.UNAUTHORIZED)
+        return False
+
+    def do_GET(self):
+        if not self.authorized():
+            return
+        url = urlsplit(self.path)
+        path = unquote(url.path)
+        if path.startswith('/render/d-solo/'):
+            query = {key: values[0] for key, values in parse_qs(url.query).items()}
+            time.sleep(self.panel_delays.get(query.get('panelId'), self.render_delay))
+            width, height = int(query.get('width', 1200)), int(query.get('height', 800))
+            return self.send_png(synthetic_panel_png(f"{path}:{query.get('panelId')}", width, height))
+        if path.startswith('/render/d/'):
+            query = {key: values[0] for key, values in parse_qs(url.query).items()}
+            uid = path.rsplit('/', 1)[-1]
+            title = next((title for title in self.dashboards if dashboard_uid(title) == uid), None)
+            if title is None:
+                return self.send_json({"message": "Dashboard not found"}, HTTPStatus.NOT_FOUND)
+            time.sleep(max([self.render_delay] + list(self.panel_delays.values())))
+            width, height = int(query.get('width', 1920)), int(query.get('height', 1080))
+            return self.send_png(synthetic_dashboard_png(uid, title, width, height))
+        if path == '/api/org':
+            return self.send_json({"id": 1, "name": "Stub Org"})
+        if path == '/api/search':
+            return self.send_json([{"uid": dashboard_uid(title), "title": title, "type": "dash-db"}
+                                   for title in self.dashboards])
+        if path == '/api/datasources':
+            return self.send_json([DATASOURCE])
+        if path.startswith('/api/dashboards/uid/'):
+            uid = path.rsplit('/', 1)[-1]
+            for title in self.dashboards:
+                if dashboard_uid(title) == uid:
+                    return self.send_json({"dashboard": build_dashboard(title), "meta": {}})
+        self.send_json({"message": "Not found"}, HTTPStatus.NOT_FOUND)
+
+    def do_POST(self):
+        if not self.authorized():
+            return
+        if urlsplit(self.path).path != '/api/ds/query':
+            return self.send_json({"message": "Not found"}, HTTPStatus.NOT_FOUND)
+
+        request = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))) or b'{}')
+        time_from, time_to = int(request['from']), int(request['to'])
+        times = list(range(time_from - time_from % self.step_ms + self.step_ms, time_to, self.step_ms))
+
+        results = {}
+        for query in request.get('queries', []):
+            if query.get('datasource', {}).get('uid') != DATASOURCE['uid']:
+                results[query['refId']] = {"error": "datasource not found", "frames": []}
+                continue
+            expr = query.get('expr', '')
+            series = expr.split('series="')[1].split('"')[0] if 'series="' in expr else query['refId']
+            base, amplitude = SERIES_PROFILES.get(series, (50.0, 20.0))
+            # 서버 통계(stats) 기본 쿼리: up / node_cpu / node_memory
+            if expr.startswith('max(up'):
+                values = [None if v is None else (0 if v > base + amplitude * 1.5 else 1)
+                          for v in synthetic_values(expr, base, amplitude, times)]
+            else:
+                if 'node_cpu' in expr:
+                    base, amplitude = SERIES_PROFILES['user']
+                elif 'node_memory' in expr:
+                    base, amplitude = SERIES_PROFILES['used']
+                values = synthetic_values(expr, base, amplitude, times)
+            results[query['refId']] = {"frames": [{
+                "schema": {"name": query['refId'], "fields": [
+                    {"name": "Time", "type": "time"},
+                    {"name": "Value", "type": "number", "labels": {"series": series}}
+                ]},
+                "data": {"values": [times, values]}
+            }]}
+        self.send_json({"results": results})
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로컬 그라파나 API 스텁 서버")
+    parser.add_argument("--bind", default="127.0.0.1", help="바인드 주소 (기본 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=3999, help="포트 (기본 3999)")
+    parser.add_argument("--dashboards", nargs="+", default=GrafanaStubHandler.dashboards,
+                        help="제공할 대시보드 이름 (기본: Mail-Server Web-Server DB-Server)")
+    parser.add_argument("--step", type=int, default=60, help="합성 시계열 간격(초, 기본 60)")
+    parser.add_argument("--render-delay", type=float, default=0.0, help="패널 렌더링 응답 지연(초, 기본 0)")
+    parser.add_argument("--panel-delay", action="append", default=[], metavar="ID=SECONDS",
+                        help="지정한 패널 ID의 렌더링 지연 (여러 번 지정 가능, 대시보드 렌더링은 가장 긴 지연)")
+    parser.add_argument("--page-padding", type=int, default=0, help="대시보드 페이지 좌우/아래 여백(px, 기본 0)")
+    parser.add_argument("--page-top", type=int, default=0, help="대시보드 격자 위 헤더/여백 높이(px, 기본 0)")
+    parser.add_argument("--quiet", action="store_true", help="요청 로그 생략")
+    args = parser.parse_args()
+
+    GrafanaStubHandler.dashboards = args.dashboards
+    GrafanaStubHandler.step_ms = args.step * 1000
+    GrafanaStubHandler.render_delay = args.render_delay
+    GrafanaStubHandler.panel_delays = {panel_id: float(seconds) for panel_id, seconds in
+                                       (value.split('=', 1) for value in args.panel_delay)}
+    GrafanaStubHandler.page_padding = args.page_padding
+    GrafanaStubHandler.page_top = args.page_top
+    GrafanaStubHandler.quiet = args.quiet
+    server = ThreadingHTTPServer((args.bind, args.port), GrafanaStubHandler)
+    print(f"그라파나 스텁 서버: http://{args.bind}:{args.port}/ (대시보드 {len(args.dashboards)}개)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return True
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,137 @@
+# tools/render_benchmark.py - 리포트 브라우저 렌더링 성능 측정
+"""생성된 리포트로 최적화 전/후 벤치마크 페이지를 만들고 헤드리스 브라우저로 측정합니다.
+
+사용법:
+    python tools/render_benchmark.py output/전체시스템_2025_05_xxx.html
+    python tools/render_benchmark.py output/리포트.html --browser "C:\\Program Files (x86)\\Microsoft\\Edge\\Application\\msedge.exe"
+
+- before: loading="lazy" / decoding="async" 제거, content-visibility 비활성화
+- after : 생성된 리포트 그대로
+모든 파일은 로컬에서만 열리며 외부 네트워크를 사용하지 않습니다.
+브라우저를 찾지 못하면 페이지만 생성하며, 브라우저에서 직접 열면 화면 우측 상단에 측정값이 표시됩니다.
+"""
+import argparse
+import json
+import re
+import shutil
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+BROWSER_CANDIDATES = [
+    "chrome", "google-chrome", "chromium", "chromium-browser", "msedge",
+    r"C:\Program Files\Google\Chrome\Application\chrome.exe",
+    r"C:\Program Files (x86)\Microsoft\Edge\Application\msedge.exe",
+]
+
+# first-contentful-paint / load 시간을 body의 data-bench 속성과 화면에 기록
+PROBE_SCRIPT = """<script>
+(function () {
+    var result = {variant: "%s", fcp: null, load: null};
+    try {
+        new PerformanceObserver(function (list) {
+            list.getEntries().forEach(function (e) {
+                if (e.name === "first-contentful-paint") { result.fcp = e.startTime; }
+            });
+        }).observe({type: "paint", buffered: true});
+    } catch (e) {}
+    window.addEventListener("load", function () {
+        setTimeout(function () {
+            result.load = performance.now();
+            document.body.setAttribute("data-bench", JSON.stringify(result));
+            var box = document.createElement("div");
+            box.style.cssText = "position:fixed;top:8px;right:8px;z-index:9999;background:#222;color:#fff;padding:8px 12px;font:13px monospace;border-radius:6px";
+            box.textContent = result.variant + "  FCP " + (result.fcp === null ? "-" : result.fcp.toFixed(0)) + " ms  load " + result.load.toFixed(0) + " ms";
+            document.body.appendChild(box);
+        }, 0);
+    });
+})();
+</script>"""
+
+DISABLE_OPTIMIZATIONS_STYLE = (
+    "<style>.server-section,.category-section"
+    "{content-visibility:visible!important;contain-intrinsic-size:none!important}</style>"
+)
+
+
+def make_variant(html, variant):
+    """벤치마크용 before/after 페이지 생성"""
+    if variant == "before":
+        html = html.replace(' loading="lazy"', '').replace(' decoding="async"', '')
+        html = html.replace('</head>', DISABLE_OPTIMIZATIONS_STYLE + '</head>', 1)
+    return html.replace('</head>', (PROBE_SCRIPT % variant) + '</head>', 1)
+
+
+def find_browser(explicit=None):
+    """헤드리스 실행 가능한 크롬 계열 브라우저 찾기"""
+    for candidate in ([explicit] if explicit else BROWSER_CANDIDATES):
+        path = shutil.which(candidate) or (candidate if Path(candidate).exists() else None)
+        if path:
+            return path
+    return None
+
+
+def measure(browser, page_path, timeout):
+    """헤드리스 브라우저로 페이지를 열고 측정값 반환"""
+    cmd = [
+        browser, "--headless=new", "--disable-gpu", "--no-first-run",
+        "--allow-file-access-from-files", "--dump-dom", page_path.resolve().as_uri()
+    ]
+    completed = subprocess.run(cmd, capture_output=True, timeout=timeout)
+    dom = completed.stdout.decode('utf-8', errors='replace')
+    match = re.search(r'data-bench="([^"]*)"', dom)
+    if not match:
+        return None
+    return json.loads(match.group(1).replace('&quot;', '"'))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="리포트 렌더링 성능 벤치마크 (로컬 파일 전용)")
+    parser.add_argument("report", help="측정할 리포트 HTML 파일")
+    parser.add_argument("--runs", type=int, default=5, help="variant별 측정 횟수 (기본 5)")
+    parser.add_argument("--browser", help="크롬/엣지 실행 파일 경로")
+    parser.add_argument("--out-dir", default="output/benchmark", help="벤치마크 페이지 생성 위치")
+    parser.add_argument("--timeout", type=int, default=120, help="1회 측정 제한 시간(초)")
+    args = parser.parse_args()
+
+    report_path = Path(args.report)
+    if not report_path.exists():
+        print(f"❌ 리포트 파일을 찾을 수 없습니다: {report_path}")
+        return False
+
+    html = report_path.read_text(encoding='utf-8')
+    out_dir = Path(args.out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    # 공유 스타일 모드 리포트도 같은 상대 경로로 CSS를 찾을 수 있도록 복사
+    if (report_path.parent / "assets").is_dir():
+        shutil.copytree(report_path.parent / "assets", out_dir / "assets", dirs_exist_ok=True)
+
+    pages = {}
+    for variant in ("before", "after"):
+        pages[variant] = out_dir / f"bench_{variant}.html"
+        pages[variant].write_text(make_variant(html, variant), encoding='utf-8')
+        print(f"📄 벤치마크 페이지 생성: {pages[variant]}")
+
+    browser = find_browser(args.browser)
+    if not browser:
+        print("⚠️  헤드리스 브라우저를 찾을 수 없습니다.")
+        print("   생성된 페이지를 브라우저에서 직접 열면 우측 상단에 측정값이 표시됩니다.")
+        return True
+
+    print(f"🌐 브라우저: {browser}")
+    for variant, page_path in pages.items():
+        results = [measure(browser, page_path, args.timeout) for _ in range(args.runs)]
+        results = [r for r in results if r]
+        if not results:
+            print(f"  {variant:6s}: 측정 실패")
+            continue
+        fcps = [r['fcp'] for r in results if r['fcp'] is not None]
+        loads = [r['load'] for r in results]
+        fcp_text = f"{statistics.median(fcps):8.1f} ms" if fcps else "       - "
+        print(f"  {variant:6s}: FCP(중앙값) {fcp_text}  load(중앙값) {statistics.median(loads):8.1f} ms  ({len(results)}회)")
+    return True
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)